@@ -3,6 +3,6 @@
 Содержит классы снарядов, паттернов атак и боевого UI.
 """
 
-from .bullet import Projectile, LineBullet, CircleBullet, TargetingBullet
+from .bullet import Projectile, LineBullet, CircleBullet, TargetingBullet, ProjectileGroup, PooledSprite
 from .patterns import AttackManager
 from .battle_ui import BattleUI, Button
@@ -24,6 +24,8 @@ class Button:
     Класс кнопки боевого меню.
     """
     
+    __slots__ = ('text', 'x', 'y', 'width', 'height', 'selected', 'mercy_spare', '_text_cache')
+    
     def __init__(self, text: str, x: int, y: int):
         """
         Инициализация кнопки.
@@ -40,6 +42,9 @@ class Button:
         self.height = BUTTON_HEIGHT
         self.selected = False
         self.mercy_spare = False  # Для кнопки MERCY (можно пощадить)
+        
+        # Кэш отрисованного текста: цвет -> поверхность
+        self._text_cache = {}
     
     def get_rect(self) -> pygame.Rect:
         """Получение прямоугольника кнопки."""
@@ -62,7 +67,10 @@ class Button:
             color = BUTTON_COLOR_NORMAL
         
         # Отрисовка текста (как в Undertale - просто текст)
-        text_surface = font.render(self.text, True, color)
+        text_surface = self._text_cache.get(color)
+        if text_surface is None:
+            text_surface = font.render(self.text, True, color).convert_alpha()
+            self._text_cache[color] = text_surface
         
         # Если выбрана - рисуем указатель (сердечко)
         if self.selected:
@@ -106,6 +114,8 @@ class BattleUI:
         self.submenu_active = False
         self.submenu_items = []
         self.submenu_selected = 0
+        self.submenu_surfaces = []
+        self.submenu_rect = None
         
         # Шрифт
         self.font = pygame.font.Font(None, 28)
@@ -217,6 +227,7 @@ class BattleUI:
         self.submenu_active = True
         self.submenu_items = items
         self.submenu_selected = 0
+        self._render_submenu_items()
     
     def open_item_menu(self, inventory: list) -> None:
         """
@@ -228,6 +239,29 @@ class BattleUI:
         self.submenu_active = True
         self.submenu_items = inventory.copy() if inventory else []
         self.submenu_selected = 0
+        self._render_submenu_items()
+    
+    def _render_submenu_items(self) -> None:
+        """Предварительный расчёт рамки и отрисовка текста пунктов подменю."""
+        menu_height = max(len(self.submenu_items) * 30 + 20, 50)
+        self.submenu_rect = pygame.Rect(50, 150, 250, menu_height)
+        self.submenu_surfaces = []
+        
+        # Если список пуст
+        if not self.submenu_items:
+            self.submenu_surfaces.append(self.small_font.render("- Пусто -", True, (150, 150, 150)).convert_alpha())
+            return
+        
+        for item in self.submenu_items:
+            # Текст пункта (может быть строкой или dict)
+            if isinstance(item, dict):
+                item_name = item.get('name', '???')
+                heal_value = item.get('heal_value', 0)
+                text_str = f"{item_name} (+{heal_value} HP)"
+            else:
+                text_str = str(item)
+            
+            self.submenu_surfaces.append(self.small_font.render(text_str, True, COLOR_WHITE).convert_alpha())
     
     def get_selected_item_index(self) -> int:
         """Получение индекса выбранного предмета."""
@@ -270,41 +304,28 @@ class BattleUI:
             self._draw_submenu(surface)
     
     def _draw_submenu(self, surface: pygame.Surface) -> None:
-        """Отрисовка подменю."""
-        # Фон подменю
-        menu_width = 250
-        menu_height = max(len(self.submenu_items) * 30 + 20, 50)
-        menu_x = 50
-        menu_y = 150
+        """Отрисовка подменю (рамка и текст рассчитаны при открытии)."""
+        menu_rect = self.submenu_rect
+        menu_x = menu_rect.x
+        menu_y = menu_rect.y
         
         # Рамка подменю
-        menu_rect = pygame.Rect(menu_x, menu_y, menu_width, menu_height)
         pygame.draw.rect(surface, COLOR_BLACK, menu_rect)
         pygame.draw.rect(surface, COLOR_WHITE, menu_rect, 2)
         
         # Если список пуст
         if not self.submenu_items:
-            text = self.small_font.render("- Пусто -", True, (150, 150, 150))
-            surface.blit(text, (menu_x + 20, menu_y + 15))
+            surface.blit(self.submenu_surfaces[0], (menu_x + 20, menu_y + 15))
             return
         
         # Пункты подменю
-        for i, item in enumerate(self.submenu_items):
+        for i, text in enumerate(self.submenu_surfaces):
             y = menu_y + 10 + i * 30
             
             # Указатель для выбранного пункта
             if i == self.submenu_selected:
                 pygame.draw.circle(surface, COLOR_YELLOW, (menu_x + 15, y + 10), 5)
             
-            # Текст пункта (может быть строкой или dict)
-            if isinstance(item, dict):
-                item_name = item.get('name', '???')
-                heal_value = item.get('heal_value', 0)
-                text_str = f"{item_name} (+{heal_value} HP)"
-            else:
-                text_str = str(item)
-            
-            text = self.small_font.render(text_str, True, COLOR_WHITE)
             surface.blit(text, (menu_x + 30, y))
     
     def is_submenu_active(self) -> bool:
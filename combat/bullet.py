@@ -11,13 +11,122 @@ from core.settings import (
 )
 
 
-class Projectile(pygame.sprite.Sprite):
+# Общие поверхности снарядов: (ширина, высота, цвет) -> Surface.
+# Снаряды не изменяют своё изображение, поэтому одна поверхность
+# используется всеми снарядами одного вида.
+_SURFACE_CACHE = {}
+
+
+def get_bullet_surface(width: int, height: int, color: tuple) -> pygame.Surface:
+    """
+    Получение общей залитой поверхности для снаряда.
+    
+    Аргументы:
+        width: Ширина поверхности
+        height: Высота поверхности
+        color: Цвет заливки
+        
+    Возвращает:
+        pygame.Surface: Поверхность, общая для всех снарядов с такими параметрами
+    """
+    key = (width, height, color)
+    surface = _SURFACE_CACHE.get(key)
+    if surface is None:
+        surface = pygame.Surface((width, height)).convert()
+        surface.fill(color)
+        _SURFACE_CACHE[key] = surface
+    return surface
+
+
+# Свободные экземпляры снарядов для повторного использования: класс -> список
+_FREE_SPRITES = {}
+
+# Максимальное число свободных экземпляров одного класса
+POOL_LIMIT = 256
+
+
+class PooledSprite(pygame.sprite.Sprite):
+    """
+    Спрайт с повторным использованием экземпляров.
+    Вместо создания нового объекта берёт свободный из пула (obtain)
+    и возвращает его в пул при удалении (release).
+    Подклассы реализуют reset() с теми же аргументами, что и __init__.
+    """
+    
+    __slots__ = ('in_pool',)
+    
+    # Можно ли возвращать экземпляры класса в пул
+    pooled = True
+    
+    def __init__(self, *groups):
+        super().__init__(*groups)
+        
+        # Находится ли экземпляр в списке свободных
+        self.in_pool = False
+    
+    @classmethod
+    def obtain(cls, *args, **kwargs):
+        """
+        Получение снаряда из пула или создание нового.
+        
+        Аргументы:
+            *args, **kwargs: Аргументы как у конструктора класса
+            
+        Возвращает:
+            Снаряд, готовый к добавлению в группу
+        """
+        free = _FREE_SPRITES.get(cls)
+        if free:
+            sprite = free.pop()
+            sprite.in_pool = False
+            sprite.reset(*args, **kwargs)
+            return sprite
+        return cls(*args, **kwargs)
+    
+    @classmethod
+    def prefill(cls, count: int, *args, **kwargs) -> None:
+        """
+        Заполнение пула заранее созданными экземплярами.
+        
+        Аргументы:
+            count: Желаемое количество свободных экземпляров
+            *args, **kwargs: Аргументы конструктора
+        """
+        free = _FREE_SPRITES.setdefault(cls, [])
+        while len(free) < min(count, POOL_LIMIT):
+            sprite = cls(*args, **kwargs)
+            sprite.in_pool = True
+            free.append(sprite)
+    
+    def release(self) -> None:
+        """Удаление снаряда из всех групп и возврат в пул."""
+        self.kill()
+        self.return_to_pool()
+    
+    def return_to_pool(self) -> None:
+        """
+        Возврат в пул снаряда, уже удалённого из групп.
+        Повторный возврат уже свободного снаряда игнорируется.
+        """
+        if self.pooled and not self.in_pool:
+            free = _FREE_SPRITES.setdefault(type(self), [])
+            if len(free) < POOL_LIMIT:
+                self.in_pool = True
+                free.append(self)
+
+
+class Projectile(PooledSprite):
     """
     Базовый класс снаряда.
     Использует pygame.sprite.Sprite для интеграции с pygame.sprite.Group.
     Автоматически удаляется при выходе за границы рамки боя.
     """
     
+    __slots__ = (
+        'vx', 'vy', 'bounds',
+        'bounds_left', 'bounds_top', 'bounds_right', 'bounds_bottom'
+    )
+    
     def __init__(self, x: float, y: float, vx: float, vy: float, 
                  width: int = 8, height: int = 8, color: tuple = None):
         """
@@ -34,21 +143,50 @@ class Projectile(pygame.sprite.Sprite):
         """
         super().__init__()
         
-        # Создание поверхности снаряда
-        self.image = pygame.Surface((width, height))
-        self.image.fill(color or BULLET_COLOR)
+        # Общая поверхность снаряда (не создаётся для каждого экземпляра)
+        self.image = get_bullet_surface(width, height, color or BULLET_COLOR)
         
         # Прямоугольник для позиционирования и коллизий
         self.rect = self.image.get_rect()
+        
+        # Границы для удаления (будут установлены при привязке к рамке)
+        self.bounds = None
+        
+        # Края границ отдельными числами для быстрой проверки в update
+        self.bounds_left = self.bounds_top = -math.inf
+        self.bounds_right = self.bounds_bottom = math.inf
+        
+        self._place(x, y, vx, vy)
+    
+    def _place(self, x: float, y: float, vx: float, vy: float) -> None:
+        """
+        Установка позиции и скорости снаряда.
+        
+        Аргументы:
+            x: Позиция X
+            y: Позиция Y
+            vx: Скорость по оси X
+            vy: Скорость по оси Y
+        """
         self.rect.x = x
         self.rect.y = y
         
         # Скорость снаряда
         self.vx = vx * BULLET_SPEED_MULT
         self.vy = vy * BULLET_SPEED_MULT
+    
+    def reset(self, x: float, y: float, vx: float, vy: float) -> None:
+        """
+        Повторная инициализация снаряда из пула.
+        Размер и изображение сохраняются, границы задаются заново через set_bounds.
         
-        # Границы для удаления (будут установлены при привязке к рамке)
-        self.bounds = None
+        Аргументы:
+            x: Позиция X
+            y: Позиция Y
+            vx: Скорость по оси X
+            vy: Скорость по оси Y
+        """
+        self._place(x, y, vx, vy)
     
     def set_bounds(self, box_rect: pygame.Rect) -> None:
         """
@@ -65,6 +203,10 @@ class Projectile(pygame.sprite.Sprite):
             box_rect.width + margin * 2,
             box_rect.height + margin * 2
         )
+        self.bounds_left = self.bounds.left
+        self.bounds_top = self.bounds.top
+        self.bounds_right = self.bounds.right
+        self.bounds_bottom = self.bounds.bottom
     
     def update(self) -> None:
         """
@@ -73,12 +215,14 @@ class Projectile(pygame.sprite.Sprite):
         Удаляет снаряд при выходе за границы.
         """
         # Перемещение снаряда
-        self.rect.x += self.vx
-        self.rect.y += self.vy
+        rect = self.rect
+        rect.x += self.vx
+        rect.y += self.vy
         
         # Проверка выхода за границы и удаление
-        if self.bounds and not self.bounds.contains(self.rect):
-            self.kill()
+        if (rect.left < self.bounds_left or rect.top < self.bounds_top or
+                rect.right > self.bounds_right or rect.bottom > self.bounds_bottom):
+            self.release()
     
     def get_rect(self) -> pygame.Rect:
         """
@@ -147,18 +291,90 @@ class TargetingBullet(Projectile):
             target_y: Целевая позиция Y (позиция игрока)
             speed: Скорость снаряда (по умолчанию из настроек)
         """
+        vx, vy = self._aim(x, y, target_x, target_y, speed)
+        
+        # Круглый снаряд
+        super().__init__(x, y, vx, vy, width=10, height=10)
+    
+    def reset(self, x: float, y: float, target_x: float, target_y: float, speed: float = None) -> None:
+        """Повторная инициализация снаряда из пула (аргументы как у конструктора)."""
+        vx, vy = self._aim(x, y, target_x, target_y, speed)
+        self._place(x, y, vx, vy)
+    
+    @staticmethod
+    def _aim(x: float, y: float, target_x: float, target_y: float, speed: float) -> tuple:
+        """
+        Расчёт скорости снаряда в направлении цели.
+        
+        Возвращает:
+            tuple: Скорость (vx, vy)
+        """
         # Вычисляем направление к цели
         dx = target_x - x
         dy = target_y - y
-        distance = math.sqrt(dx * dx + dy * dy)
+        distance = math.hypot(dx, dy)
         
-        # Нормализуем и применяем скорость
+        # Нормализуем и применяем скорость (одно деление на оба компонента)
         speed = speed or (BULLET_BASE_SPEED * BULLET_SPEED_MULT)
         if distance > 0:
-            vx = (dx / distance) * speed
-            vy = (dy / distance) * speed
+            scale = speed / distance
+            return dx * scale, dy * scale
+        return 0, speed
+
+
+class ProjectileGroup(pygame.sprite.Group):
+    """
+    Группа снарядов с пакетным обновлением.
+    Снаряды с базовым движением (Projectile.update) хранятся отдельно
+    и перемещаются прямо в цикле группы, без вызова метода для каждого спрайта.
+    Снаряды с собственной логикой (отскоки, волна, лезвия) обновляются как обычно.
+    """
+
+    def __init__(self, *sprites):
+        # Разделение снарядов по способу обновления (заполняется при добавлении)
+        self._basic = {}
+        self._custom = {}
+        super().__init__(*sprites)
+
+    def add_internal(self, sprite, layer=None) -> None:
+        """Добавление снаряда с распределением по способу обновления."""
+        super().add_internal(sprite, layer)
+        if type(sprite).update is Projectile.update:
+            self._basic[sprite] = None
         else:
-            vx, vy = 0, speed
-        
-        # Круглый снаряд
-        super().__init__(x, y, vx, vy, width=10, height=10)
+            self._custom[sprite] = None
+
+    def remove_internal(self, sprite) -> None:
+        """Удаление снаряда из группы и из списков обновления."""
+        super().remove_internal(sprite)
+        self._basic.pop(sprite, None)
+        self._custom.pop(sprite, None)
+
+    def release_all(self) -> None:
+        """
+        Очистка группы с возвратом всех снарядов в пулы.
+        Снаряды удаляются из группы одним проходом empty(),
+        затем возвращаются в пулы без повторного kill().
+        """
+        sprites = self.sprites()
+        self.empty()
+        for sprite in sprites:
+            sprite.return_to_pool()
+
+    def update(self, *args, **kwargs) -> None:
+        """
+        Обновление всех снарядов группы за один проход.
+        Удаляет снаряды, вышедшие за границы.
+        """
+        # Базовые снаряды: перемещение (то же, что Projectile.update)
+        for sprite in list(self._basic):
+            rect = sprite.rect
+            rect.x += sprite.vx
+            rect.y += sprite.vy
+
+            if (rect.left < sprite.bounds_left or rect.top < sprite.bounds_top or
+                    rect.right > sprite.bounds_right or rect.bottom > sprite.bounds_bottom):
+                sprite.release()
+
+        for sprite in list(self._custom):
+            sprite.update(*args, **kwargs)
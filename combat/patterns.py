@@ -28,7 +28,10 @@
 import pygame
 import math
 import random
-from combat.bullet import LineBullet, CircleBullet, TargetingBullet
+from combat.bullet import (
+    LineBullet, CircleBullet, TargetingBullet, PooledSprite, ProjectileGroup,
+    get_bullet_surface
+)
 from core.settings import (
     BULLET_BASE_SPEED, BULLET_SPEED_MULT,
     LINE_RAIN_INTERVAL, LINE_RAIN_BULLET_COUNT,
@@ -43,21 +46,29 @@ from core.settings import (
 # СПЕЦИАЛЬНЫЕ КЛАССЫ СНАРЯДОВ
 # ============================================================================
 
-class BouncingBullet(pygame.sprite.Sprite):
+class BouncingBullet(PooledSprite):
     """Крупный снаряд-квадрат, который отскакивает от стенок рамки."""
     
+    __slots__ = ('size', 'x', 'y', 'vx', 'vy', 'box_rect', 'max_bounces', 'bounce_count')
+    
     def __init__(self, x: float, y: float, vx: float, vy: float, 
                  box_rect: pygame.Rect, max_bounces: int = 4):
         super().__init__()
         
         self.size = 20
-        self.image = pygame.Surface((self.size, self.size))
-        self.image.fill(COLOR_WHITE)
+        self.image = get_bullet_surface(self.size, self.size, COLOR_WHITE)
         
         self.rect = self.image.get_rect()
+        self.reset(x, y, vx, vy, box_rect, max_bounces)
+    
+    def reset(self, x: float, y: float, vx: float, vy: float,
+              box_rect: pygame.Rect, max_bounces: int = 4):
         self.rect.x = x
         self.rect.y = y
         
+        # Позиция считается в float, в rect записывается один раз за кадр
+        self.x = float(x)
+        self.y = float(y)
         self.vx = vx
         self.vy = vy
         self.box_rect = box_rect
@@ -65,29 +76,31 @@ class BouncingBullet(pygame.sprite.Sprite):
         self.bounce_count = 0
     
     def update(self):
-        self.rect.x += self.vx
-        self.rect.y += self.vy
-        
-        if self.rect.left <= self.box_rect.left:
-            self.rect.left = self.box_rect.left
-            self.vx = abs(self.vx)
-            self.bounce_count += 1
-        elif self.rect.right >= self.box_rect.right:
-            self.rect.right = self.box_rect.right
-            self.vx = -abs(self.vx)
-            self.bounce_count += 1
-        
-        if self.rect.top <= self.box_rect.top:
-            self.rect.top = self.box_rect.top
-            self.vy = abs(self.vy)
-            self.bounce_count += 1
-        elif self.rect.bottom >= self.box_rect.bottom:
-            self.rect.bottom = self.box_rect.bottom
-            self.vy = -abs(self.vy)
-            self.bounce_count += 1
+        box = self.box_rect
+        x = self.x + self.vx
+        y = self.y + self.vy
+        
+        # Допустимый диапазон левого/верхнего края внутри рамки
+        min_x, max_x = box.left, box.right - self.size
+        min_y, max_y = box.top, box.bottom - self.size
+        hit_x = x <= min_x or x >= max_x
+        hit_y = y <= min_y or y >= max_y
+        
+        # При касании стенки: прижимаем к ней и направляем скорость от стенки
+        if hit_x:
+            x = min(max(x, min_x), max_x)
+            self.vx = math.copysign(self.vx, min_x + max_x - 2 * x)
+        if hit_y:
+            y = min(max(y, min_y), max_y)
+            self.vy = math.copysign(self.vy, min_y + max_y - 2 * y)
+        self.bounce_count += hit_x + hit_y
+        
+        self.x = x
+        self.y = y
+        self.rect.topleft = (int(x), int(y))
         
         if self.bounce_count >= self.max_bounces:
-            self.kill()
+            self.release()
 
 
 class SpiralBullet(CircleBullet):
@@ -95,18 +108,123 @@ class SpiralBullet(CircleBullet):
     pass
 
 
-class WaveBullet(pygame.sprite.Sprite):
+# Общие поверхности снарядов нестандартной формы (создаются при первом использовании)
+_SHAPE_CACHE = {}
+
+
+def _get_circle_surface(radius: int, color: tuple) -> pygame.Surface:
+    """Получение общей поверхности круглого снаряда."""
+    key = ('circle', radius, color)
+    surface = _SHAPE_CACHE.get(key)
+    if surface is None:
+        surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        pygame.draw.circle(surface, color, (radius, radius), radius)
+        surface = surface.convert_alpha()
+        _SHAPE_CACHE[key] = surface
+    return surface
+
+
+def _get_blade_surface(size: int, color: tuple) -> pygame.Surface:
+    """Получение общей поверхности лезвия-ромба."""
+    key = ('blade', size, color)
+    surface = _SHAPE_CACHE.get(key)
+    if surface is None:
+        surface = pygame.Surface((size, size), pygame.SRCALPHA)
+        points = [
+            (size // 2, 0),
+            (size, size // 2),
+            (size // 2, size),
+            (0, size // 2)
+        ]
+        pygame.draw.polygon(surface, color, points)
+        surface = surface.convert_alpha()
+        _SHAPE_CACHE[key] = surface
+    return surface
+
+
+def _get_stipple_surface(length: int, is_horizontal: bool) -> pygame.Surface:
+    """Получение общей пунктирной линии предупреждения лазера."""
+    key = ('stipple', length, is_horizontal)
+    surface = _SHAPE_CACHE.get(key)
+    if surface is None:
+        if is_horizontal:
+            surface = pygame.Surface((length, 2), pygame.SRCALPHA)
+            for offset in range(0, length, 10):
+                surface.fill(COLOR_YELLOW, (offset, 0, 6, 2))
+        else:
+            surface = pygame.Surface((2, length), pygame.SRCALPHA)
+            for offset in range(0, length, 10):
+                surface.fill(COLOR_YELLOW, (0, offset, 2, 6))
+        surface = surface.convert_alpha()
+        _SHAPE_CACHE[key] = surface
+    return surface
+
+
+# Таблица синусов/косинусов для углов спирали (полный круг на TRIG_TABLE_SIZE шагов)
+TRIG_TABLE_SIZE = 1024
+_TRIG_STEPS_PER_RADIAN = TRIG_TABLE_SIZE / (2 * math.pi)
+_COS_TABLE = [math.cos(2 * math.pi * i / TRIG_TABLE_SIZE) for i in range(TRIG_TABLE_SIZE)]
+_SIN_TABLE = [math.sin(2 * math.pi * i / TRIG_TABLE_SIZE) for i in range(TRIG_TABLE_SIZE)]
+
+# Направления снарядов кругового взрыва: количество -> [(cos, sin), ...]
+_BURST_DIRECTIONS = {}
+
+
+def _get_burst_directions(count: int) -> list:
+    """Получение единичных направлений для равномерного круга из count снарядов."""
+    directions = _BURST_DIRECTIONS.get(count)
+    if directions is None:
+        # Шаг поворота считается один раз, направления получаются поворотом предыдущего
+        step_cos = math.cos(2 * math.pi / count)
+        step_sin = math.sin(2 * math.pi / count)
+        cos_a, sin_a = 1.0, 0.0
+        directions = []
+        for _ in range(count):
+            directions.append((cos_a, sin_a))
+            cos_a, sin_a = cos_a * step_cos - sin_a * step_sin, cos_a * step_sin + sin_a * step_cos
+        _BURST_DIRECTIONS[count] = directions
+    return directions
+
+
+# Сдвиг для позиций в фиксированной точке (8 дробных бит)
+_FIXED_SHIFT = 8
+
+
+# Общие таблицы смещений волны: (frequency, amplitude) -> смещение по Y для каждого кадра.
+# Синус для кадра считается один раз и используется всеми волновыми снарядами.
+# Смещения хранятся целыми (округление вниз), чтобы позиция оставалась целой.
+_WAVE_OFFSETS = {}
+
+
+def _get_wave_offsets(frequency: float, amplitude: float) -> list:
+    """Получение общей таблицы смещений для параметров волны."""
+    key = (frequency, amplitude)
+    offsets = _WAVE_OFFSETS.get(key)
+    if offsets is None:
+        offsets = _WAVE_OFFSETS[key] = [0]
+    return offsets
+
+
+class WaveBullet(PooledSprite):
     """Снаряд, движущийся по синусоидальной траектории."""
     
+    __slots__ = (
+        'radius', 'x', 'y', 'start_y', 'speed_x', 'amplitude', 'frequency',
+        'box_rect', 'time', 'offsets', 'x_fp', 'speed_x_fp'
+    )
+    
     def __init__(self, x: float, y: float, speed_x: float, amplitude: float, 
                  frequency: float, box_rect: pygame.Rect):
         super().__init__()
         
         self.radius = 6
-        self.image = pygame.Surface((self.radius * 2, self.radius * 2), pygame.SRCALPHA)
-        pygame.draw.circle(self.image, COLOR_WHITE, (self.radius, self.radius), self.radius)
+        self.image = _get_circle_surface(self.radius, COLOR_WHITE)
         
         self.rect = self.image.get_rect()
+        self.reset(x, y, speed_x, amplitude, frequency, box_rect)
+    
+    def reset(self, x: float, y: float, speed_x: float, amplitude: float,
+              frequency: float, box_rect: pygame.Rect):
         self.rect.center = (x, y)
         
         self.x = x
@@ -117,35 +235,47 @@ class WaveBullet(pygame.sprite.Sprite):
         self.frequency = frequency
         self.box_rect = box_rect
         self.time = 0
+        self.offsets = _get_wave_offsets(frequency, amplitude)
+        
+        # Позиция по X в фиксированной точке (без float и int() в update)
+        self.x_fp = int(x * (1 << _FIXED_SHIFT))
+        self.speed_x_fp = int(speed_x * (1 << _FIXED_SHIFT))
     
     def update(self):
         self.time += 1
-        self.x += self.speed_x
-        self.y = self.start_y + math.sin(self.time * self.frequency) * self.amplitude
-        self.rect.center = (int(self.x), int(self.y))
+        self.x_fp += self.speed_x_fp
+        self.x = self.x_fp >> _FIXED_SHIFT
+        
+        # Таблица дополняется первым снарядом, дошедшим до нового кадра
+        offsets = self.offsets
+        if self.time == len(offsets):
+            offsets.append(math.floor(math.sin(self.time * self.frequency) * self.amplitude))
+        self.y = self.start_y + offsets[self.time]
+        self.rect.center = (self.x, self.y)
         
         if (self.rect.right < self.box_rect.left - 20 or 
             self.rect.left > self.box_rect.right + 20):
-            self.kill()
+            self.release()
 
 
-class HomingBlade(pygame.sprite.Sprite):
+class HomingBlade(PooledSprite):
     """Крупное лезвие, которое замирает, нацеливается на игрока и резко летит."""
     
+    __slots__ = (
+        'size', 'x', 'y', 'box_rect', 'state', 'timer', 'aim_duration',
+        'charge_duration', 'target_x', 'target_y', 'vx', 'vy', 'speed',
+        'x_fp', 'y_fp', 'vx_fp', 'vy_fp'
+    )
+    
     def __init__(self, x: float, y: float, box_rect: pygame.Rect):
         super().__init__()
         
         self.size = 30
-        self.image = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
-        points = [
-            (self.size // 2, 0),
-            (self.size, self.size // 2),
-            (self.size // 2, self.size),
-            (0, self.size // 2)
-        ]
-        pygame.draw.polygon(self.image, COLOR_YELLOW, points)
-        
-        self.rect = self.image.get_rect()
+        self.rect = pygame.Rect(0, 0, self.size, self.size)
+        self.reset(x, y, box_rect)
+    
+    def reset(self, x: float, y: float, box_rect: pygame.Rect):
+        self.image = _get_blade_surface(self.size, COLOR_YELLOW)
         self.rect.center = (x, y)
         
         self.x = x
@@ -170,50 +300,44 @@ class HomingBlade(pygame.sprite.Sprite):
     def update(self):
         if self.state == 'aiming':
             self.timer += 1
-            scale = 1.0 + 0.1 * math.sin(self.timer * 0.3)
-            self.image = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
-            points = [
-                (self.size // 2, 0),
-                (self.size, self.size // 2),
-                (self.size // 2, self.size),
-                (0, self.size // 2)
-            ]
-            pygame.draw.polygon(self.image, COLOR_YELLOW, points)
             
             if self.timer >= self.aim_duration:
                 self.state = 'charging'
                 self.timer = 0
+                # Смена цвета только при переходе состояния
+                self.image = _get_blade_surface(self.size, COLOR_RED)
                 dx = self.target_x - self.x
                 dy = self.target_y - self.y
-                dist = math.sqrt(dx * dx + dy * dy)
+                dist = math.hypot(dx, dy)
                 if dist > 0:
-                    self.vx = (dx / dist) * self.speed
-                    self.vy = (dy / dist) * self.speed
+                    scale = self.speed / dist
+                    self.vx = dx * scale
+                    self.vy = dy * scale
+                
+                # Полёт считается в фиксированной точке
+                self.x_fp = int(self.x * (1 << _FIXED_SHIFT))
+                self.y_fp = int(self.y * (1 << _FIXED_SHIFT))
+                self.vx_fp = int(self.vx * (1 << _FIXED_SHIFT))
+                self.vy_fp = int(self.vy * (1 << _FIXED_SHIFT))
         
         elif self.state == 'charging':
             self.timer += 1
-            self.image = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
-            points = [
-                (self.size // 2, 0),
-                (self.size, self.size // 2),
-                (self.size // 2, self.size),
-                (0, self.size // 2)
-            ]
-            pygame.draw.polygon(self.image, COLOR_RED, points)
             
             if self.timer >= self.charge_duration:
                 self.state = 'flying'
         
         elif self.state == 'flying':
-            self.x += self.vx
-            self.y += self.vy
-            self.rect.center = (int(self.x), int(self.y))
+            self.x_fp += self.vx_fp
+            self.y_fp += self.vy_fp
+            self.x = self.x_fp >> _FIXED_SHIFT
+            self.y = self.y_fp >> _FIXED_SHIFT
+            self.rect.center = (self.x, self.y)
             
             if (self.x < self.box_rect.left - 50 or 
                 self.x > self.box_rect.right + 50 or
                 self.y < self.box_rect.top - 50 or 
                 self.y > self.box_rect.bottom + 50):
-                self.kill()
+                self.release()
 
 
 class ExpandingRingBullet(CircleBullet):
@@ -224,6 +348,11 @@ class ExpandingRingBullet(CircleBullet):
 class GravityWell:
     """Гравитационная аномалия (чёрная дыра). Притягивает или отталкивает игрока."""
     
+    __slots__ = (
+        'x', 'y', 'strength', 'repel', 'duration', 'timer', 'active', 'radius',
+        'force_scale'
+    )
+    
     def __init__(self, x: float, y: float, strength: float = 0.5, 
                  repel: bool = False, duration: int = 180):
         self.x = x
@@ -234,6 +363,9 @@ class GravityWell:
         self.timer = 0
         self.active = True
         self.radius = 40
+        
+        # Множитель силы со знаком (отрицательный при отталкивании)
+        self.force_scale = -strength * 100 if repel else strength * 100
     
     def update(self):
         self.timer += 1
@@ -246,20 +378,15 @@ class GravityWell:
         
         dx = self.x - player_x
         dy = self.y - player_y
-        dist = math.sqrt(dx * dx + dy * dy)
+        dist = math.hypot(dx, dy)
         
         if dist < 10:
             dist = 10
         
-        force_magnitude = self.strength * (100 / dist)
-        
-        if self.repel:
-            force_magnitude = -force_magnitude
+        # Сила (strength * 100 / dist) и нормализация (/ dist) одним делением
+        k = self.force_scale / (dist * dist)
         
-        force_x = (dx / dist) * force_magnitude
-        force_y = (dy / dist) * force_magnitude
-        
-        return (force_x, force_y)
+        return (dx * k, dy * k)
     
     def draw(self, surface: pygame.Surface):
         if not self.active:
@@ -288,6 +415,11 @@ class RotatingCrossBullet(CircleBullet):
 class LaserBeam:
     """Лазерный луч с предупреждением."""
     
+    __slots__ = (
+        'box_rect', 'is_horizontal', 'pos', 'state', 'timer', 'warning_duration',
+        'active_duration', 'warning_width', 'beam_width', 'stipple', 'beam_rect'
+    )
+    
     def __init__(self, box_rect: pygame.Rect, is_horizontal: bool = None):
         self.box_rect = box_rect
         self.is_horizontal = random.choice([True, False]) if is_horizontal is None else is_horizontal
@@ -304,6 +436,24 @@ class LaserBeam:
         
         self.warning_width = 2
         self.beam_width = 30
+        
+        # Пунктир предупреждения и прямоугольник луча не меняются за время жизни лазера
+        if self.is_horizontal:
+            self.stipple = _get_stipple_surface(box_rect.width, True)
+            self.beam_rect = pygame.Rect(
+                box_rect.left,
+                self.pos - self.beam_width // 2,
+                box_rect.width,
+                self.beam_width
+            )
+        else:
+            self.stipple = _get_stipple_surface(box_rect.height, False)
+            self.beam_rect = pygame.Rect(
+                self.pos - self.beam_width // 2,
+                box_rect.top,
+                self.beam_width,
+                box_rect.height
+            )
     
     def update(self):
         self.timer += 1
@@ -316,22 +466,14 @@ class LaserBeam:
     
     def draw(self, surface: pygame.Surface):
         if self.state == 'warning':
+            # Пунктир отрисован заранее и выводится одним blit
             if self.is_horizontal:
-                for x in range(self.box_rect.left, self.box_rect.right, 10):
-                    pygame.draw.rect(surface, COLOR_YELLOW, (x, self.pos - 1, 6, 2))
+                surface.blit(self.stipple, (self.box_rect.left, self.pos - 1))
             else:
-                for y in range(self.box_rect.top, self.box_rect.bottom, 10):
-                    pygame.draw.rect(surface, COLOR_YELLOW, (self.pos - 1, y, 2, 6))
+                surface.blit(self.stipple, (self.pos - 1, self.box_rect.top))
         
         elif self.state == 'active':
-            if self.is_horizontal:
-                pygame.draw.rect(surface, COLOR_RED,
-                               (self.box_rect.left, self.pos - self.beam_width // 2,
-                                self.box_rect.width, self.beam_width))
-            else:
-                pygame.draw.rect(surface, COLOR_RED,
-                               (self.pos - self.beam_width // 2, self.box_rect.top,
-                                self.beam_width, self.box_rect.height))
+            surface.fill(COLOR_RED, self.beam_rect)
     
     def is_done(self):
         return self.state == 'done'
@@ -340,58 +482,55 @@ class LaserBeam:
         if self.state != 'active':
             return False
         
-        if self.is_horizontal:
-            beam_rect = pygame.Rect(
-                self.box_rect.left, 
-                self.pos - self.beam_width // 2,
-                self.box_rect.width, 
-                self.beam_width
-            )
-        else:
-            beam_rect = pygame.Rect(
-                self.pos - self.beam_width // 2,
-                self.box_rect.top,
-                self.beam_width,
-                self.box_rect.height
-            )
-        
-        return beam_rect.colliderect(player_rect)
+        return self.beam_rect.colliderect(player_rect)
 
 
 # ============================================================================
 # МЕНЕДЖЕР АТАК
 # ============================================================================
 
+def _exclude_each(patterns: tuple) -> dict:
+    """Построение словаря: паттерн -> кортеж всех остальных паттернов."""
+    return {p: tuple(q for q in patterns if q != p) for p in patterns}
+
+
 class AttackManager:
     """
     Менеджер атак с системой очередей.
     Управляет генерацией снарядов по различным паттернам.
     """
     
-    # Базовые типы паттернов (простые)
-    BASIC_PATTERNS = [
+    # Базовые типы паттернов (простые). Кортежи - константы класса не изменяются
+    BASIC_PATTERNS = (
         'line_rain', 
         'circle_burst', 
         'targeting',
         'bouncing_walls',
         'spiral',
-        'laser_warning'
-    ]
+        'laser_warning',
+    )
     
     # Сложные паттерны
-    COMPLEX_PATTERNS = [
+    COMPLEX_PATTERNS = (
         'snake_wave',
         'homing_blades',
         'expanding_ring',
         'gravity_wells',
-        'rotating_cross'
-    ]
+        'rotating_cross',
+    )
     
     # Все доступные паттерны
     PATTERN_TYPES = BASIC_PATTERNS + COMPLEX_PATTERNS
     
-    def __init__(self, box_rect: pygame.Rect, bullets_group: pygame.sprite.Group):
-        self.box_rect = box_rect
+    # Простой паттерн -> остальные простые паттерны (кандидаты во второй паттерн)
+    OTHER_BASIC_PATTERNS = _exclude_each(BASIC_PATTERNS)
+    
+    # Стороны рамки и скорости вдоль стенки для "Bouncing Walls"
+    WALL_SIDES = ('top', 'bottom', 'left', 'right')
+    BOUNCE_SPEEDS = (-3, 3)
+    
+    def __init__(self, box_rect: pygame.Rect, bullets_group: ProjectileGroup):
+        self.update_box_rect(box_rect)
         self.bullets_group = bullets_group
         
         # Система очередей
@@ -406,12 +545,13 @@ class AttackManager:
         self.current_pattern = None
         self.secondary_pattern = None
         
-        # Настройки сложности
-        self.difficulty = 1.0
+        # Настройки сложности (вместе с зависящими от неё интервалами)
+        self.set_difficulty(1.0)
         
         # Таймеры для паттернов
         self.pattern_internal_timer = 0
-        self.pattern_internal_timer_2 = 0
+        # Таймеры простых паттернов по слотам: 0 - основной, 1 - второй паттерн
+        self.basic_timers = [0, 0]
         
         # Для лазерного паттерна
         self.lasers = []
@@ -420,27 +560,87 @@ class AttackManager:
         # Для гравитационного режима
         self.gravity_mode = False
         self.gravity_wells = []
+        self.well_params = []
         
         # Для вращающегося креста
         self.cross_bullets = []
-        self.cross_angle = 0
+        self.cross_cos = 1.0
+        self.cross_sin = 0.0
         self.cross_center = (0, 0)
         
         # Для расширяющихся колец
         self.ring_timer = 0
+        self.ring_bullets = []
         
         # Для самонаводящихся лезвий
         self.homing_blades = []
         
+        # Таблицы обработчиков паттернов: название -> функция (player_x, player_y)
+        self._primary_dispatch = {
+            'line_rain': lambda px, py: self._pattern_line_rain(0),
+            'circle_burst': lambda px, py: self._pattern_circle_burst(0),
+            'targeting': lambda px, py: self._pattern_targeting(px, py, 0),
+            'bouncing_walls': lambda px, py: self._pattern_bouncing_walls(0),
+            'spiral': lambda px, py: self._pattern_spiral(),
+            'laser_warning': lambda px, py: self._pattern_laser_warning(),
+            'snake_wave': lambda px, py: self._pattern_snake_wave(),
+            'homing_blades': self._pattern_homing_blades,
+            'expanding_ring': lambda px, py: self._pattern_expanding_ring(),
+            'gravity_wells': self._pattern_gravity_wells,
+            'rotating_cross': self._pattern_rotating_cross,
+        }
+        self._secondary_dispatch = {
+            'line_rain': lambda px, py: self._pattern_line_rain(1),
+            'circle_burst': lambda px, py: self._pattern_circle_burst(1),
+            'targeting': lambda px, py: self._pattern_targeting(px, py, 1),
+            'bouncing_walls': lambda px, py: self._pattern_bouncing_walls(1),
+        }
+        
+        # Пулы снарядов
+        self._prefill_pools()
+        
         # Инициализация первого раунда
         self._start_new_round()
     
+    def update_box_rect(self, box_rect: pygame.Rect):
+        """
+        Установка рамки боя и кэширование её границ числами.
+        Паттерны читают границы из атрибутов, а не из pygame.Rect.
+        
+        Аргументы:
+            box_rect: Прямоугольник рамки боя
+        """
+        self.box_rect = box_rect
+        self.box_left = box_rect.left
+        self.box_right = box_rect.right
+        self.box_top = box_rect.top
+        self.box_bottom = box_rect.bottom
+        self.box_centerx = box_rect.centerx
+        self.box_centery = box_rect.centery
+        self.box_width = box_rect.width
+        self.box_height = box_rect.height
+        
+        # Углы рамки для паттерна "Targeting" (меняются только вместе с рамкой)
+        self.box_corners = (
+            (self.box_left, self.box_top),
+            (self.box_right, self.box_top),
+            (self.box_left, self.box_bottom),
+            (self.box_right, self.box_bottom),
+        )
+        self.targeting_shots = min(TARGETING_BULLETS_PER_SHOT, len(self.box_corners))
+    
+    def _prefill_pools(self):
+        """Заполнение пулов снарядов для самых массовых паттернов."""
+        CircleBullet.prefill(CIRCLE_BURST_COUNT * 2, 0, 0, 0, 0)
+        ExpandingRingBullet.prefill(16, 0, 0, 0, 0)
+        RotatingCrossBullet.prefill(32, 0, 0, 0, 0)
+    
+    
     def _start_new_round(self):
         """Начало нового раунда атаки."""
-        all_patterns = self.PATTERN_TYPES.copy()
         self.attack_queue = random.sample(
-            all_patterns, 
-            min(PATTERNS_PER_ROUND, len(all_patterns))
+            self.PATTERN_TYPES, 
+            min(PATTERNS_PER_ROUND, len(self.PATTERN_TYPES))
         )
         
         while len(self.attack_queue) < PATTERNS_PER_ROUND:
@@ -450,27 +650,38 @@ class AttackManager:
         self.current_pattern = self.attack_queue[0]
         
         # Для простых паттернов добавляем второй паттерн (комбинирование)
-        if self.current_pattern in self.BASIC_PATTERNS:
-            other_basic = [p for p in self.BASIC_PATTERNS if p != self.current_pattern]
-            self.secondary_pattern = random.choice(other_basic) if random.random() < 0.3 else None
-        else:
-            self.secondary_pattern = None
+        self._choose_secondary_pattern()
         
+        self._reset_runtime_state()
+        self.round_active = True
+    
+    def _reset_runtime_state(self):
+        """Сброс таймеров и объектов паттернов (общая часть начала раунда и сброса)."""
         self.pattern_timer = 0
         self.gap_timer = 0
         self.in_gap = False
-        self.round_active = True
         self.pattern_internal_timer = 0
-        self.pattern_internal_timer_2 = 0
+        self.basic_timers = [0, 0]
         self.lasers = []
         self.laser_spawn_timer = 0
         self.gravity_mode = False
         self.gravity_wells = []
+        self.well_params = []
         self.cross_bullets = []
-        self.cross_angle = 0
+        self.ring_bullets = []
+        self.cross_cos = 1.0
+        self.cross_sin = 0.0
         self.ring_timer = 0
         self.homing_blades = []
     
+    def _choose_secondary_pattern(self):
+        """Случайный выбор второго простого паттерна для комбинирования."""
+        other_basic = self.OTHER_BASIC_PATTERNS.get(self.current_pattern)
+        if other_basic:
+            self.secondary_pattern = random.choice(other_basic) if random.random() < 0.3 else None
+        else:
+            self.secondary_pattern = None
+    
     def update(self, player_x: float, player_y: float) -> bool:
         """Обновление менеджера атак."""
         if not self.round_active:
@@ -490,60 +701,27 @@ class AttackManager:
             self._end_current_pattern()
             return True
         
-        self._execute_current_pattern(player_x, player_y)
+        # Текущий паттерн и второй (простой) паттерн, если он выбран
+        handler = self._primary_dispatch.get(self.current_pattern)
+        if handler:
+            handler(player_x, player_y)
         
         if self.secondary_pattern:
-            self._execute_secondary_pattern(player_x, player_y)
+            handler = self._secondary_dispatch.get(self.secondary_pattern)
+            if handler:
+                handler(player_x, player_y)
         
         return True
     
-    def _execute_current_pattern(self, player_x: float, player_y: float):
-        """Выполнение логики текущего паттерна."""
-        pattern = self.current_pattern
-        
-        if pattern == 'line_rain':
-            self._pattern_line_rain()
-        elif pattern == 'circle_burst':
-            self._pattern_circle_burst()
-        elif pattern == 'targeting':
-            self._pattern_targeting(player_x, player_y)
-        elif pattern == 'bouncing_walls':
-            self._pattern_bouncing_walls()
-        elif pattern == 'spiral':
-            self._pattern_spiral()
-        elif pattern == 'laser_warning':
-            self._pattern_laser_warning()
-        elif pattern == 'snake_wave':
-            self._pattern_snake_wave()
-        elif pattern == 'homing_blades':
-            self._pattern_homing_blades(player_x, player_y)
-        elif pattern == 'expanding_ring':
-            self._pattern_expanding_ring()
-        elif pattern == 'gravity_wells':
-            self._pattern_gravity_wells(player_x, player_y)
-        elif pattern == 'rotating_cross':
-            self._pattern_rotating_cross(player_x, player_y)
-    
-    def _execute_secondary_pattern(self, player_x: float, player_y: float):
-        """Выполнение второго паттерна (простого)."""
-        pattern = self.secondary_pattern
-        
-        if pattern == 'line_rain':
-            self._pattern_line_rain(secondary=True)
-        elif pattern == 'circle_burst':
-            self._pattern_circle_burst(secondary=True)
-        elif pattern == 'targeting':
-            self._pattern_targeting(player_x, player_y, secondary=True)
-        elif pattern == 'bouncing_walls':
-            self._pattern_bouncing_walls(secondary=True)
-    
     def _end_current_pattern(self):
         """Завершение текущего паттерна и переход к следующему."""
-        self.bullets_group.empty()
+        self.bullets_group.release_all()
         self.lasers = []
         self.gravity_mode = False
         self.gravity_wells = []
+        self.well_params = []
         self.cross_bullets = []
+        self.ring_bullets = []
         self.homing_blades = []
         self.in_gap = True
         self.gap_timer = 0
@@ -559,18 +737,53 @@ class AttackManager:
             self.current_pattern = self.attack_queue[self.current_pattern_index]
             self.pattern_timer = 0
             self.pattern_internal_timer = 0
-            self.pattern_internal_timer_2 = 0
+            self.basic_timers = [0, 0]
             self.laser_spawn_timer = 0
             
-            if self.current_pattern in self.BASIC_PATTERNS:
-                other_basic = [p for p in self.BASIC_PATTERNS if p != self.current_pattern]
-                self.secondary_pattern = random.choice(other_basic) if random.random() < 0.3 else None
-            else:
-                self.secondary_pattern = None
+            self._choose_secondary_pattern()
     
     def is_round_active(self) -> bool:
         return self.round_active
     
+    def is_idle(self) -> bool:
+        """Проверка, что раунд не идёт и обновлять менеджер не нужно."""
+        return not self.round_active
+    
+    def gap_remaining(self) -> int:
+        """
+        Оставшееся число шагов паузы между паттернами.
+        
+        Возвращает:
+            int: Количество шагов (0, если паузы нет)
+        """
+        if self.in_gap and self.round_active:
+            return GAP_BETWEEN_ATTACKS - self.gap_timer
+        return 0
+    
+    def advance_gap(self, ticks: int) -> int:
+        """
+        Пропуск нескольких шагов паузы между паттернами за один вызов.
+        В паузе снарядов нет, поэтому шаги паузы не требуют покадровой логики.
+        
+        Аргументы:
+            ticks: Доступное количество шагов
+            
+        Возвращает:
+            int: Количество использованных шагов
+        """
+        used = min(ticks, self.gap_remaining())
+        if used:
+            self.gap_timer += used
+            if self.gap_timer >= GAP_BETWEEN_ATTACKS:
+                self.in_gap = False
+                self.gap_timer = 0
+                self._next_pattern()
+        return used
+    
+    def is_drawable(self) -> bool:
+        """Проверка, есть ли что рисовать (в паузе между паттернами всё очищено)."""
+        return not self.in_gap
+    
     def start_round(self):
         self._start_new_round()
     
@@ -581,141 +794,103 @@ class AttackManager:
     # БАЗОВЫЕ ПАТТЕРНЫ АТАК
     # ========================================================================
     
-    def _pattern_line_rain(self, secondary: bool = False):
+    def _pattern_line_rain(self, slot: int = 0):
         """Паттерн "Line Rain" - дождь из линий сверху вниз."""
-        if secondary:
-            self.pattern_internal_timer_2 += 1
-            timer = self.pattern_internal_timer_2
-        else:
-            self.pattern_internal_timer += 1
-            timer = self.pattern_internal_timer
-        
-        interval = int(LINE_RAIN_INTERVAL / self.difficulty)
+        timer = self.basic_timers[slot] + 1
         
-        if timer >= interval:
-            for _ in range(LINE_RAIN_BULLET_COUNT):
-                x = random.randint(self.box_rect.left + 20, self.box_rect.right - 60)
-                y = self.box_rect.top - 20
-                speed = BULLET_BASE_SPEED * self.difficulty
-                bullet = LineBullet(x, y, 0, speed)
+        if timer >= self.line_rain_interval:
+            # Позиции всех линий залпа выбираются одним вызовом
+            xs = random.choices(
+                range(self.box_left + 20, self.box_right - 59),
+                k=LINE_RAIN_BULLET_COUNT
+            )
+            y = self.box_top - 20
+            speed = self.difficulty_speed
+            bullets = []
+            for x in xs:
+                bullet = LineBullet.obtain(x, y, 0, speed)
                 bullet.set_bounds(self.box_rect)
-                self.bullets_group.add(bullet)
+                bullets.append(bullet)
+            self.bullets_group.add(*bullets)
             timer = 0
         
-        if secondary:
-            self.pattern_internal_timer_2 = timer
-        else:
-            self.pattern_internal_timer = timer
+        self.basic_timers[slot] = timer
     
-    def _pattern_circle_burst(self, secondary: bool = False):
+    def _pattern_circle_burst(self, slot: int = 0):
         """Паттерн "Circle Burst" - круговой взрыв из центра."""
-        if secondary:
-            self.pattern_internal_timer_2 += 1
-            timer = self.pattern_internal_timer_2
-        else:
-            self.pattern_internal_timer += 1
-            timer = self.pattern_internal_timer
-        
-        interval = int(CIRCLE_BURST_INTERVAL / self.difficulty)
+        timer = self.basic_timers[slot] + 1
         
-        if timer >= interval:
-            center_x = self.box_rect.centerx
-            center_y = self.box_rect.centery
+        if timer >= self.circle_burst_interval:
+            center_x = self.box_centerx
+            center_y = self.box_centery
             
-            count = int(CIRCLE_BURST_COUNT * self.difficulty)
-            for i in range(count):
-                angle = (2 * math.pi * i) / count
-                speed = BULLET_BASE_SPEED * 1.5
-                vx = math.cos(angle) * speed
-                vy = math.sin(angle) * speed
+            speed = BULLET_BASE_SPEED * 1.5
+            # Снаряды залпа добавляются в группу одним вызовом
+            bullets = []
+            for cos_a, sin_a in _get_burst_directions(self.burst_count):
+                vx = cos_a * speed
+                vy = sin_a * speed
                 
-                bullet = CircleBullet(center_x, center_y, vx, vy)
+                bullet = CircleBullet.obtain(center_x, center_y, vx, vy)
                 bullet.set_bounds(self.box_rect)
-                self.bullets_group.add(bullet)
+                bullets.append(bullet)
+            self.bullets_group.add(*bullets)
             timer = 0
         
-        if secondary:
-            self.pattern_internal_timer_2 = timer
-        else:
-            self.pattern_internal_timer = timer
+        self.basic_timers[slot] = timer
     
-    def _pattern_targeting(self, player_x: float, player_y: float, secondary: bool = False):
+    def _pattern_targeting(self, player_x: float, player_y: float, slot: int = 0):
         """Паттерн "Targeting" - снаряды летят к игроку."""
-        if secondary:
-            self.pattern_internal_timer_2 += 1
-            timer = self.pattern_internal_timer_2
-        else:
-            self.pattern_internal_timer += 1
-            timer = self.pattern_internal_timer
-        
-        interval = int(TARGETING_INTERVAL / self.difficulty)
-        
-        if timer >= interval:
-            corners = [
-                (self.box_rect.left, self.box_rect.top),
-                (self.box_rect.right, self.box_rect.top),
-                (self.box_rect.left, self.box_rect.bottom),
-                (self.box_rect.right, self.box_rect.bottom),
-            ]
-            
-            shot_corners = random.sample(corners, min(TARGETING_BULLETS_PER_SHOT, len(corners)))
+        timer = self.basic_timers[slot] + 1
+        
+        if timer >= self.targeting_interval:
+            shot_corners = random.sample(self.box_corners, self.targeting_shots)
             
+            speed = self.difficulty_speed
+            bullets = []
             for corner_x, corner_y in shot_corners:
-                speed = BULLET_BASE_SPEED * self.difficulty
-                bullet = TargetingBullet(corner_x, corner_y, player_x, player_y, speed)
+                bullet = TargetingBullet.obtain(corner_x, corner_y, player_x, player_y, speed)
                 bullet.set_bounds(self.box_rect)
-                self.bullets_group.add(bullet)
+                bullets.append(bullet)
+            self.bullets_group.add(*bullets)
             timer = 0
         
-        if secondary:
-            self.pattern_internal_timer_2 = timer
-        else:
-            self.pattern_internal_timer = timer
+        self.basic_timers[slot] = timer
     
-    def _pattern_bouncing_walls(self, secondary: bool = False):
+    def _pattern_bouncing_walls(self, slot: int = 0):
         """Паттерн "Bouncing Walls" - квадраты отскакивают от стенок."""
-        if secondary:
-            self.pattern_internal_timer_2 += 1
-            timer = self.pattern_internal_timer_2
-        else:
-            self.pattern_internal_timer += 1
-            timer = self.pattern_internal_timer
-        
-        interval = int(60 / self.difficulty)
+        timer = self.basic_timers[slot] + 1
         
-        if timer >= interval:
-            side = random.choice(['top', 'bottom', 'left', 'right'])
+        if timer >= self.bouncing_walls_interval:
+            side = random.choice(self.WALL_SIDES)
             
             if side == 'top':
-                x = random.randint(self.box_rect.left + 20, self.box_rect.right - 40)
-                y = self.box_rect.top + 10
-                vx = random.choice([-3, 3])
+                x = random.randint(self.box_left + 20, self.box_right - 40)
+                y = self.box_top + 10
+                vx = random.choice(self.BOUNCE_SPEEDS)
                 vy = random.uniform(2, 4)
             elif side == 'bottom':
-                x = random.randint(self.box_rect.left + 20, self.box_rect.right - 40)
-                y = self.box_rect.bottom - 30
-                vx = random.choice([-3, 3])
+                x = random.randint(self.box_left + 20, self.box_right - 40)
+                y = self.box_bottom - 30
+                vx = random.choice(self.BOUNCE_SPEEDS)
                 vy = random.uniform(-4, -2)
             elif side == 'left':
-                x = self.box_rect.left + 10
-                y = random.randint(self.box_rect.top + 20, self.box_rect.bottom - 40)
+                x = self.box_left + 10
+                y = random.randint(self.box_top + 20, self.box_bottom - 40)
                 vx = random.uniform(2, 4)
-                vy = random.choice([-3, 3])
+                vy = random.choice(self.BOUNCE_SPEEDS)
             else:
-                x = self.box_rect.right - 30
-                y = random.randint(self.box_rect.top + 20, self.box_rect.bottom - 40)
+                x = self.box_right - 30
+                y = random.randint(self.box_top + 20, self.box_bottom - 40)
                 vx = random.uniform(-4, -2)
-                vy = random.choice([-3, 3])
+                vy = random.choice(self.BOUNCE_SPEEDS)
             
-            bullet = BouncingBullet(x, y, vx * self.difficulty, vy * self.difficulty, 
-                                   self.box_rect, max_bounces=random.randint(3, 4))
+            bullet = BouncingBullet.obtain(x, y, vx * self.difficulty, vy * self.difficulty, 
+                                          self.box_rect, max_bounces=random.randint(3, 4))
             self.bullets_group.add(bullet)
             timer = 0
         
-        if secondary:
-            self.pattern_internal_timer_2 = timer
-        else:
-            self.pattern_internal_timer = timer
+        self.basic_timers[slot] = timer
     
     def _pattern_spiral(self):
         """Паттерн "Spiral" - снаряды вылетают из центра по спирали."""
@@ -723,15 +898,16 @@ class AttackManager:
         
         if self.pattern_internal_timer >= 3:
             base_angle = (self.pattern_timer * 0.1)
+            speed = BULLET_BASE_SPEED * 1.2
             
+            # Индекс угла в таблице; второй снаряд смещён на пол-оборота (pi)
+            index = int(base_angle * _TRIG_STEPS_PER_RADIAN) % TRIG_TABLE_SIZE
             for i in range(2):
-                angle = base_angle + (i * math.pi)
-                speed = BULLET_BASE_SPEED * 1.2
-                
-                vx = math.cos(angle) * speed
-                vy = math.sin(angle) * speed
+                vx = _COS_TABLE[index] * speed
+                vy = _SIN_TABLE[index] * speed
+                index = (index + TRIG_TABLE_SIZE // 2) % TRIG_TABLE_SIZE
                 
-                bullet = SpiralBullet(self.box_rect.centerx, self.box_rect.centery, vx, vy)
+                bullet = SpiralBullet.obtain(self.box_centerx, self.box_centery, vx, vy)
                 bullet.set_bounds(self.box_rect)
                 self.bullets_group.add(bullet)
             
@@ -741,10 +917,15 @@ class AttackManager:
         """Паттерн "Laser Warning" - пунктирная линия + широкий луч."""
         self.laser_spawn_timer += 1
         
-        for laser in self.lasers[:]:
+        # Сжатие списка на месте: оставшиеся лазеры сдвигаются к началу
+        lasers = self.lasers
+        write = 0
+        for laser in lasers:
             laser.update()
-            if laser.is_done():
-                self.lasers.remove(laser)
+            if not laser.is_done():
+                lasers[write] = laser
+                write += 1
+        del lasers[write:]
         
         if self.laser_spawn_timer >= 60:
             self.laser_spawn_timer = 0
@@ -761,29 +942,38 @@ class AttackManager:
         if self.pattern_internal_timer >= 40:
             self.pattern_internal_timer = 0
             
-            y_positions = range(self.box_rect.top + 10, self.box_rect.bottom - 10, 40)
+            y_positions = range(self.box_top + 10, self.box_bottom - 10, 40)
             
-            for y in y_positions:
-                bullet = WaveBullet(
-                    self.box_rect.left - 10,
+            self.bullets_group.add(*[
+                WaveBullet.obtain(
+                    self.box_left - 10,
                     y,
                     speed_x=3 * self.difficulty,
                     amplitude=30,
                     frequency=0.1,
                     box_rect=self.box_rect
                 )
-                self.bullets_group.add(bullet)
+                for y in y_positions
+            ])
     
     def _pattern_homing_blades(self, player_x: float, player_y: float):
         """Паттерн "Homing Blades" - лезвия нацеливаются на игрока."""
         self.pattern_internal_timer += 1
         
-        for blade in self.homing_blades[:]:
+        # Сжатие списка на месте: живые лезвия сдвигаются к началу
+        blades = self.homing_blades
+        write = 0
+        for blade in blades:
+            # Лезвие могло быть уже удалено группой (вылет, попадание)
+            if not blade.alive():
+                continue
             blade.update()
             if blade.state == 'aiming':
                 blade.set_target(player_x, player_y)
-            if not blade.alive():
-                self.homing_blades.remove(blade)
+            if blade.alive():
+                blades[write] = blade
+                write += 1
+        del blades[write:]
         
         if self.pattern_internal_timer >= 90:
             self.pattern_internal_timer = 0
@@ -794,19 +984,19 @@ class AttackManager:
             
             for edge in chosen_edges:
                 if edge == 'top':
-                    x = random.randint(self.box_rect.left + 30, self.box_rect.right - 30)
-                    y = self.box_rect.top + 20
+                    x = random.randint(self.box_left + 30, self.box_right - 30)
+                    y = self.box_top + 20
                 elif edge == 'bottom':
-                    x = random.randint(self.box_rect.left + 30, self.box_rect.right - 30)
-                    y = self.box_rect.bottom - 20
+                    x = random.randint(self.box_left + 30, self.box_right - 30)
+                    y = self.box_bottom - 20
                 elif edge == 'left':
-                    x = self.box_rect.left + 20
-                    y = random.randint(self.box_rect.top + 30, self.box_rect.bottom - 30)
+                    x = self.box_left + 20
+                    y = random.randint(self.box_top + 30, self.box_bottom - 30)
                 else:
-                    x = self.box_rect.right - 20
-                    y = random.randint(self.box_rect.top + 30, self.box_rect.bottom - 30)
+                    x = self.box_right - 20
+                    y = random.randint(self.box_top + 30, self.box_bottom - 30)
                 
-                blade = HomingBlade(x, y, self.box_rect)
+                blade = HomingBlade.obtain(x, y, self.box_rect)
                 blade.set_target(player_x, player_y)
                 self.homing_blades.append(blade)
                 self.bullets_group.add(blade)
@@ -818,37 +1008,62 @@ class AttackManager:
         if self.ring_timer >= 100:
             self.ring_timer = 0
             
-            center_x = random.randint(self.box_rect.left + 50, self.box_rect.right - 50)
-            center_y = random.randint(self.box_rect.top + 50, self.box_rect.bottom - 50)
+            center_x = random.randint(self.box_left + 50, self.box_right - 50)
+            center_y = random.randint(self.box_top + 50, self.box_bottom - 50)
             
             num_bullets = 16
             gaps = random.sample(range(num_bullets), 2)
             
+            # Убираем снаряды прошлых колец, удалённые из группы (они могли вернуться в пул)
+            self.ring_bullets = [b for b in self.ring_bullets if b.alive()]
+            
+            new_bullets = []
             for i in range(num_bullets):
                 if i in gaps:
                     continue
                 
                 angle = (2 * math.pi * i) / num_bullets
-                bullet = ExpandingRingBullet(center_x, center_y, 0, 0)
+                bullet = ExpandingRingBullet.obtain(center_x, center_y, 0, 0)
                 bullet.set_bounds(self.box_rect)
                 bullet.expand_angle = angle
+                # Направление луча постоянно - тригонометрия один раз при создании
+                bullet.expand_cos = math.cos(angle)
+                bullet.expand_sin = math.sin(angle)
                 bullet.expand_speed = 2
                 bullet.expand_radius = 10
                 bullet.center_x = center_x
                 bullet.center_y = center_y
                 
-                self.bullets_group.add(bullet)
+                new_bullets.append(bullet)
+            
+            # Кольцо добавляется в группу одним вызовом
+            self.ring_bullets.extend(new_bullets)
+            self.bullets_group.add(*new_bullets)
         
-        for bullet in self.bullets_group:
-            if hasattr(bullet, 'expand_angle'):
-                bullet.expand_radius += bullet.expand_speed * self.difficulty
-                bullet.rect.center = (
-                    int(bullet.center_x + math.cos(bullet.expand_angle) * bullet.expand_radius),
-                    int(bullet.center_y + math.sin(bullet.expand_angle) * bullet.expand_radius)
-                )
-                
-                if bullet.expand_radius > max(self.box_rect.width, self.box_rect.height):
-                    bullet.kill()
+        max_radius = max(self.box_width, self.box_height)
+        
+        difficulty = self.difficulty
+        
+        # Обновляются только снаряды колец (без перебора всей группы)
+        alive_bullets = []
+        for bullet in self.ring_bullets:
+            if not bullet.alive():
+                continue
+            
+            radius = bullet.expand_radius + bullet.expand_speed * difficulty
+            
+            # Снаряд за пределами кольца удаляется без пересчёта позиции
+            if radius > max_radius:
+                bullet.release()
+                continue
+            
+            bullet.expand_radius = radius
+            bullet.rect.center = (
+                int(bullet.center_x + bullet.expand_cos * radius),
+                int(bullet.center_y + bullet.expand_sin * radius)
+            )
+            alive_bullets.append(bullet)
+        self.ring_bullets = alive_bullets
     
     def _pattern_gravity_wells(self, player_x: float, player_y: float):
         """Паттерн "Gravity Wells" - чёрная дыра притягивает/отталкивает игрока."""
@@ -856,28 +1071,32 @@ class AttackManager:
         
         if not self.gravity_wells:
             well = GravityWell(
-                self.box_rect.centerx,
-                self.box_rect.centery,
+                self.box_centerx,
+                self.box_centery,
                 strength=0.4,
                 repel=random.choice([True, False]),
                 duration=ATTACK_DURATION
             )
             self.gravity_wells.append(well)
+            self._refresh_well_params()
         
         for well in self.gravity_wells:
+            was_active = well.active
             well.update()
+            if was_active and not well.active:
+                self._refresh_well_params()
         
         self.gravity_mode = True
         
         if self.pattern_internal_timer >= 30:
             self.pattern_internal_timer = 0
             
-            corner_x = random.choice([self.box_rect.left, self.box_rect.right])
-            corner_y = random.choice([self.box_rect.top, self.box_rect.bottom])
+            corner_x = random.choice([self.box_left, self.box_right])
+            corner_y = random.choice([self.box_top, self.box_bottom])
             
             angle = math.atan2(
-                self.box_rect.centery - corner_y,
-                self.box_rect.centerx - corner_x
+                self.box_centery - corner_y,
+                self.box_centerx - corner_x
             )
             angle += random.uniform(-0.5, 0.5)
             
@@ -885,19 +1104,19 @@ class AttackManager:
             vx = math.cos(angle) * speed
             vy = math.sin(angle) * speed
             
-            bullet = CircleBullet(corner_x, corner_y, vx, vy)
+            bullet = CircleBullet.obtain(corner_x, corner_y, vx, vy)
             bullet.set_bounds(self.box_rect)
             self.bullets_group.add(bullet)
     
     def _pattern_rotating_cross(self, player_x: float, player_y: float):
         """Паттерн "Rotating Cross" - вращающийся крест из пуль."""
         if not self.cross_bullets:
-            self.cross_center = (self.box_rect.centerx, self.box_rect.centery)
+            self.cross_center = (self.box_centerx, self.box_centery)
             
             for i in range(4):
                 angle = i * math.pi / 2
                 for j in range(8):
-                    bullet = RotatingCrossBullet(
+                    bullet = RotatingCrossBullet.obtain(
                         self.cross_center[0],
                         self.cross_center[1],
                         0, 0
@@ -907,27 +1126,41 @@ class AttackManager:
                     bullet.distance = 30 + j * 25
                     bullet.base_angle = angle
                     self.cross_bullets.append(bullet)
-                    self.bullets_group.add(bullet)
-        
-        self.cross_angle += 0.02 * self.difficulty
+            
+            # Весь крест добавляется в группу одним вызовом
+            self.bullets_group.add(*self.cross_bullets)
+        
+        # Поворот направления первого луча на шаг кадра (без тригонометрии)
+        cos_a, sin_a = self.cross_cos, self.cross_sin
+        step_cos, step_sin = self.cross_step_cos, self.cross_step_sin
+        cos_a, sin_a = cos_a * step_cos - sin_a * step_sin, cos_a * step_sin + sin_a * step_cos
+        self.cross_cos, self.cross_sin = cos_a, sin_a
+        
+        # Остальные лучи повёрнуты на 90 градусов друг относительно друга
+        beam_dirs = (
+            (cos_a, sin_a),
+            (-sin_a, cos_a),
+            (-cos_a, -sin_a),
+            (sin_a, -cos_a),
+        )
         
+        center_x, center_y = self.cross_center
         for bullet in self.cross_bullets:
-            if hasattr(bullet, 'beam_index'):
-                angle = bullet.base_angle + self.cross_angle
-                bullet.rect.center = (
-                    int(self.cross_center[0] + math.cos(angle) * bullet.distance),
-                    int(self.cross_center[1] + math.sin(angle) * bullet.distance)
-                )
+            cos_a, sin_a = beam_dirs[bullet.beam_index]
+            bullet.rect.center = (
+                int(center_x + cos_a * bullet.distance),
+                int(center_y + sin_a * bullet.distance)
+            )
         
         self.pattern_internal_timer += 1
         if self.pattern_internal_timer >= 60:
             self.pattern_internal_timer = 0
             
             for _ in range(2):
-                x = random.randint(self.box_rect.left + 20, self.box_rect.right - 20)
-                y = self.box_rect.top - 10
+                x = random.randint(self.box_left + 20, self.box_right - 20)
+                y = self.box_top - 10
                 speed = BULLET_BASE_SPEED * 0.8
-                bullet = CircleBullet(x, y, 0, speed)
+                bullet = CircleBullet.obtain(x, y, 0, speed)
                 bullet.set_bounds(self.box_rect)
                 self.bullets_group.add(bullet)
     
@@ -952,13 +1185,44 @@ class AttackManager:
                 return True
         return False
     
+    def _refresh_well_params(self):
+        """Обновление таблицы параметров активных аномалий (x, y, множитель силы)."""
+        self.well_params = [
+            (well.x, well.y, well.force_scale)
+            for well in self.gravity_wells if well.active
+        ]
+    
     def get_gravity_force(self, player_x: float, player_y: float) -> tuple:
-        """Получение суммарной гравитационной силы."""
+        """
+        Получение суммарной гравитационной силы.
+        Сила всех аномалий суммируется в одном цикле по таблице параметров
+        (та же формула, что в GravityWell.apply_force).
+        """
+        params = self.well_params
+        if not params:
+            return (0, 0)
+        
+        # Обычный случай - одна аномалия, без цикла
+        if len(params) == 1:
+            well_x, well_y, force_scale = params[0]
+            dx = well_x - player_x
+            dy = well_y - player_y
+            k = force_scale / max(dx * dx + dy * dy, 100)
+            return (dx * k, dy * k)
+        
         total_fx, total_fy = 0, 0
-        for well in self.gravity_wells:
-            fx, fy = well.apply_force(player_x, player_y)
-            total_fx += fx
-            total_fy += fy
+        for well_x, well_y, force_scale in params:
+            dx = well_x - player_x
+            dy = well_y - player_y
+            dist_sq = dx * dx + dy * dy
+            
+            # Минимальное расстояние 10 (квадрат - 100)
+            if dist_sq < 100:
+                dist_sq = 100
+            
+            k = force_scale / dist_sq
+            total_fx += dx * k
+            total_fy += dy * k
         return (total_fx, total_fy)
     
     def is_gravity_mode(self) -> bool:
@@ -967,25 +1231,13 @@ class AttackManager:
     
     def reset(self):
         """Сброс менеджера атак."""
-        self.bullets_group.empty()
+        self.bullets_group.release_all()
         self.attack_queue = []
         self.current_pattern = None
         self.secondary_pattern = None
         self.current_pattern_index = 0
-        self.pattern_timer = 0
-        self.gap_timer = 0
-        self.in_gap = False
+        self._reset_runtime_state()
         self.round_active = False
-        self.pattern_internal_timer = 0
-        self.pattern_internal_timer_2 = 0
-        self.lasers = []
-        self.laser_spawn_timer = 0
-        self.gravity_mode = False
-        self.gravity_wells = []
-        self.cross_bullets = []
-        self.cross_angle = 0
-        self.ring_timer = 0
-        self.homing_blades = []
     
     def get_current_pattern_name(self) -> str:
         """Получение названия текущего паттерна."""
@@ -1011,8 +1263,24 @@ class AttackManager:
         return base_name
     
     def set_difficulty(self, difficulty: float):
-        """Установка уровня сложности."""
+        """
+        Установка уровня сложности.
+        Интервалы спавна, скорость и число снарядов пересчитываются здесь,
+        а не в каждом кадре паттерна.
+        """
         self.difficulty = max(0.5, min(difficulty, 3.0))
+        
+        self.line_rain_interval = int(LINE_RAIN_INTERVAL / self.difficulty)
+        self.circle_burst_interval = int(CIRCLE_BURST_INTERVAL / self.difficulty)
+        self.targeting_interval = int(TARGETING_INTERVAL / self.difficulty)
+        self.bouncing_walls_interval = int(60 / self.difficulty)
+        
+        self.difficulty_speed = BULLET_BASE_SPEED * self.difficulty
+        
+        # Поворот креста за кадр в виде (cos, sin)
+        self.cross_step_cos = math.cos(0.02 * self.difficulty)
+        self.cross_step_sin = math.sin(0.02 * self.difficulty)
+        self.burst_count = int(CIRCLE_BURST_COUNT * self.difficulty)
 
     def start_round_with_pattern_count(self, patterns_count: int):
         """
@@ -1022,10 +1290,9 @@ class AttackManager:
         Аргументы:
             patterns_count: Количество паттернов в раунде
         """
-        all_patterns = self.PATTERN_TYPES.copy()
-        patterns_count = max(1, min(patterns_count, len(all_patterns)))
+        patterns_count = max(1, min(patterns_count, len(self.PATTERN_TYPES)))
         
-        self.attack_queue = random.sample(all_patterns, patterns_count)
+        self.attack_queue = random.sample(self.PATTERN_TYPES, patterns_count)
         
         # Если нужно больше паттернов, добавляем случайные
         while len(self.attack_queue) < patterns_count:
@@ -1035,34 +1302,20 @@ class AttackManager:
         self.current_pattern = self.attack_queue[0]
         
         # Для простых паттернов добавляем второй паттерн (комбинирование)
-        if self.current_pattern in self.BASIC_PATTERNS:
-            other_basic = [p for p in self.BASIC_PATTERNS if p != self.current_pattern]
-            self.secondary_pattern = random.choice(other_basic) if random.random() < 0.3 else None
-        else:
-            self.secondary_pattern = None
+        self._choose_secondary_pattern()
         
-        self.pattern_timer = 0
-        self.gap_timer = 0
-        self.in_gap = False
+        self._reset_runtime_state()
         self.round_active = True
-        self.pattern_internal_timer = 0
-        self.pattern_internal_timer_2 = 0
-        self.lasers = []
-        self.laser_spawn_timer = 0
-        self.gravity_mode = False
-        self.gravity_wells = []
-        self.cross_bullets = []
-        self.cross_angle = 0
-        self.ring_timer = 0
-        self.homing_blades = []
     
     def clear_bullets(self):
         """Очистка всех снарядов (используется при переключении паттернов в фазе 2 босса)."""
-        self.bullets_group.empty()
+        self.bullets_group.release_all()
         self.lasers = []
         self.gravity_mode = False
         self.gravity_wells = []
+        self.well_params = []
         self.cross_bullets = []
+        self.ring_bullets = []
         self.homing_blades = []
     
     def set_patterns_per_round(self, count: int):
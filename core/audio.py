@@ -6,14 +6,60 @@
 
 import pygame
 import random
+import io
+import math
 import os
+import queue
+import sys
+import threading
 from core.settings import (
     MUSIC_LOCATION_1, MUSIC_LOCATION_2,
     MUSIC_FIGHT_1, MUSIC_FIGHT_2, MUSIC_BOSS, MUSIC_GAME_OVER,
-    MUSIC_FADEOUT_TIME, MUSIC_VOLUME
+    MUSIC_FADEOUT_TIME, MUSIC_VOLUME, AUDIO_FREQUENCY, AUDIO_BUFFER_SIZE
 )
 
 
+# Все известные музыкальные треки игры.
+# Пути приводятся к абсолютным один раз при импорте (не зависят от смены рабочей папки).
+_TRACK_LOCATION_1 = os.path.abspath(MUSIC_LOCATION_1)
+_TRACK_LOCATION_2 = os.path.abspath(MUSIC_LOCATION_2)
+_TRACK_FIGHT_1 = os.path.abspath(MUSIC_FIGHT_1)
+_TRACK_FIGHT_2 = os.path.abspath(MUSIC_FIGHT_2)
+_TRACK_BOSS = os.path.abspath(MUSIC_BOSS)
+_TRACK_GAME_OVER = os.path.abspath(MUSIC_GAME_OVER)
+
+_MUSIC_TRACKS = (
+    _TRACK_LOCATION_1, _TRACK_LOCATION_2,
+    _TRACK_FIGHT_1, _TRACK_FIGHT_2, _TRACK_BOSS, _TRACK_GAME_OVER
+)
+
+# Треки для боя с обычными мобами (выбираются случайно)
+_FIGHT_TRACKS = (_TRACK_FIGHT_1, _TRACK_FIGHT_2)
+
+# Боевые треки, заранее декодируемые в pygame.mixer.Sound
+_BATTLE_TRACKS = (_TRACK_FIGHT_1, _TRACK_FIGHT_2, _TRACK_BOSS)
+
+# Номер канала, зарезервированного под боевую музыку
+_BATTLE_CHANNEL_ID = 0
+
+# Состояния аудио (интернированные строки: сравнение возможно через is)
+AUDIO_STATE_OVERWORLD = sys.intern('overworld')
+AUDIO_STATE_BATTLE = sys.intern('battle')
+AUDIO_STATE_GAME_OVER = sys.intern('game_over')
+
+# Трек для состояния игры: (состояние, уточнение) -> (путь, повторы).
+# Бой с мобом в таблицу не входит: трек для него выбирается случайно.
+_STATE_TRACKS = {
+    (AUDIO_STATE_OVERWORLD, 1): (_TRACK_LOCATION_1, -1),
+    (AUDIO_STATE_OVERWORLD, 2): (_TRACK_LOCATION_2, -1),
+    (AUDIO_STATE_BATTLE, True): (_TRACK_BOSS, -1),
+    (AUDIO_STATE_GAME_OVER, None): (_TRACK_GAME_OVER, 0),
+}
+
+# Время жизни сохранённого результата get_busy() (один кадр при 60 FPS), мс
+_BUSY_CACHE_MS = 16
+
+
 class AudioManager:
     """
     Менеджер аудио для управления фоновой музыкой.
@@ -22,8 +68,20 @@ class AudioManager:
     - Музыку локаций (location1.mp3, location2.mp3)
     - Боевую музыку (fight1.mp3, fight2.mp3 для мобов, boss.mp3 для босса)
     - Музыку Game Over (game_over.mp3)
+    
+    Боевые треки заранее декодируются в pygame.mixer.Sound и играют на отдельном
+    канале: начало боя не требует загрузки, а музыка локации на время боя
+    ставится на паузу и продолжается с того же места.
     """
     
+    __slots__ = (
+        'current_track', 'current_state', 'current_location', 'is_boss_battle',
+        'volume', 'enabled', 'muted_track', 'mixer_ok', 'applied_volume', 'busy_cache',
+        'fade_state', 'pending_track', 'fade_in_state', 'music_track', 'music_dir', 'dir_ready',
+        '_exists_cache', '_preloaded', 'mixer_lock', 'command_queue', 'command_generation',
+        'worker', 'battle_sounds', 'battle_channel', 'battle_track', 'stream_paused_track'
+    )
+    
     def __init__(self):
         """Инициализация менеджера аудио."""
         self.current_track = None
@@ -32,19 +90,139 @@ class AudioManager:
         self.is_boss_battle = False
         self.volume = MUSIC_VOLUME
         self.enabled = True
+        # Трек, поставленный на паузу при выключении звука
+        self.muted_track = None
+        
+        # Доступность миксера проверяется один раз (вместо try/except в каждом вызове)
+        self.mixer_ok = pygame.mixer.get_init() is not None
+        # Последняя громкость, переданная миксеру (None - ещё не задавалась)
+        self.applied_volume = None
+        # Последний результат get_busy(): (время проверки, результат) или None
+        self.busy_cache = None
+        
+        # Плавное затухание: (время начала, длительность, начальная громкость) или None.
+        # Громкость снижается в update(), без блокирующего mixer.music.fadeout().
+        self.fade_state = None
+        # Трек, запускаемый после затухания: (путь, повторы) или None
+        self.pending_track = None
+        # Нарастание громкости нового трека: (время начала, длительность) или None
+        self.fade_in_state = None
+        # Трек, загруженный в mixer.music (играет или стоит на паузе), или None
+        self.music_track = None
+        
+        # Папка с музыкой создаётся при первом воспроизведении, а не при создании менеджера
+        self.music_dir = os.path.abspath("assets/music")
+        self.dir_ready = False
+        
+        # Наличие известных треков проверяется один раз при запуске
+        self._exists_cache = {}
+        self.invalidate_cache()
+        
+        # Содержимое треков в памяти: путь -> BytesIO (без чтения с диска при смене трека)
+        self._preloaded = {}
+        self._preload_tracks()
+        
+        # Боевая музыка: путь -> Sound, отдельный канал и играющий на нём трек
+        self.battle_sounds = {}
+        self.battle_channel = None
+        self.battle_track = None
+        # Трек локации, поставленный на паузу на время боя
+        self.stream_paused_track = None
+        self._preload_battle_sounds()
         
-        # Проверяем наличие папки с музыкой
-        self.music_dir = "assets/music"
-        self._ensure_music_directory()
+        # Загрузка и запуск треков выполняются в отдельном потоке, чтобы не задерживать кадр.
+        # Блокировка не даёт основному потоку менять музыку во время загрузки.
+        self.mixer_lock = threading.Lock()
+        self.command_queue = queue.Queue(maxsize=4)
+        # Поколение команд: растёт при каждой отмене, устаревшие команды поток пропускает
+        self.command_generation = 0
+        self.worker = threading.Thread(target=self._worker, daemon=True)
+        self.worker.start()
+    
+    @classmethod
+    def init_mixer(cls, frequency: int = AUDIO_FREQUENCY, size: int = -16,
+                   channels: int = 2, buffer: int = AUDIO_BUFFER_SIZE) -> None:
+        """
+        Инициализация аудио миксера (вызывается до создания AudioManager).
+        Большой буфер не даёт звуку прерываться, когда кадр задерживается
+        при смене состояний игры; задержка звука для фоновой музыки незаметна.
+        
+        Аргументы:
+            frequency: Частота дискретизации
+            size: Размер сэмпла в битах (отрицательное значение = signed)
+            channels: Количество каналов (2 = стерео)
+            buffer: Размер буфера в сэмплах
+        """
+        # Уже запущенный миксер (например, после pygame.init()) не меняет
+        # настройки при повторном init(), поэтому его нужно остановить
+        if pygame.mixer.get_init():
+            pygame.mixer.quit()
+        pygame.mixer.pre_init(frequency, size, channels, buffer)
+        pygame.mixer.init()
     
     def _ensure_music_directory(self) -> None:
         """Создаёт директорию для музыки, если она не существует."""
-        if not os.path.exists(self.music_dir):
-            os.makedirs(self.music_dir)
+        try:
+            os.makedirs(self.music_dir, exist_ok=True)
+        except OSError:
+            pass
     
     def _file_exists(self, filepath: str) -> bool:
-        """Проверяет существование файла."""
-        return os.path.exists(filepath)
+        """
+        Проверяет существование файла.
+        Найденные при запуске треки берутся из кэша без обращения к диску.
+        """
+        return self._exists_cache.get(filepath) or os.path.exists(filepath)
+    
+    def invalidate_cache(self) -> None:
+        """Повторная проверка наличия известных треков на диске."""
+        self._exists_cache = {path: os.path.exists(path) for path in _MUSIC_TRACKS}
+    
+    def _preload_tracks(self) -> None:
+        """Чтение всех найденных треков в память при запуске."""
+        for path in _MUSIC_TRACKS:
+            if not self._exists_cache.get(path):
+                continue
+            try:
+                with open(path, 'rb') as music_file:
+                    self._preloaded[path] = io.BytesIO(music_file.read())
+            except OSError:
+                pass
+    
+    def _preload_battle_sounds(self) -> None:
+        """Декодирование боевых треков в pygame.mixer.Sound и резервирование канала."""
+        if not self.mixer_ok:
+            return
+        
+        pygame.mixer.set_reserved(_BATTLE_CHANNEL_ID + 1)
+        self.battle_channel = pygame.mixer.Channel(_BATTLE_CHANNEL_ID)
+        
+        for path in _BATTLE_TRACKS:
+            if not self._exists_cache.get(path):
+                continue
+            try:
+                self.battle_sounds[path] = pygame.mixer.Sound(path)
+                # Сжатая копия для mixer.music этому треку больше не нужна
+                self._preloaded.pop(path, None)
+            except pygame.error:
+                # Формат не поддерживается для Sound - трек играет через mixer.music
+                pass
+    
+    def _load_track(self, filepath: str) -> None:
+        """
+        Загрузка трека в pygame.mixer.music.
+        Трек из памяти передаётся как файловый объект, остальные - по пути.
+        
+        Аргументы:
+            filepath: Путь к файлу
+        """
+        data = self._preloaded.get(filepath)
+        if data is None:
+            pygame.mixer.music.load(filepath)
+            return
+        data.seek(0)
+        # Подсказка формата по расширению (файловый объект не имеет имени)
+        pygame.mixer.music.load(data, os.path.splitext(filepath)[1].lstrip('.'))
     
     def _play_music(self, filepath: str, loops: int = -1) -> bool:
         """
@@ -58,28 +236,242 @@ class AudioManager:
             bool: True если музыка начала играть
         """
         if not self.enabled:
+            # Звук выключен - запоминаем нужный трек до включения звука
+            self.current_track = filepath
             return False
         
+        if not self.mixer_ok:
+            return False
+        
+        if not self.dir_ready:
+            self._ensure_music_directory()
+            self.dir_ready = True
+        
         if not self._file_exists(filepath):
             # Файл не найден - silently skip
             self.current_track = None
             return False
         
+        sound = self.battle_sounds.get(filepath)
+        if sound is not None:
+            return self._play_battle_sound(filepath, sound, loops)
+        
+        if self.battle_track is not None:
+            self._stop_battle_sound()
+            
+            # Возврат к музыке локации, стоявшей на паузе во время боя
+            if filepath == self.stream_paused_track:
+                self.stream_paused_track = None
+                self.current_track = filepath
+                with self.mixer_lock:
+                    pygame.mixer.music.unpause()
+                self.busy_cache = None
+                return True
+        self.stream_paused_track = None
+        
         try:
-            # Останавливаем текущую музыку с затуханием
-            if pygame.mixer.music.get_busy():
-                pygame.mixer.music.fadeout(MUSIC_FADEOUT_TIME)
+            # Этот трек уже играет - перезапуск не нужен
+            if filepath == self.current_track and self._is_busy():
+                return True
             
-            # Загружаем и воспроизводим новый трек
-            pygame.mixer.music.load(filepath)
-            pygame.mixer.music.set_volume(self.volume)
-            pygame.mixer.music.play(loops)
-            self.current_track = filepath
+            # Текущая музыка затухает, новый трек запустится после затухания
+            if self._is_busy():
+                if self.fade_state is None:
+                    self._start_fade_out(MUSIC_FADEOUT_TIME)
+                self.pending_track = (filepath, loops)
+                self.current_track = filepath
+                return True
+            
+            self._start_track(filepath, loops)
             return True
         except pygame.error:
             self.current_track = None
             return False
     
+    def _play_battle_sound(self, filepath: str, sound: pygame.mixer.Sound, loops: int) -> bool:
+        """
+        Воспроизведение заранее декодированного боевого трека на отдельном канале.
+        Текущий трек локации ставится на паузу, а не выгружается.
+        
+        Аргументы:
+            filepath: Путь к файлу трека
+            sound: Декодированный трек
+            loops: Количество повторов (-1 = бесконечно)
+            
+        Возвращает:
+            bool: True (запуск Sound не требует загрузки)
+        """
+        if filepath == self.battle_track and self.battle_channel.get_busy():
+            return True
+        
+        self.pending_track = None
+        self._drop_commands()
+        with self.mixer_lock:
+            if self.battle_track is None and self.fade_state is None and self._is_busy():
+                pygame.mixer.music.pause()
+                self.stream_paused_track = self.current_track
+            elif self.battle_track is None:
+                pygame.mixer.music.stop()
+                self.music_track = None
+                self.stream_paused_track = None
+            self.fade_state = None
+            self.fade_in_state = None
+            # Трек на паузе продолжится с полной громкостью
+            self._apply_volume(self.volume)
+        self.busy_cache = None
+        
+        self.battle_channel.set_volume(self.volume)
+        self.battle_channel.play(sound, loops=loops, fade_ms=MUSIC_FADEOUT_TIME)
+        self.battle_track = filepath
+        self.current_track = filepath
+        return True
+    
+    def _stop_battle_sound(self, fadeout: bool = True) -> None:
+        """
+        Остановка боевого трека на отдельном канале.
+        
+        Аргументы:
+            fadeout: Использовать плавное затухание
+        """
+        if self.battle_channel is not None:
+            if fadeout:
+                self.battle_channel.fadeout(MUSIC_FADEOUT_TIME)
+            else:
+                self.battle_channel.stop()
+        self.battle_track = None
+    
+    def _start_track(self, filepath: str, loops: int, fade_in: int = 0) -> None:
+        """
+        Запуск трека в фоновом потоке.
+        
+        Аргументы:
+            filepath: Путь к файлу
+            loops: Количество повторов (-1 = бесконечно)
+            fade_in: Длительность нарастания громкости в миллисекундах (0 - без нарастания)
+        """
+        self.current_track = filepath
+        self.busy_cache = None
+        self._send_command((filepath, loops, fade_in))
+    
+    def _send_command(self, command: tuple) -> None:
+        """
+        Передача команды запуска трека фоновому потоку.
+        Ещё не выполненные команды отбрасываются: важен только последний трек.
+        
+        Аргументы:
+            command: Команда (путь, повторы, нарастание)
+        """
+        self._drop_commands()
+        self.command_queue.put_nowait((self.command_generation,) + command)
+    
+    def _drop_commands(self) -> None:
+        """
+        Отмена невыполненных команд.
+        Команда, уже взятая потоком из очереди, отменяется сменой поколения.
+        """
+        self.command_generation += 1
+        try:
+            while True:
+                self.command_queue.get_nowait()
+        except queue.Empty:
+            pass
+    
+    def _worker(self) -> None:
+        """Фоновый поток: загрузка и запуск треков из очереди команд."""
+        while True:
+            generation, filepath, loops, fade_in = self.command_queue.get()
+            with self.mixer_lock:
+                # Команда отменена (остановка музыки, боевой трек, новый трек)
+                # или звук выключили: трек запустится при включении звука
+                if generation != self.command_generation or not self.enabled:
+                    continue
+                try:
+                    self._load_track(filepath)
+                    self._apply_volume(0.0 if fade_in else self.volume)
+                    pygame.mixer.music.play(loops)
+                    self.music_track = filepath
+                    self.busy_cache = None
+                    if fade_in:
+                        self.fade_in_state = (pygame.time.get_ticks(), fade_in)
+                except pygame.error:
+                    self.music_track = None
+                    if self.current_track == filepath:
+                        self.current_track = None
+    
+    def _apply_volume(self, volume: float) -> None:
+        """
+        Передача громкости миксеру, только если она изменилась.
+        
+        Аргументы:
+            volume: Громкость от 0.0 до 1.0
+        """
+        if volume != self.applied_volume:
+            pygame.mixer.music.set_volume(volume)
+            self.applied_volume = volume
+    
+    def _start_fade_out(self, duration: int) -> None:
+        """
+        Начало плавного затухания текущей музыки.
+        
+        Аргументы:
+            duration: Длительность затухания в миллисекундах
+        """
+        self.fade_in_state = None
+        self.fade_state = (pygame.time.get_ticks(), duration, pygame.mixer.music.get_volume())
+    
+    def update(self) -> None:
+        """
+        Обновление громкости при смене треков (вызывается каждый кадр).
+        Старый трек затухает по косинусу, новый нарастает по синусу
+        (равномощностная кривая: суммарная громкость не проседает).
+        По окончании затухания музыка останавливается и запускается ожидающий трек.
+        """
+        if not self.enabled or (self.fade_state is None and self.fade_in_state is None):
+            return
+        
+        if not self.mixer_ok:
+            self.fade_state = None
+            self.fade_in_state = None
+            return
+        
+        # Трек загружается в фоновом потоке - громкость обновится в следующем кадре
+        if not self.mixer_lock.acquire(blocking=False):
+            return
+        
+        now = pygame.time.get_ticks()
+        try:
+            if self.fade_state is not None:
+                start_time, duration, start_volume = self.fade_state
+                elapsed = now - start_time
+                if elapsed < duration:
+                    gain = math.cos(0.5 * math.pi * elapsed / duration)
+                    self._apply_volume(start_volume * gain)
+                    return
+                
+                self.fade_state = None
+                pygame.mixer.music.stop()
+                self.music_track = None
+                self._apply_volume(self.volume)
+                self.busy_cache = None
+                
+                pending = self.pending_track
+                self.pending_track = None
+                if pending:
+                    self._start_track(*pending, fade_in=MUSIC_FADEOUT_TIME)
+                return
+            
+            start_time, duration = self.fade_in_state
+            elapsed = now - start_time
+            if elapsed < duration:
+                gain = math.sin(0.5 * math.pi * elapsed / duration)
+                self._apply_volume(self.volume * gain)
+                return
+            
+            self.fade_in_state = None
+            self._apply_volume(self.volume)
+        finally:
+            self.mixer_lock.release()
+    
     def stop_music(self, fadeout: bool = True) -> None:
         """
         Остановка музыки.
@@ -87,29 +479,50 @@ class AudioManager:
         Аргументы:
             fadeout: Использовать плавное затухание
         """
-        try:
-            if pygame.mixer.music.get_busy():
+        self.pending_track = None
+        self._drop_commands()
+        self.current_track = None
+        if not self.mixer_ok:
+            return
+        
+        if self.battle_track is not None:
+            self._stop_battle_sound(fadeout)
+        self.stream_paused_track = None
+        
+        with self.mixer_lock:
+            if self._is_busy():
                 if fadeout:
-                    pygame.mixer.music.fadeout(MUSIC_FADEOUT_TIME)
+                    if self.fade_state is None:
+                        self._start_fade_out(MUSIC_FADEOUT_TIME)
                 else:
+                    self.fade_state = None
+                    self.fade_in_state = None
                     pygame.mixer.music.stop()
-            self.current_track = None
-        except pygame.error:
-            pass
+                    self.music_track = None
+                    self._apply_volume(self.volume)
+                    self.busy_cache = None
     
     def pause_music(self) -> None:
         """Пауза музыки."""
-        try:
+        if not self.mixer_ok:
+            return
+        if self.battle_track is not None:
+            self.battle_channel.pause()
+            return
+        with self.mixer_lock:
             pygame.mixer.music.pause()
-        except pygame.error:
-            pass
+        self.busy_cache = None
     
     def unpause_music(self) -> None:
         """Возобновление музыки."""
-        try:
+        if not self.mixer_ok:
+            return
+        if self.battle_track is not None:
+            self.battle_channel.unpause()
+            return
+        with self.mixer_lock:
             pygame.mixer.music.unpause()
-        except pygame.error:
-            pass
+        self.busy_cache = None
     
     def set_volume(self, volume: float) -> None:
         """
@@ -118,11 +531,17 @@ class AudioManager:
         Аргументы:
             volume: Громкость от 0.0 до 1.0
         """
-        self.volume = max(0.0, min(1.0, volume))
-        try:
-            pygame.mixer.music.set_volume(self.volume)
-        except pygame.error:
-            pass
+        volume = 0.0 if volume < 0.0 else 1.0 if volume > 1.0 else volume
+        if volume == self.volume:
+            return
+        self.volume = volume
+        if self.battle_channel is not None:
+            self.battle_channel.set_volume(self.volume)
+        # Во время затухания и нарастания громкость задаёт update()
+        if not self.mixer_ok or self.fade_state is not None or self.fade_in_state is not None:
+            return
+        with self.mixer_lock:
+            self._apply_volume(self.volume)
     
     def toggle_mute(self) -> bool:
         """
@@ -133,11 +552,60 @@ class AudioManager:
         """
         self.enabled = not self.enabled
         if not self.enabled:
-            self.stop_music(fadeout=False)
+            self._mute()
         elif self.current_track:
-            self._play_music(self.current_track)
+            if self.current_track == self.muted_track:
+                self.unpause_music()
+            else:
+                # Пока звук был выключен, сменилось состояние игры
+                track = self.current_track
+                self.stop_music(fadeout=False)
+                self._play_music(track)
+            self.muted_track = None
         return self.enabled
     
+    def _mute(self) -> None:
+        """
+        Пауза музыки при выключении звука и отмена начатой смены трека.
+        Ещё не запущенный трек остаётся в current_track и запустится при включении звука.
+        """
+        # Пауза сохраняет позицию трека - при включении он не загружается заново
+        self.muted_track = self.current_track
+        self.pending_track = None
+        self._drop_commands()
+        if not self.mixer_ok:
+            return
+        
+        if self.battle_track is not None:
+            self.battle_channel.pause()
+        
+        with self.mixer_lock:
+            if self.battle_track is None and self.music_track != self.current_track:
+                # Нужный трек ещё не запущен (ждал затухания старого или загрузки):
+                # старый трек не продолжится, при включении звука запустится нужный
+                pygame.mixer.music.stop()
+                self.music_track = None
+                self.muted_track = None
+            else:
+                pygame.mixer.music.pause()
+            self.fade_state = None
+            self.fade_in_state = None
+            self._apply_volume(self.volume)
+        self.busy_cache = None
+    
+    def _play_state_music(self, state: str, sub_id=None, default: tuple = None) -> None:
+        """
+        Воспроизведение трека состояния игры по таблице _STATE_TRACKS.
+        
+        Аргументы:
+            state: Состояние аудио (AUDIO_STATE_*)
+            sub_id: Уточнение состояния (номер локации, признак босса)
+            default: Трек (путь, повторы), если сочетания нет в таблице
+        """
+        self.current_state = state
+        filepath, loops = _STATE_TRACKS.get((state, sub_id), default)
+        self._play_music(filepath, loops)
+    
     # ========================================================================
     # МУЗЫКА ЛОКАЦИЙ
     # ========================================================================
@@ -149,15 +617,12 @@ class AudioManager:
         Аргументы:
             location_id: Номер локации (1 или 2)
         """
-        self.current_state = 'overworld'
         self.current_location = location_id
-        
-        if location_id == 1:
-            self._play_music(MUSIC_LOCATION_1)
-        elif location_id == 2:
-            self._play_music(MUSIC_LOCATION_2)
-        else:
-            self._play_music(MUSIC_LOCATION_1)
+        # Неизвестная локация - музыка первой локации
+        self._play_state_music(
+            AUDIO_STATE_OVERWORLD, location_id,
+            _STATE_TRACKS[(AUDIO_STATE_OVERWORLD, 1)]
+        )
     
     # ========================================================================
     # БОЕВАЯ МУЗЫКА
@@ -170,15 +635,13 @@ class AudioManager:
         Аргументы:
             is_boss: True если бой с боссом
         """
-        self.current_state = 'battle'
         self.is_boss_battle = is_boss
         
-        if is_boss:
-            self._play_music(MUSIC_BOSS)
-        else:
-            # Случайный выбор между fight1 и fight2
-            track = random.choice([MUSIC_FIGHT_1, MUSIC_FIGHT_2])
-            self._play_music(track)
+        # Для моба - случайный выбор между fight1 и fight2
+        self._play_state_music(
+            AUDIO_STATE_BATTLE, bool(is_boss),
+            (_FIGHT_TRACKS[random.getrandbits(1)], -1)
+        )
     
     # ========================================================================
     # МУЗЫКА GAME OVER
@@ -186,15 +649,17 @@ class AudioManager:
     
     def play_game_over_music(self) -> None:
         """Воспроизведение музыки Game Over (один раз, без зацикливания)."""
-        self.current_state = 'game_over'
-        self._play_music(MUSIC_GAME_OVER, loops=0)
+        self._play_state_music(AUDIO_STATE_GAME_OVER)
     
     # ========================================================================
     # ВОЗВРАТ К ПРЕДЫДУЩЕЙ МУЗЫКЕ
     # ========================================================================
     
     def resume_location_music(self) -> None:
-        """Возобновление музыки локации после боя."""
+        """
+        Возобновление музыки локации после боя.
+        Если музыка этой локации уже играет, трек не перезапускается.
+        """
         if self.current_location:
             self.play_location_music(self.current_location)
         else:
@@ -202,10 +667,24 @@ class AudioManager:
     
     def is_music_playing(self) -> bool:
         """Проверка, играет ли музыка."""
-        try:
-            return pygame.mixer.music.get_busy()
-        except pygame.error:
+        if not self.mixer_ok:
             return False
+        if self.battle_track is not None and self.battle_channel.get_busy():
+            return True
+        return self._is_busy()
+    
+    def _is_busy(self) -> bool:
+        """
+        Проверка, играет ли музыка, с сохранением результата на один кадр.
+        Сохранённый результат сбрасывается при запуске и остановке музыки.
+        """
+        now = pygame.time.get_ticks()
+        cache = self.busy_cache
+        if cache is not None and now - cache[0] < _BUSY_CACHE_MS:
+            return cache[1]
+        busy = pygame.mixer.music.get_busy()
+        self.busy_cache = (now, busy)
+        return busy
     
     def get_current_state(self) -> str:
         """Получение текущего состояния аудио."""
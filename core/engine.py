@@ -15,6 +15,8 @@
 - При смене состояния передаётся информация о враге
 """
 
+import functools
+import math
 import pygame
 import random
 from core.settings import (
@@ -27,11 +29,15 @@ from core.settings import (
     MENU_ITEM_CONTINUE, MENU_ITEM_FULLSCREEN, MENU_ITEM_QUIT, MENU_ITEM_LOAD_SAVE,
     TITLE_MENU_NEW_GAME, TITLE_MENU_CONTINUE, TITLE_MENU_QUIT,
     MOB_PATTERNS_PER_ROUND, PLAYER_MAX_HP,
-    SAFETY_PAUSE_DURATION, SAFETY_PAUSE_MESSAGE, WARMUP_DURATION, WARMUP_MESSAGE
+    SAFETY_PAUSE_DURATION, SAFETY_PAUSE_MESSAGE, WARMUP_DURATION, WARMUP_MESSAGE,
+    BATTLE_TICK_RATE, BATTLE_MAX_TICKS_PER_FRAME,
+    BATTLE_MODE_MENU, BATTLE_MODE_DODGE, BATTLE_MODE_FIGHT_ATTACK,
+    BATTLE_MODE_SAFETY_PAUSE, BATTLE_MODE_WARMUP
 )
 from entities.player import Player
 from entities.pickup_item import PickupItem, ItemData
 from entities.save_point import SavePoint
+from combat.bullet import ProjectileGroup
 from combat.patterns import AttackManager
 from combat.battle_ui import BattleUI
 from scenes.map_manager import MapManager, Enemy
@@ -39,72 +45,167 @@ from core.audio import AudioManager
 from core.save_manager import SaveManager
 
 
+@functools.lru_cache(maxsize=512)
+def _render_text(font: pygame.font.Font, text: str, color: tuple) -> pygame.Surface:
+    """
+    Отрисовка текста с кэшированием готовой поверхности.
+    Одинаковый текст одного шрифта и цвета растеризуется один раз;
+    редко используемые варианты вытесняются из кэша.
+    Поверхность приводится к формату экрана для быстрого копирования.
+    Возвращаемая поверхность общая - её можно только копировать на экран.
+    
+    Аргументы:
+        font: Шрифт
+        text: Текст
+        color: Цвет текста
+        
+    Возвращает:
+        pygame.Surface: Поверхность с текстом
+    """
+    return font.render(text, True, color).convert_alpha()
+
+
+@functools.lru_cache(maxsize=16)
+def _render_framed_text(font: pygame.font.Font, text: str, color: tuple,
+                        border_color: tuple) -> pygame.Surface:
+    """
+    Отрисовка сообщения в рамке (чёрный фон, цветная рамка, текст) с кэшированием.
+    Текст отступает от краёв на 20 пикселей по горизонтали и 5 по вертикали.
+    
+    Аргументы:
+        font: Шрифт
+        text: Текст сообщения
+        color: Цвет текста
+        border_color: Цвет рамки
+        
+    Возвращает:
+        pygame.Surface: Поверхность с сообщением в рамке
+    """
+    text_surface = _render_text(font, text, color)
+    surface = pygame.Surface((text_surface.get_width() + 40, text_surface.get_height() + 10))
+    surface.fill(COLOR_BLACK)
+    pygame.draw.rect(surface, border_color, surface.get_rect(), 2)
+    surface.blit(text_surface, (20, 5))
+    return surface.convert()
+
+
+@functools.lru_cache(maxsize=8)
+def _heart_surface(color: tuple) -> pygame.Surface:
+    """
+    Получение поверхности с сердечком-указателем меню.
+    Фигура рисуется примитивами один раз для каждого цвета.
+    
+    Аргументы:
+        color: Цвет сердечка
+        
+    Возвращает:
+        pygame.Surface: Прозрачная поверхность 21x21 с сердечком
+    """
+    surface = pygame.Surface((21, 21), pygame.SRCALPHA)
+    pygame.draw.circle(surface, color, (5, 5), 5)
+    pygame.draw.circle(surface, color, (15, 5), 5)
+    pygame.draw.polygon(surface, color, [(0, 7), (10, 20), (20, 7)])
+    return surface.convert_alpha()
+
+
+# Цвет пункта меню по индексу (доступен << 1) | выбран
+_MENU_ITEM_COLORS = (
+    (80, 80, 80),   # Недоступен
+    (80, 80, 80),   # Недоступен (выбран)
+    COLOR_WHITE,    # Доступен
+    COLOR_YELLOW,   # Доступен и выбран
+)
+
+
+# Яркость мерцающего названия для каждого кадра периода: |cos(2 * кадр°)|.
+# Период модуля косинуса - 180°, то есть 90 кадров анимации.
+_FLICKER_PERIOD = 90
+_FLICKER_LUT = tuple(abs(math.cos(math.radians(i * 2))) for i in range(_FLICKER_PERIOD))
+
+
 class MainMenu:
     """
     Главное меню игры в стиле Undertale.
     Чёрный фон, белый текст, логотип сверху.
     """
     
+    __slots__ = (
+        'screen_width', 'screen_height', 'selected_index', 'has_save', 'menu_items',
+        'animation_timer', 'title_font', 'subtitle_font', 'item_font', 'hint_font',
+        'save_info_font', 'static_surface', 'static_key',
+        'available_mask', 'available_indices', 'selected_pos'
+    )
+    
+    # Вертикальная позиция названия игры
+    TITLE_Y = 120
+    
     def __init__(self, screen_width: int, screen_height: int):
         self.screen_width = screen_width
         self.screen_height = screen_height
         self.selected_index = 0
         self.has_save = False
-        self.menu_items = [TITLE_MENU_NEW_GAME, TITLE_MENU_CONTINUE, TITLE_MENU_QUIT]
+        self.menu_items = (TITLE_MENU_NEW_GAME, TITLE_MENU_CONTINUE, TITLE_MENU_QUIT)
         
         # Анимация
         self.animation_timer = 0
         
+        # Шрифты (создаются один раз, а не в каждом кадре)
+        self.title_font = pygame.font.Font(None, 72)
+        self.subtitle_font = pygame.font.Font(None, 28)
+        self.item_font = pygame.font.Font(None, 40)
+        self.hint_font = pygame.font.Font(None, 24)
+        self.save_info_font = pygame.font.Font(None, 20)
+        
+        # Неизменная часть меню и состояние (выбор, наличие сохранения), для которого она нарисована
+        self.static_surface = None
+        self.static_key = None
+        
+        # Доступность каждого пункта, индексы доступных пунктов
+        # и позиция выбранного пункта среди них
+        self.available_mask = ()
+        self.available_indices = ()
+        self.selected_pos = 0
+        self._refresh_available()
+        
     def check_save(self, save_manager: SaveManager) -> None:
         """Проверка наличия сохранения."""
         self.has_save = save_manager.has_saved_game()
-        # Если нет сохранения, Continue неактивна
-        if not self.has_save:
-            # Пропускаем Continue при навигации
-            pass
+        # Если нет сохранения, Continue неактивна и пропускается при навигации
+        self._refresh_available()
+        
+    def _refresh_available(self) -> None:
+        """Пересчёт доступных пунктов (вызывается только при смене наличия сохранения)."""
+        self.available_mask = tuple(self._is_item_available(item) for item in self.menu_items)
+        self.available_indices = tuple(
+            i for i, is_available in enumerate(self.available_mask) if is_available
+        )
+        if self.selected_index in self.available_indices:
+            self.selected_pos = self.available_indices.index(self.selected_index)
+        else:
+            # Выбранный пункт стал недоступен - переходим к первому доступному
+            self.selected_pos = 0
+            self.selected_index = self.available_indices[0]
         
     def handle_input(self, key: int) -> str:
         """Обработка ввода в меню."""
-        # Определяем доступные пункты
-        available_items = self._get_available_items()
-        
         if key == pygame.K_UP:
             # Переход к предыдущему доступному пункту
-            current_item = available_items[self.selected_index] if self.selected_index < len(available_items) else available_items[0]
-            current_idx = self.menu_items.index(current_item)
-            
-            # Ищем предыдущий доступный
-            for i in range(len(self.menu_items) - 1, -1, -1):
-                idx = (current_idx + i) % len(self.menu_items)
-                if self._is_item_available(self.menu_items[idx]):
-                    self.selected_index = self.menu_items.index(self.menu_items[idx])
-                    break
+            self.selected_pos = (self.selected_pos - 1) % len(self.available_indices)
+            self.selected_index = self.available_indices[self.selected_pos]
                     
         elif key == pygame.K_DOWN:
             # Переход к следующему доступному пункту
-            current_item = available_items[self.selected_index] if self.selected_index < len(available_items) else available_items[0]
-            current_idx = self.menu_items.index(current_item)
-            
-            # Ищем следующий доступный
-            for i in range(1, len(self.menu_items) + 1):
-                idx = (current_idx + i) % len(self.menu_items)
-                if self._is_item_available(self.menu_items[idx]):
-                    self.selected_index = self.menu_items.index(self.menu_items[idx])
-                    break
+            self.selected_pos = (self.selected_pos + 1) % len(self.available_indices)
+            self.selected_index = self.available_indices[self.selected_pos]
                     
         elif key == pygame.K_z or key == pygame.K_RETURN:
-            selected_item = self.menu_items[self.selected_index]
-            if self._is_item_available(selected_item):
-                return selected_item
+            # Выбранный пункт всегда доступен (см. _refresh_available)
+            return self.menu_items[self.selected_index]
                 
         return None
     
-    def _get_available_items(self) -> list:
-        """Получение списка доступных пунктов."""
-        return [item for item in self.menu_items if self._is_item_available(item)]
-    
     def _is_item_available(self, item: str) -> bool:
-        """Проверка доступности пункта меню."""
+        """Проверка доступности пункта меню (только при пересчёте available_mask)."""
         if item == TITLE_MENU_CONTINUE:
             return self.has_save
         return True
@@ -115,90 +216,94 @@ class MainMenu:
     
     def draw(self, surface: pygame.Surface) -> None:
         """Отрисовка главного меню."""
-        # Чёрный фон
-        surface.fill(COLOR_BLACK)
+        # Неизменная часть меню перерисовывается только при смене выбора
+        static_key = (self.selected_index, self.has_save)
+        if static_key != self.static_key:
+            self._build_static_surface()
+            self.static_key = static_key
+        surface.blit(self.static_surface, (0, 0))
         
         # Логотип/название игры
-        title_font = pygame.font.Font(None, 72)
         title_text = "UNDERTALE"
         
         # Эффект мерцания для названия
-        flicker = abs(pygame.math.Vector2(1, 0).rotate(self.animation_timer * 2).x)
-        title_color = (
-            int(255 * (0.8 + 0.2 * flicker)),
-            int(255 * (0.8 + 0.2 * flicker)),
-            int(255 * (0.8 + 0.2 * flicker))
-        )
+        flicker = _FLICKER_LUT[self.animation_timer % _FLICKER_PERIOD]
+        brightness = int(255 * (0.8 + 0.2 * flicker))
+        title_color = (brightness, brightness, brightness)
         
-        title = title_font.render(title_text, True, title_color)
+        title = _render_text(self.title_font, title_text, title_color)
         title_x = (self.screen_width - title.get_width()) // 2
-        title_y = 120
-        surface.blit(title, (title_x, title_y))
+        surface.blit(title, (title_x, self.TITLE_Y))
+    
+    def _build_static_surface(self) -> None:
+        """Отрисовка неизменной части меню (всё, кроме мерцающего названия)."""
+        surface = pygame.Surface((self.screen_width, self.screen_height)).convert()
+        self.static_surface = surface
+        
+        # Чёрный фон
+        surface.fill(COLOR_BLACK)
+        
+        # Надписи собираются в список и выводятся одним вызовом blits
+        blit_list = []
         
         # Подзаголовок
-        subtitle_font = pygame.font.Font(None, 28)
-        subtitle = subtitle_font.render("- Style Game Demo -", True, (150, 150, 150))
+        subtitle = _render_text(self.subtitle_font, "- Style Game Demo -", (150, 150, 150))
         subtitle_x = (self.screen_width - subtitle.get_width()) // 2
-        surface.blit(subtitle, (subtitle_x, title_y + 60))
+        blit_list.append((subtitle, (subtitle_x, self.TITLE_Y + 60)))
         
         # Пункты меню
-        item_font = pygame.font.Font(None, 40)
         menu_y = 280
         item_spacing = 60
         
         for i, item in enumerate(self.menu_items):
-            # Проверяем доступность
-            is_available = self._is_item_available(item)
+            # Доступность (заранее вычислена) и выбор
+            is_available = self.available_mask[i]
             is_selected = (i == self.selected_index)
             
-            # Цвет
-            if not is_available:
-                color = (80, 80, 80)  # Серый для недоступных
-            elif is_selected:
-                color = COLOR_YELLOW
-            else:
-                color = COLOR_WHITE
+            # Цвет (серый для недоступных)
+            color = _MENU_ITEM_COLORS[(is_available << 1) | is_selected]
             
             # Текст
-            text = item_font.render(item, True, color)
+            text = _render_text(self.item_font, item, color)
             text_x = (self.screen_width - text.get_width()) // 2
             text_y = menu_y + i * item_spacing
-            surface.blit(text, (text_x, text_y))
+            blit_list.append((text, (text_x, text_y)))
             
             # Индикатор выбора (сердечко) для выбранного пункта
             if is_selected and is_available:
                 heart_x = text_x - 30
                 heart_y = text_y + 5
-                self._draw_heart(surface, heart_x, heart_y, COLOR_RED)
+                blit_list.append((_heart_surface(COLOR_RED), (heart_x, heart_y)))
         
         # Подсказка
-        hint_font = pygame.font.Font(None, 24)
-        hint = hint_font.render("↑↓ - выбор, Z - подтвердить", True, (100, 100, 100))
+        hint = _render_text(self.hint_font, "↑↓ - выбор, Z - подтвердить", (100, 100, 100))
         hint_x = (self.screen_width - hint.get_width()) // 2
-        surface.blit(hint, (hint_x, self.screen_height - 50))
+        blit_list.append((hint, (hint_x, self.screen_height - 50)))
         
         # Информация о сохранении
         if self.has_save:
-            save_info_font = pygame.font.Font(None, 20)
-            save_text = save_info_font.render("Найдено сохранение", True, (100, 200, 100))
+            save_text = _render_text(self.save_info_font, "Найдено сохранение", (100, 200, 100))
             save_x = (self.screen_width - save_text.get_width()) // 2
-            surface.blit(save_text, (save_x, self.screen_height - 80))
-    
-    def _draw_heart(self, surface: pygame.Surface, x: int, y: int, color):
-        """Отрисовка сердечка."""
-        pygame.draw.circle(surface, color, (x + 5, y + 5), 5)
-        pygame.draw.circle(surface, color, (x + 15, y + 5), 5)
-        pygame.draw.polygon(surface, color, [(x, y + 7), (x + 10, y + 20), (x + 20, y + 7)])
+            blit_list.append((save_text, (save_x, self.screen_height - 80)))
+        
+        surface.blits(blit_list, doreturn=False)
     
     def reset(self):
         """Сброс меню."""
         self.selected_index = 0
+        self.selected_pos = 0
 
 
 class PauseMenu:
     """Меню паузы игры."""
     
-    MENU_ITEMS = [MENU_ITEM_CONTINUE, MENU_ITEM_LOAD_SAVE, MENU_ITEM_FULLSCREEN, MENU_ITEM_QUIT]
+    __slots__ = (
+        'screen_width', 'screen_height', 'selected_index', 'is_fullscreen', 'has_save',
+        'title_font', 'item_font', 'hint_font', 'overlay', 'content_surface', 'content_key',
+        'available_mask', 'available_indices', 'selected_pos'
+    )
+    
+    MENU_ITEMS = (MENU_ITEM_CONTINUE, MENU_ITEM_LOAD_SAVE, MENU_ITEM_FULLSCREEN, MENU_ITEM_QUIT)
     
     def __init__(self, screen_width: int, screen_height: int):
         self.screen_width = screen_width
@@ -207,37 +312,57 @@ class PauseMenu:
         self.is_fullscreen = False
         self.has_save = False
         
+        # Шрифты (создаются один раз, а не в каждом кадре)
+        self.title_font = pygame.font.Font(None, 48)
+        self.item_font = pygame.font.Font(None, 32)
+        self.hint_font = pygame.font.Font(None, 24)
+        
+        # Полупрозрачное затемнение (создаётся при первой отрисовке под размер экрана)
+        self.overlay = None
+        
+        # Содержимое меню поверх затемнения и состояние, для которого оно нарисовано
+        self.content_surface = None
+        self.content_key = None
+        
+        # Доступность каждого пункта, индексы доступных пунктов
+        # и позиция выбранного пункта среди них
+        self.available_mask = ()
+        self.available_indices = ()
+        self.selected_pos = 0
+        self._refresh_available()
+        
     def check_save(self, save_manager: SaveManager) -> None:
         """Проверка наличия сохранения."""
         self.has_save = save_manager.has_saved_game()
+        self._refresh_available()
+        
+    def _refresh_available(self) -> None:
+        """Пересчёт доступных пунктов (вызывается только при смене наличия сохранения)."""
+        available_items = frozenset(self._get_available_items())
+        self.available_mask = tuple(item in available_items for item in self.MENU_ITEMS)
+        self.available_indices = tuple(
+            i for i, is_available in enumerate(self.available_mask) if is_available
+        )
+        if self.selected_index in self.available_indices:
+            self.selected_pos = self.available_indices.index(self.selected_index)
+        else:
+            # Выбранный пункт стал недоступен - переходим к первому доступному
+            self.selected_pos = 0
+            self.selected_index = self.available_indices[0]
         
     def handle_input(self, key: int) -> str:
         """Обработка ввода в меню."""
-        # Фильтруем недоступные пункты
-        available_items = self._get_available_items()
-        
         if key == pygame.K_UP:
-            current_item = self.MENU_ITEMS[self.selected_index]
-            if current_item in available_items:
-                current_idx = available_items.index(current_item)
-                new_idx = (current_idx - 1) % len(available_items)
-                self.selected_index = self.MENU_ITEMS.index(available_items[new_idx])
-            else:
-                self.selected_index = self.MENU_ITEMS.index(available_items[0])
+            self.selected_pos = (self.selected_pos - 1) % len(self.available_indices)
+            self.selected_index = self.available_indices[self.selected_pos]
                 
         elif key == pygame.K_DOWN:
-            current_item = self.MENU_ITEMS[self.selected_index]
-            if current_item in available_items:
-                current_idx = available_items.index(current_item)
-                new_idx = (current_idx + 1) % len(available_items)
-                self.selected_index = self.MENU_ITEMS.index(available_items[new_idx])
-            else:
-                self.selected_index = self.MENU_ITEMS.index(available_items[0])
+            self.selected_pos = (self.selected_pos + 1) % len(self.available_indices)
+            self.selected_index = self.available_indices[self.selected_pos]
                 
         elif key == pygame.K_z or key == pygame.K_RETURN:
-            selected_item = self.MENU_ITEMS[self.selected_index]
-            if selected_item in available_items:
-                return selected_item
+            # Выбранный пункт всегда доступен (см. _refresh_available)
+            return self.MENU_ITEMS[self.selected_index]
                 
         elif key == pygame.K_ESCAPE or key == pygame.K_x:
             return MENU_ITEM_CONTINUE
@@ -259,27 +384,41 @@ class PauseMenu:
     def draw(self, surface: pygame.Surface):
         """Отрисовка меню."""
         # Полупрозрачный фон
-        overlay = pygame.Surface((self.screen_width, self.screen_height))
-        overlay.fill(COLOR_BLACK)
-        overlay.set_alpha(200)
-        surface.blit(overlay, (0, 0))
+        size = surface.get_size()
+        if self.overlay is None or self.overlay.get_size() != size:
+            self.overlay = pygame.Surface(size).convert()
+            self.overlay.fill(COLOR_BLACK)
+            self.overlay.set_alpha(200)
+        surface.blit(self.overlay, (0, 0))
+        
+        # Содержимое перерисовывается только при смене выбора или состояния пунктов
+        content_key = (self.selected_index, self.has_save, self.is_fullscreen)
+        if content_key != self.content_key:
+            self._build_content_surface()
+            self.content_key = content_key
+        surface.blit(self.content_surface, (0, 0))
+    
+    def _build_content_surface(self) -> None:
+        """Отрисовка содержимого меню (заголовок, пункты, подсказка) на прозрачную поверхность."""
+        surface = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA).convert_alpha()
+        self.content_surface = surface
+        
+        # Надписи собираются в список и выводятся одним вызовом blits
+        blit_list = []
         
         # Заголовок
-        title_font = pygame.font.Font(None, 48)
-        title = title_font.render("ПАУЗА", True, COLOR_WHITE)
+        title = _render_text(self.title_font, "ПАУЗА", COLOR_WHITE)
         title_x = (self.screen_width - title.get_width()) // 2
-        surface.blit(title, (title_x, 100))
+        blit_list.append((title, (title_x, 100)))
         
         # Пункты меню
-        item_font = pygame.font.Font(None, 32)
-        available_items = self._get_available_items()
         menu_y = 180
         item_spacing = 50
         
         for i, item in enumerate(self.MENU_ITEMS):
-            # Проверяем доступность
-            is_available = item in available_items
-            is_selected = (item == self.MENU_ITEMS[self.selected_index])
+            # Доступность (заранее вычислена) и выбор
+            is_available = self.available_mask[i]
+            is_selected = (i == self.selected_index)
             
             # Модифицируем текст для полноэкранного режима
             display_text = item
@@ -288,39 +427,34 @@ class PauseMenu:
                 display_text = f"{item}: {status}"
             
             # Цвет
-            if not is_available:
-                color = (80, 80, 80)
-            elif is_selected:
-                color = COLOR_YELLOW
-            else:
-                color = COLOR_WHITE
+            color = _MENU_ITEM_COLORS[(is_available << 1) | is_selected]
             
             # Текст
-            text = item_font.render(display_text, True, color)
+            text = _render_text(self.item_font, display_text, color)
             text_x = (self.screen_width - text.get_width()) // 2
-            surface.blit(text, (text_x, menu_y + i * item_spacing))
+            blit_list.append((text, (text_x, menu_y + i * item_spacing)))
             
             # Индикатор выбора (сердечко)
             if is_selected and is_available:
                 heart_x = text_x - 25
                 heart_y = menu_y + i * item_spacing + 5
-                self._draw_heart(surface, heart_x, heart_y, COLOR_RED)
+                blit_list.append((_heart_surface(COLOR_RED), (heart_x, heart_y)))
         
         # Подсказка
-        hint_font = pygame.font.Font(None, 24)
-        hint = hint_font.render("↑↓ - выбор, Z - подтвердить, ESC/X - закрыть", True, (150, 150, 150))
+        hint = _render_text(self.hint_font, "↑↓ - выбор, Z - подтвердить, ESC/X - закрыть", (150, 150, 150))
         hint_x = (self.screen_width - hint.get_width()) // 2
-        surface.blit(hint, (hint_x, self.screen_height - 50))
-    
-    def _draw_heart(self, surface: pygame.Surface, x: int, y: int, color):
-        """Отрисовка сердечка."""
-        pygame.draw.circle(surface, color, (x + 5, y + 5), 5)
-        pygame.draw.circle(surface, color, (x + 15, y + 5), 5)
-        pygame.draw.polygon(surface, color, [(x, y + 7), (x + 10, y + 20), (x + 20, y + 7)])
+        blit_list.append((hint, (hint_x, self.screen_height - 50)))
+        
+        surface.blits(blit_list, doreturn=False)
     
     def reset(self):
         """Сброс меню."""
         self.selected_index = 0
+        self.selected_pos = 0
+
+
+# Режимы боя, в которых игрок может двигаться
+_MOVABLE_BATTLE_MODES = frozenset((BATTLE_MODE_DODGE, BATTLE_MODE_WARMUP))
 
 
 class Battle:
@@ -329,6 +463,20 @@ class Battle:
     Управляет рамкой боя, атаками, UI и проверкой столкновений.
     """
     
+    __slots__ = (
+        'screen_width', 'screen_height', 'box_x', 'box_y', 'box_rect',
+        'enemy_hp_bar_rect', 'fight_bar_rect', 'fight_zone_rect', 'hp_bar_rect',
+        'bullets', 'attack_manager', 'tick_ms', 'tick_accumulator', 'last_tick_time',
+        'ui', 'current_enemy', 'battle_mode',
+        'fight_bar_active', 'fight_bar_position', 'fight_bar_direction', 'fight_bar_speed',
+        'frame', 'show_phase2_message', 'phase2_message_ends_at',
+        'safety_pause_active', 'safety_pause_ends_at', 'safety_pause_message',
+        'warmup_active', 'warmup_ends_at', 'warmup_message',
+        'warmup_timer_seconds', 'warmup_timer_text',
+        'message_font', 'title_font', 'font', 'small_font', 'hp_font',
+        'hud_surface', 'hud_key', 'hp_text', 'hp_text_key', 'phase2_messages'
+    )
+    
     def __init__(self, screen_width: int, screen_height: int):
         """
         Инициализация боя.
@@ -348,11 +496,29 @@ class Battle:
             BATTLE_BOX_WIDTH, BATTLE_BOX_HEIGHT
         )
         
+        # Геометрия полос интерфейса (зависит только от размеров экрана)
+        # Полоса HP врага над рамкой
+        self.enemy_hp_bar_rect = pygame.Rect((screen_width - 300) // 2, self.box_y - 25, 300, 15)
+        # Полоса мини-игры FIGHT по центру рамки и зона максимального урона в её центре
+        self.fight_bar_rect = pygame.Rect(
+            (screen_width - 250) // 2, self.box_y + BATTLE_BOX_HEIGHT // 2 - 15, 250, 30
+        )
+        self.fight_zone_rect = pygame.Rect(
+            self.fight_bar_rect.x + (250 - 40) // 2, self.fight_bar_rect.y, 40, 30
+        )
+        # Полоса HP игрока
+        self.hp_bar_rect = pygame.Rect(20, screen_height - 80, 200, 20)
+        
         # Группа спрайтов для снарядов
-        self.bullets = pygame.sprite.Group()
+        self.bullets = ProjectileGroup()
         
         # Менеджер атак
         self.attack_manager = AttackManager(self.box_rect, self.bullets)
+        
+        # Фиксированный шаг логики атак (мс) и накопленное время
+        self.tick_ms = 1000 / BATTLE_TICK_RATE
+        self.tick_accumulator = 0.0
+        self.last_tick_time = None
     
         # Боевой UI
         self.ui = BattleUI(screen_width, screen_height, self.box_y)
@@ -360,8 +526,8 @@ class Battle:
         # Текущий враг
         self.current_enemy = None
         
-        # Режим боя ('menu' - меню, 'dodge' - уклонение, 'fight_attack' - атака игрока)
-        self.battle_mode = 'menu'
+        # Режим боя (BATTLE_MODE_*: меню, уклонение, атака игрока, пауза, разминка)
+        self.battle_mode = BATTLE_MODE_MENU
         
         # Система мини-игры FIGHT
         self.fight_bar_active = False
@@ -369,23 +535,52 @@ class Battle:
         self.fight_bar_direction = 1   # Направление движения (1 или -1)
         self.fight_bar_speed = 0.03    # Скорость бегунка
         
+        # Номер кадра боя (счётчик вызовов update). Таймеры ниже хранят
+        # номер кадра окончания, а не уменьшаются каждый кадр
+        self.frame = 0
+        
         # Флаг для показа сообщения о переходе во вторую фазу босса
         self.show_phase2_message = False
-        self.phase2_message_timer = 0
+        self.phase2_message_ends_at = 0
     
         # Safety Pause - пауза перед атакой врага
         self.safety_pause_active = False
-        self.safety_pause_timer = 0
+        self.safety_pause_ends_at = 0
         self.safety_pause_message = SAFETY_PAUSE_MESSAGE
     
         # Warmup - время для перемещения перед атакой
         self.warmup_active = False
-        self.warmup_timer = 0
+        self.warmup_ends_at = 0
         self.warmup_message = WARMUP_MESSAGE
+        
+        # Надпись таймера разминки и число секунд, для которого она отрисована
+        self.warmup_timer_seconds = None
+        self.warmup_timer_text = None
+        
+        # Панель врага над рамкой и состояние (враг, HP, фаза), для которого она нарисована
+        self.hud_surface = None
+        self.hud_key = None
+        
+        # Надпись HP игрока и значения (HP, макс. HP), для которых она отрисована
+        self.hp_text = None
+        self.hp_text_key = None
+        
+        # Шрифты (создаются один раз, а не в каждом кадре)
+        self.message_font = pygame.font.Font(None, 36)
+        self.title_font = pygame.font.Font(None, 32)
+        self.font = pygame.font.Font(None, 24)
+        self.small_font = pygame.font.Font(None, 20)
+        self.hp_font = pygame.font.Font(None, 18)
+        
+        # Оба цвета мигающего сообщения о второй фазе босса (отрисованы заранее)
+        self.phase2_messages = (
+            _render_framed_text(self.message_font, "БОСС В ЯРОСТИ!", COLOR_RED, COLOR_RED),
+            _render_framed_text(self.message_font, "БОСС В ЯРОСТИ!", COLOR_YELLOW, COLOR_RED),
+        )
     
     def can_player_move(self) -> bool:
         """Проверка, может ли игрок двигаться в текущем режиме."""
-        return self.battle_mode in ('dodge', 'warmup')
+        return self.battle_mode in _MOVABLE_BATTLE_MODES
     
     def set_enemy(self, enemy: Enemy) -> None:
         """
@@ -400,7 +595,6 @@ class Battle:
     
         # Сбрасываем флаги фаз босса
         self.show_phase2_message = False
-        self.phase2_message_timer = 0
     
     def handle_input(self, key: int) -> str:
         """
@@ -413,17 +607,17 @@ class Battle:
             str: Результат действия или None
         """
         # Обработка мини-игры FIGHT
-        if self.battle_mode == 'fight_attack':
+        if self.battle_mode == BATTLE_MODE_FIGHT_ATTACK:
             if key == pygame.K_z:
                 return self._process_fight_attack()
             elif key == pygame.K_x:
                 # Отмена атаки
-                self.battle_mode = 'menu'
+                self.battle_mode = BATTLE_MODE_MENU
                 self.fight_bar_active = False
                 return 'fight_cancel'
             return None
         
-        if self.battle_mode == 'menu':
+        if self.battle_mode == BATTLE_MODE_MENU:
             action = self.ui.handle_input(key)
             
             if action:
@@ -499,7 +693,7 @@ class Battle:
     
     def _start_fight_minigame(self) -> None:
         """Запуск мини-игры для атаки FIGHT."""
-        self.battle_mode = 'fight_attack'
+        self.battle_mode = BATTLE_MODE_FIGHT_ATTACK
         self.fight_bar_active = True
         self.fight_bar_position = 0.0
         self.fight_bar_direction = 1
@@ -512,68 +706,121 @@ class Battle:
             player_x: Позиция игрока X
             player_y: Позиция игрока Y
         """
-        # Обновление таймера сообщения о фазе 2
-        if self.phase2_message_timer > 0:
-            self.phase2_message_timer -= 1
-            if self.phase2_message_timer <= 0:
-                self.show_phase2_message = False
+        frame = self.frame + 1
+        self.frame = frame
+        
+        # Скрытие сообщения о фазе 2 по истечении времени
+        if self.show_phase2_message and frame >= self.phase2_message_ends_at:
+            self.show_phase2_message = False
         
         # Обновление Safety Pause
         if self.safety_pause_active:
-            self.safety_pause_timer -= 1
-            if self.safety_pause_timer <= 0:
+            if frame >= self.safety_pause_ends_at:
                 self.safety_pause_active = False
                 self._start_warmup()  # Переходим к warmup
             return
         
         # Обновление Warmup (время для перемещения)
         if self.warmup_active:
-            self.warmup_timer -= 1
-            if self.warmup_timer <= 0:
+            if frame >= self.warmup_ends_at:
                 self.warmup_active = False
                 self._start_enemy_attack_after_warmup()  # Запускаем атаку
             return
         
         # Обновление мини-игры FIGHT
-        if self.battle_mode == 'fight_attack' and self.fight_bar_active:
-            self.fight_bar_position += self.fight_bar_speed * self.fight_bar_direction
+        if self.battle_mode == BATTLE_MODE_FIGHT_ATTACK and self.fight_bar_active:
+            # Позиция считается в локальной переменной и записывается один раз
+            position = self.fight_bar_position + self.fight_bar_speed * self.fight_bar_direction
             
             # Отскок от краёв
-            if self.fight_bar_position >= 1.0:
-                self.fight_bar_position = 1.0
+            if position >= 1.0:
+                position = 1.0
                 self.fight_bar_direction = -1
-            elif self.fight_bar_position <= 0.0:
-                self.fight_bar_position = 0.0
+            elif position <= 0.0:
+                position = 0.0
                 self.fight_bar_direction = 1
+            self.fight_bar_position = position
             return
         
-        if self.battle_mode == 'dodge':
-            # Обновление снарядов
-            self.bullets.update()
+        if self.battle_mode == BATTLE_MODE_DODGE:
+            attack_manager = self.attack_manager
+            round_active = not attack_manager.is_idle()
             
-            # Обновление менеджера атак
-            round_active = self.attack_manager.update(player_x, player_y)
+            # Логика атак выполняется фиксированными шагами по прошедшему времени
+            ticks = self._consume_ticks() if round_active else 0
+            while ticks > 0:
+                # Пауза между паттернами: снарядов нет, шаги пропускаются разом
+                if attack_manager.gap_remaining():
+                    ticks -= attack_manager.advance_gap(ticks)
+                    round_active = not attack_manager.is_idle()
+                    if not round_active:
+                        break
+                    continue
+                
+                # Обновление снарядов
+                self.bullets.update()
+                
+                # Обновление менеджера атак
+                round_active = attack_manager.update(player_x, player_y)
+                ticks -= 1
+                if not round_active:
+                    break
             
             # Проверка завершения раунда атак
             if not round_active:
                 self._end_dodge_phase()
     
+    def _consume_ticks(self) -> int:
+        """
+        Расчёт количества шагов логики атак для текущего кадра.
+        
+        Возвращает:
+            int: Количество фиксированных шагов
+        """
+        now = pygame.time.get_ticks()
+        
+        # Первый кадр фазы уклонения - ровно один шаг
+        if self.last_tick_time is None:
+            elapsed = self.tick_ms
+        else:
+            elapsed = now - self.last_tick_time
+            # Дрожание таймера в пределах 1 мс считаем ровно одним шагом
+            if abs(elapsed - self.tick_ms) < 1:
+                elapsed = self.tick_ms
+        self.last_tick_time = now
+        
+        max_time = self.tick_ms * BATTLE_MAX_TICKS_PER_FRAME
+        self.tick_accumulator = min(self.tick_accumulator + elapsed, max_time)
+        
+        ticks = int(self.tick_accumulator // self.tick_ms)
+        self.tick_accumulator -= ticks * self.tick_ms
+        return ticks
+    
+    def reset_ticks(self) -> None:
+        """
+        Сброс отсчёта времени логики атак.
+        Вызывается при входе в фазу уклонения и при возврате из меню паузы:
+        время, пока бой не обновлялся, не превращается в догоняющие шаги.
+        """
+        self.tick_accumulator = 0.0
+        self.last_tick_time = None
+    
     def start_safety_pause(self) -> None:
         """Запуск паузы перед атакой врага."""
         self.safety_pause_active = True
-        self.safety_pause_timer = SAFETY_PAUSE_DURATION
-        self.battle_mode = 'safety_pause'
+        self.safety_pause_ends_at = self.frame + SAFETY_PAUSE_DURATION
+        self.battle_mode = BATTLE_MODE_SAFETY_PAUSE
     
     def _start_warmup(self) -> None:
         """Запуск фазы разминки (игрок может двигаться)."""
         self.warmup_active = True
-        self.warmup_timer = WARMUP_DURATION
-        self.battle_mode = 'warmup'
+        self.warmup_ends_at = self.frame + WARMUP_DURATION
+        self.battle_mode = BATTLE_MODE_WARMUP
     
     def _start_enemy_attack_after_warmup(self) -> None:
         """Запуск атаки врага после разминки."""
         if not self.current_enemy:
-            self.battle_mode = 'menu'
+            self.battle_mode = BATTLE_MODE_MENU
             return
         
         if self.current_enemy.is_boss:
@@ -586,7 +833,8 @@ class Battle:
         else:
             self.attack_manager.start_round_with_pattern_count(MOB_PATTERNS_PER_ROUND)
         
-        self.battle_mode = 'dodge'
+        self.battle_mode = BATTLE_MODE_DODGE
+        self.reset_ticks()
     
     def _process_fight_attack(self) -> str:
         """
@@ -596,7 +844,7 @@ class Battle:
             str: Результат атаки
         """
         if not self.current_enemy:
-            self.battle_mode = 'menu'
+            self.battle_mode = BATTLE_MODE_MENU
             self.fight_bar_active = False
             return None
         
@@ -612,13 +860,13 @@ class Battle:
         enemy_dead = self.current_enemy.take_damage(damage)
         
         # Сбрасываем мини-игру
-        self.battle_mode = 'menu'
+        self.battle_mode = BATTLE_MODE_MENU
         self.fight_bar_active = False
         
         # Проверяем, перешёл ли босс во вторую фазу
         if self.current_enemy.is_boss and self.current_enemy.phase == 2 and self.current_enemy.phase2_triggered:
             self.show_phase2_message = True
-            self.phase2_message_timer = 120  # 2 секунды
+            self.phase2_message_ends_at = self.frame + 120  # 2 секунды
             self.current_enemy.phase2_triggered = False  # Сбрасываем флаг
         
         if enemy_dead:
@@ -628,8 +876,8 @@ class Battle:
     
     def _end_dodge_phase(self) -> None:
         """Завершение фазы уклонения."""
-        self.battle_mode = 'menu'
-        self.bullets.empty()
+        self.battle_mode = BATTLE_MODE_MENU
+        self.bullets.release_all()
         self.attack_manager.reset()
     
     def start_enemy_attack_round(self) -> None:
@@ -652,7 +900,8 @@ class Battle:
             # Обычный моб: всегда 1 паттерн
             self.attack_manager.start_round_with_pattern_count(MOB_PATTERNS_PER_ROUND)
         
-        self.battle_mode = 'dodge'
+        self.battle_mode = BATTLE_MODE_DODGE
+        self.reset_ticks()
     
     def check_collisions(self, player_rect: pygame.Rect, player: Player) -> None:
         """
@@ -662,20 +911,29 @@ class Battle:
             player_rect: Прямоугольник коллизии игрока
             player: Объект игрока
         """
-        if self.battle_mode != 'dodge':
+        if self.battle_mode != BATTLE_MODE_DODGE:
             return
         
         if not self.current_enemy:
             return
         
+        # Неуязвимый игрок не получает урона - проверять столкновения незачем
+        if player.invulnerability_timer > 0:
+            return
+        
         # Получаем урон врага
         enemy_damage = self.current_enemy.attack_damage
         
-        # Проверка столкновений со снарядами
-        for bullet in self.bullets:
-            if bullet.rect.colliderect(player_rect):
-                if player.take_damage(enemy_damage):
-                    bullet.kill()
+        # Проверка столкновений со снарядами: первый задевший снаряд ищется
+        # одним вызовом collidelist; после попадания игрок неуязвим,
+        # поэтому остальные снаряды урона уже не наносят
+        bullets = self.bullets.sprites()
+        if bullets:
+            hit_index = player_rect.collidelist([bullet.rect for bullet in bullets])
+            if hit_index >= 0:
+                player.take_damage(enemy_damage)
+                bullets[hit_index].release()
+                return
     
         # Проверка столкновений с лазерами
         if self.attack_manager.check_laser_collision(player_rect):
@@ -683,31 +941,27 @@ class Battle:
     
     def draw(self, surface: pygame.Surface, player: Player) -> None:
         """Отрисовка боя."""
+        # Время кадра для мигающих сообщений (запрашивается один раз)
+        now = pygame.time.get_ticks()
+        
         # Фон
         surface.fill(COLOR_BLACK)
         
-        # HP бар врага (над рамкой боя)
-        if self.current_enemy:
-            self._draw_enemy_hp_bar(surface)
-        
-        # Имя врага
-        if self.current_enemy:
-            font = pygame.font.Font(None, 32)
-            name_color = COLOR_YELLOW if self.current_enemy.is_boss else COLOR_WHITE
-            name_text = font.render(self.current_enemy.name, True, name_color)
-            surface.blit(name_text, (self.screen_width // 2 - name_text.get_width() // 2, 15))
-            
-            # Индикатор босса
-            if self.current_enemy.is_boss:
-                boss_font = pygame.font.Font(None, 20)
-                phase_text = boss_font.render(f"Фаза {self.current_enemy.phase}", True, COLOR_YELLOW)
-                surface.blit(phase_text, (self.screen_width // 2 - phase_text.get_width() // 2, 38))
+        # Панель врага: имя, фаза босса и HP бар над рамкой боя.
+        # Перерисовывается только при смене врага, его HP или фазы
+        enemy = self.current_enemy
+        if enemy:
+            hud_key = (enemy, enemy.hp, enemy.phase)
+            if hud_key != self.hud_key:
+                self._build_enemy_hud()
+                self.hud_key = hud_key
+            surface.blit(self.hud_surface, (0, 0))
         
         # Рамка боя
         pygame.draw.rect(surface, BOX_COLOR, self.box_rect, 3)
         
         # Мини-игра FIGHT
-        if self.battle_mode == 'fight_attack' and self.fight_bar_active:
+        if self.battle_mode == BATTLE_MODE_FIGHT_ATTACK and self.fight_bar_active:
             self._draw_fight_minigame(surface)
         
         # Safety Pause - сообщение о подготовке врага
@@ -717,15 +971,17 @@ class Battle:
         # Warmup - время для перемещения (игрок виден и может двигаться)
         if self.warmup_active:
             player.draw_battle(surface)
-            self._draw_warmup_message(surface)
+            self._draw_warmup_message(surface, now)
         
         # Снаряды и игрок (только в режиме уклонения)
-        if self.battle_mode == 'dodge':
-            self.bullets.draw(surface)
-            # Отрисовка лазеров
-            self.attack_manager.draw_lasers(surface)
-            # Отрисовка гравитационных аномалий
-            self.attack_manager.draw_gravity_wells(surface)
+        if self.battle_mode == BATTLE_MODE_DODGE:
+            # В паузе между паттернами снарядов, лазеров и аномалий нет
+            if self.attack_manager.is_drawable():
+                self.bullets.draw(surface)
+                # Отрисовка лазеров
+                self.attack_manager.draw_lasers(surface)
+                # Отрисовка гравитационных аномалий
+                self.attack_manager.draw_gravity_wells(surface)
             player.draw_battle(surface)
         
             # Информация о текущем паттерне
@@ -742,63 +998,72 @@ class Battle:
         
         # Сообщение о переходе во вторую фазу босса
         if self.show_phase2_message:
-            self._draw_phase2_message(surface)
+            self._draw_phase2_message(surface, now)
     
     def _draw_safety_pause_message(self, surface: pygame.Surface) -> None:
         """Отрисовка сообщения о подготовке врага к атаке."""
-        font = pygame.font.Font(None, 32)
-        
-        text = font.render(self.safety_pause_message, True, (255, 255, 255))
-        text_x = (self.screen_width - text.get_width()) // 2
+        # Текст с фоном и рамкой (готовая поверхность из кэша)
+        message = _render_framed_text(self.title_font, self.safety_pause_message, (255, 255, 255), COLOR_YELLOW)
+        message_x = (self.screen_width - message.get_width()) // 2
         text_y = self.box_y + BATTLE_BOX_HEIGHT // 2 - 10
-        
-        # Фон для текста
-        bg_rect = pygame.Rect(text_x - 20, text_y - 5, text.get_width() + 40, text.get_height() + 10)
-        pygame.draw.rect(surface, COLOR_BLACK, bg_rect)
-        pygame.draw.rect(surface, COLOR_YELLOW, bg_rect, 2)
-        
-        surface.blit(text, (text_x, text_y))
+        surface.blit(message, (message_x, text_y - 5))
     
-    def _draw_warmup_message(self, surface: pygame.Surface) -> None:
-        """Отрисовка сообщения о разминке (можно двигаться)."""
-        font = pygame.font.Font(None, 36)
+    def _draw_warmup_message(self, surface: pygame.Surface, now: int) -> None:
+        """Отрисовка сообщения о разминке (можно двигаться); now - время кадра в мс."""
+        font = self.message_font
         
-        # Мигающий зелёный текст
-        if pygame.time.get_ticks() % 500 < 250:
-            text = font.render(self.warmup_message, True, (100, 255, 100))
+        # Мигающий зелёный текст с фоном и рамкой (оба варианта кэшируются)
+        if now % 500 < 250:
+            message = _render_framed_text(font, self.warmup_message, (100, 255, 100), (100, 255, 100))
         else:
-            text = font.render(self.warmup_message, True, (200, 255, 200))
+            message = _render_framed_text(font, self.warmup_message, (200, 255, 200), (100, 255, 100))
         
-        text_x = (self.screen_width - text.get_width()) // 2
+        message_x = (self.screen_width - message.get_width()) // 2
         text_y = self.box_y + BATTLE_BOX_HEIGHT // 2 - 10
-        
-        # Фон для текста
-        bg_rect = pygame.Rect(text_x - 20, text_y - 5, text.get_width() + 40, text.get_height() + 10)
-        pygame.draw.rect(surface, COLOR_BLACK, bg_rect)
-        pygame.draw.rect(surface, (100, 255, 100), bg_rect, 2)
-        
-        surface.blit(text, (text_x, text_y))
+        surface.blit(message, (message_x, text_y - 5))
     
         # Показываем таймер
-        timer_font = pygame.font.Font(None, 24)
-        seconds = (self.warmup_timer // 60) + 1
-        timer_text = timer_font.render(f"Атака через: {seconds}с", True, (150, 255, 150))
+        # (строка форматируется только при смене числа секунд)
+        seconds = ((self.warmup_ends_at - self.frame) // 60) + 1
+        if seconds != self.warmup_timer_seconds:
+            self.warmup_timer_seconds = seconds
+            self.warmup_timer_text = _render_text(self.font, f"Атака через: {seconds}с", (150, 255, 150))
+        timer_text = self.warmup_timer_text
         timer_x = (self.screen_width - timer_text.get_width()) // 2
         surface.blit(timer_text, (timer_x, text_y + 30))
     
+    def _build_enemy_hud(self) -> None:
+        """Отрисовка панели врага (имя, фаза, HP бар) на прозрачную поверхность."""
+        surface = pygame.Surface((self.screen_width, self.box_y), pygame.SRCALPHA).convert_alpha()
+        self.hud_surface = surface
+        
+        # HP бар врага (над рамкой боя)
+        self._draw_enemy_hp_bar(surface)
+        
+        # Имя врага
+        enemy = self.current_enemy
+        name_color = COLOR_YELLOW if enemy.is_boss else COLOR_WHITE
+        name_text = _render_text(self.title_font, enemy.name, name_color)
+        blit_list = [(name_text, (self.screen_width // 2 - name_text.get_width() // 2, 15))]
+        
+        # Индикатор босса
+        if enemy.is_boss:
+            phase_text = _render_text(self.small_font, f"Фаза {enemy.phase}", COLOR_YELLOW)
+            blit_list.append((phase_text, (self.screen_width // 2 - phase_text.get_width() // 2, 38)))
+        
+        surface.blits(blit_list, doreturn=False)
+    
     def _draw_enemy_hp_bar(self, surface: pygame.Surface) -> None:
         """Отрисовка полоски здоровья врага."""
         enemy = self.current_enemy
         if not enemy:
             return
         
-        bar_width = 300
-        bar_height = 15
-        bar_x = (self.screen_width - bar_width) // 2
-        bar_y = self.box_y - 25
+        bar_rect = self.enemy_hp_bar_rect
+        bar_x, bar_y, bar_width, bar_height = bar_rect
         
         # Фон
-        pygame.draw.rect(surface, (40, 40, 40), (bar_x, bar_y, bar_width, bar_height))
+        surface.fill((40, 40, 40), bar_rect)
         
         # Текущее HP
         hp_percent = enemy.get_hp_percent()
@@ -813,106 +1078,92 @@ class Battle:
         else:
             hp_color = (100, 255, 100)  # Зелёный для обычных мобов
         
-        pygame.draw.rect(surface, hp_color, (bar_x, bar_y, hp_width, bar_height))
+        surface.fill(hp_color, (bar_x, bar_y, hp_width, bar_height))
         
         # Рамка
-        pygame.draw.rect(surface, COLOR_WHITE, (bar_x, bar_y, bar_width, bar_height), 2)
+        pygame.draw.rect(surface, COLOR_WHITE, bar_rect, 2)
         
         # Текст HP
-        font = pygame.font.Font(None, 18)
-        hp_text = font.render(f"{enemy.hp}/{enemy.max_hp}", True, COLOR_WHITE)
+        hp_text = _render_text(self.hp_font, f"{enemy.hp}/{enemy.max_hp}", COLOR_WHITE)
         text_x = bar_x + (bar_width - hp_text.get_width()) // 2
         surface.blit(hp_text, (text_x, bar_y - 2))
     
     def _draw_fight_minigame(self, surface: pygame.Surface) -> None:
         """Отрисовка мини-игры для атаки FIGHT."""
-        bar_width = 250
-        bar_height = 30
-        bar_x = (self.screen_width - bar_width) // 2
-        bar_y = self.box_y + BATTLE_BOX_HEIGHT // 2 - bar_height // 2
+        bar_rect = self.fight_bar_rect
+        bar_x, bar_y, bar_width, bar_height = bar_rect
         
         # Фон полосы
-        pygame.draw.rect(surface, (30, 30, 30), (bar_x, bar_y, bar_width, bar_height))
+        surface.fill((30, 30, 30), bar_rect)
         
         # Зона максимального урона (центр)
-        zone_width = 40
-        zone_x = bar_x + (bar_width - zone_width) // 2
-        pygame.draw.rect(surface, (100, 100, 100), (zone_x, bar_y, zone_width, bar_height))
+        surface.fill((100, 100, 100), self.fight_zone_rect)
         
         # Бегунок
         runner_x = bar_x + int(self.fight_bar_position * (bar_width - 10))
-        pygame.draw.rect(surface, COLOR_YELLOW, (runner_x, bar_y - 5, 10, bar_height + 10))
+        surface.fill(COLOR_YELLOW, (runner_x, bar_y - 5, 10, bar_height + 10))
         
         # Рамка
-        pygame.draw.rect(surface, COLOR_WHITE, (bar_x, bar_y, bar_width, bar_height), 2)
+        pygame.draw.rect(surface, COLOR_WHITE, bar_rect, 2)
         
         # Текст подсказки
-        font = pygame.font.Font(None, 24)
-        hint = font.render("Z - атаковать!  X - отмена", True, COLOR_WHITE)
+        hint = _render_text(self.font, "Z - атаковать!  X - отмена", COLOR_WHITE)
         surface.blit(hint, (bar_x + (bar_width - hint.get_width()) // 2, bar_y + bar_height + 10))
     
-    def _draw_phase2_message(self, surface: pygame.Surface) -> None:
-        """Отрисовка сообщения о переходе босса во вторую фазу."""
-        font = pygame.font.Font(None, 36)
-        
-        # Мигающий текст
-        if pygame.time.get_ticks() % 500 < 250:
-            text = font.render("БОСС В ЯРОСТИ!", True, COLOR_RED)
-        else:
-            text = font.render("БОСС В ЯРОСТИ!", True, COLOR_YELLOW)
+    def _draw_phase2_message(self, surface: pygame.Surface, now: int) -> None:
+        """Отрисовка сообщения о переходе босса во вторую фазу; now - время кадра в мс."""
+        # Мигающий текст с фоном и рамкой: красный в первой половине периода, жёлтый во второй
+        message = self.phase2_messages[now % 500 >= 250]
         
-        text_x = (self.screen_width - text.get_width()) // 2
+        message_x = (self.screen_width - message.get_width()) // 2
         text_y = self.box_y + BATTLE_BOX_HEIGHT // 2 - 50
-        
-        # Фон для текста
-        bg_rect = pygame.Rect(text_x - 20, text_y - 5, text.get_width() + 40, text.get_height() + 10)
-        pygame.draw.rect(surface, COLOR_BLACK, bg_rect)
-        pygame.draw.rect(surface, COLOR_RED, bg_rect, 2)
-        
-        surface.blit(text, (text_x, text_y))
+        surface.blit(message, (message_x, text_y - 5))
     
     def _draw_hp_bar(self, surface: pygame.Surface, player: Player) -> None:
         """Отрисовка полоски здоровья игрока."""
-        bar_x, bar_y = 20, self.screen_height - 80
-        bar_width, bar_height = 200, 20
+        bar_rect = self.hp_bar_rect
+        bar_x, bar_y, bar_width, bar_height = bar_rect
         
         # Фон
-        pygame.draw.rect(surface, (50, 50, 50), (bar_x, bar_y, bar_width, bar_height))
+        surface.fill((50, 50, 50), bar_rect)
         
         # Текущее HP
         hp_width = int(bar_width * (player.hp / player.max_hp))
         hp_color = COLOR_YELLOW if player.hp > 30 else COLOR_RED
-        pygame.draw.rect(surface, hp_color, (bar_x, bar_y, hp_width, bar_height))
+        surface.fill(hp_color, (bar_x, bar_y, hp_width, bar_height))
         
         # Рамка
-        pygame.draw.rect(surface, COLOR_WHITE, (bar_x, bar_y, bar_width, bar_height), 2)
-        
-        # Текст
-        font = pygame.font.Font(None, 24)
-        hp_text = font.render(f"HP: {player.hp}/{player.max_hp}", True, COLOR_WHITE)
+        pygame.draw.rect(surface, COLOR_WHITE, bar_rect, 2)
+        
+        # Текст (строка форматируется только при изменении HP)
+        hp_key = (player.hp, player.max_hp)
+        if hp_key != self.hp_text_key:
+            self.hp_text_key = hp_key
+            self.hp_text = _render_text(self.font, f"HP: {player.hp}/{player.max_hp}", COLOR_WHITE)
+        hp_text = self.hp_text
         surface.blit(hp_text, (bar_x + bar_width + 10, bar_y + 2))
     
     def _draw_hints(self, surface: pygame.Surface) -> None:
         """Отрисовка подсказок."""
-        font = pygame.font.Font(None, 24)
+        font = self.font
         
-        if self.battle_mode == 'menu':
+        if self.battle_mode == BATTLE_MODE_MENU:
             if self.ui.is_submenu_active():
-                hint = font.render("Z - выбрать, X - назад", True, (150, 150, 150))
+                hint = _render_text(font, "Z - выбрать, X - назад", (150, 150, 150))
             else:
-                hint = font.render("←→ - выбор, Z - подтвердить", True, (150, 150, 150))
-        elif self.battle_mode == 'fight_attack':
-            hint = font.render("Z - атаковать в нужный момент!", True, COLOR_YELLOW)
-        elif self.battle_mode == 'warmup':
-            hint = font.render("Займите позицию! Используйте стрелки для движения", True, (100, 255, 100))
+                hint = _render_text(font, "←→ - выбор, Z - подтвердить", (150, 150, 150))
+        elif self.battle_mode == BATTLE_MODE_FIGHT_ATTACK:
+            hint = _render_text(font, "Z - атаковать в нужный момент!", COLOR_YELLOW)
+        elif self.battle_mode == BATTLE_MODE_WARMUP:
+            hint = _render_text(font, "Займите позицию! Используйте стрелки для движения", (100, 255, 100))
         else:
-            hint = font.render("Уклоняйся от атак!", True, (150, 150, 150))
+            hint = _render_text(font, "Уклоняйся от атак!", (150, 150, 150))
         
         surface.blit(hint, (10, self.screen_height - 25))
     
     def _draw_pattern_info(self, surface: pygame.Surface) -> None:
         """Отрисовка информации о текущем паттерне атаки."""
-        font = pygame.font.Font(None, 20)
+        font = self.small_font
         
         # Название текущего паттерна
         pattern_name = self.attack_manager.get_current_pattern_name()
@@ -923,25 +1174,24 @@ class Battle:
         remaining_text = f"Осталось атак: {remaining}"
         
         # Отрисовка
-        text1 = font.render(info_text, True, COLOR_YELLOW)
-        text2 = font.render(remaining_text, True, (150, 150, 150))
+        text1 = _render_text(font, info_text, COLOR_YELLOW)
+        text2 = _render_text(font, remaining_text, (150, 150, 150))
         
-        surface.blit(text1, (self.box_x, self.box_y - 20))
-        surface.blit(text2, (self.box_x + self.box_rect.width - text2.get_width(), self.box_y - 20))
+        surface.blits((
+            (text1, (self.box_x, self.box_y - 20)),
+            (text2, (self.box_x + self.box_rect.width - text2.get_width(), self.box_y - 20)),
+        ), doreturn=False)
     
     def reset(self) -> None:
         """Сброс состояния боя."""
-        self.bullets.empty()
+        self.bullets.release_all()
         self.attack_manager.reset()
-        self.battle_mode = 'menu'
+        self.battle_mode = BATTLE_MODE_MENU
         self.ui.close_submenu()
         self.fight_bar_active = False
         self.show_phase2_message = False
-        self.phase2_message_timer = 0
         self.safety_pause_active = False
-        self.safety_pause_timer = 0
         self.warmup_active = False
-        self.warmup_timer = 0
     
     def get_box_rect(self) -> pygame.Rect:
         """Получение прямоугольника рамки боя."""
@@ -961,6 +1211,13 @@ class Battle:
         return self.ui.get_selected_item_index()
 
 
+# Состояния, в которых сообщение не отображается
+_NO_MESSAGE_STATES = frozenset((STATE_GAME_OVER, STATE_MENU, STATE_MAIN_MENU))
+
+# Состояния без анимации: экран меняется только после событий
+_STATIC_STATES = frozenset((STATE_GAME_OVER, STATE_MENU))
+
+
 class GameManager:
     """
     Менеджер состояний игры.
@@ -1014,9 +1271,38 @@ class GameManager:
         self.message = None
         self.message_timer = 0
         
+        # Готовое окно сообщения и его позиция на экране
+        self.message_surface = None
+        self.message_pos = (0, 0)
+        
+        # Готовый экран Game Over; ключ - наличие сохранения (меняет подсказки)
+        self.game_over_surface = None
+        self.game_over_key = None
+        
+        # Задержка перед возвратом в мир после победы (в кадрах, 0 - не идёт)
+        self._victory_timer = 0
+        
+        # Перерисовка статичных экранов: флаг событий и последнее отрисованное состояние
+        self.redraw_needed = True
+        self.drawn_state = None
+        
         # Флаг: игра инициализирована
         self.game_initialized = False
         
+        # Шрифты (создаются один раз, а не в каждом кадре)
+        self.font = pygame.font.Font(None, 24)           # Подсказки и сообщения
+        self.title_font = pygame.font.Font(None, 72)     # Заголовок Game Over
+        self.small_font = pygame.font.Font(None, 32)     # Подсказки Game Over
+        
+        # Обработчики нажатия клавиш по состояниям игры
+        self.key_handlers = {
+            STATE_MAIN_MENU: self._on_key_main_menu,
+            STATE_GAME_OVER: self._on_key_game_over,
+            STATE_MENU: self._on_key_menu,
+            STATE_OVERWORLD: self._on_key_overworld,
+            STATE_BATTLE: self._on_key_battle,
+        }
+        
         # Проверяем наличие сохранения для меню
         self.main_menu.check_save(self.save_manager)
         self.pause_menu.check_save(self.save_manager)
@@ -1030,37 +1316,29 @@ class GameManager:
         # Получаем стены, врагов и переходы с текущей карты
         walls = self.map_manager.get_walls()
         enemies = self.map_manager.enemies
-        transitions = self.map_manager.transitions
+        transition_rects = self.map_manager.transition_rects
         
         # Размеры карты в тайлах
         map_width = 25  # тайлов
         map_height = 15  # тайлов
         
+        # Занятые тайлы: все тайлы, которые пересекает стена, враг или переход.
+        # Строится один раз, после чего проверка позиции - поиск в множестве
+        blocking_rects = list(walls)
+        blocking_rects.extend(enemy.get_rect() for enemy in enemies)
+        blocking_rects.extend(transition_rects)
+        
+        occupied = set()
+        for rect in blocking_rects:
+            if rect.width <= 0 or rect.height <= 0:
+                continue
+            for tile_y in range(rect.top // TILE_SIZE, (rect.bottom - 1) // TILE_SIZE + 1):
+                for tile_x in range(rect.left // TILE_SIZE, (rect.right - 1) // TILE_SIZE + 1):
+                    occupied.add((tile_x, tile_y))
+        
         # Функция проверки, свободна ли позиция
         def is_position_free(tile_x: int, tile_y: int) -> bool:
-            item_rect = pygame.Rect(
-                tile_x * TILE_SIZE,
-                tile_y * TILE_SIZE,
-                TILE_SIZE,
-                TILE_SIZE
-            )
-            
-            # Проверка столкновения со стенами
-            for wall in walls:
-                if item_rect.colliderect(wall):
-                    return False
-            
-            # Проверка столкновения с врагами
-            for enemy in enemies:
-                if item_rect.colliderect(enemy.get_rect()):
-                    return False
-            
-            # Проверка столкновения с переходами
-            for trans_rect, _, _ in transitions:
-                if item_rect.colliderect(trans_rect):
-                    return False
-            
-            return True
+            return (tile_x, tile_y) not in occupied
         
         # Список предметов для размещения с предпочтительными позициями
         items_to_place = [
@@ -1100,49 +1378,60 @@ class GameManager:
         Аргументы:
             event: Событие Pygame
         """
+        # Любое событие (нажатие, смена окна) может изменить экран
+        self.redraw_needed = True
+        
         if event.type == pygame.KEYDOWN:
-            # Обработка главного меню
-            if self.state == STATE_MAIN_MENU:
-                result = self.main_menu.handle_input(event.key)
-                if result:
-                    self._process_main_menu_result(result)
-                return
-            
-            # Обработка состояния GAME_OVER
-            if self.state == STATE_GAME_OVER:
-                if event.key == pygame.K_r:
-                    self.restart_game()  # Загрузка сохранения или начало заново
-                elif event.key == pygame.K_n:
-                    self._restart_from_beginning()  # Начать заново
-                elif event.key == pygame.K_ESCAPE:
-                    pygame.event.post(pygame.event.Event(pygame.QUIT))
-                return
-
-            # Обработка состояния MENU
-            if self.state == STATE_MENU:
-                result = self.pause_menu.handle_input(event.key)
-                if result:
-                    self._process_menu_result(result)
-                return
+            # Обработчик нажатия для текущего состояния (таблица key_handlers)
+            handler = self.key_handlers.get(self.state)
+            if handler:
+                handler(event.key)
+    
+    def _on_key_main_menu(self, key: int) -> None:
+        """Обработка нажатия в главном меню."""
+        result = self.main_menu.handle_input(key)
+        if result:
+            self._process_main_menu_result(result)
+    
+    def _on_key_game_over(self, key: int) -> None:
+        """Обработка нажатия на экране GAME_OVER."""
+        if key == pygame.K_r:
+            self.restart_game()  # Загрузка сохранения или начало заново
+        elif key == pygame.K_n:
+            self._restart_from_beginning()  # Начать заново
+        elif key == pygame.K_ESCAPE:
+            pygame.event.post(pygame.event.Event(pygame.QUIT))
+    
+    def _on_key_menu(self, key: int) -> None:
+        """Обработка нажатия в меню паузы."""
+        result = self.pause_menu.handle_input(key)
+        if result:
+            self._process_menu_result(result)
+    
+    def _on_key_overworld(self, key: int) -> None:
+        """Обработка нажатия в мире (остальное управление - по состоянию клавиш в update)."""
+        # Открытие меню паузы по ESC
+        if key == pygame.K_ESCAPE:
+            self.switch_to_menu()
+    
+    def _on_key_battle(self, key: int) -> None:
+        """Обработка нажатия в бою."""
+        # Открытие меню паузы по ESC
+        if key == pygame.K_ESCAPE:
+            self.switch_to_menu()
+            return
         
-            # Открытие меню паузы по ESC
-            if event.key == pygame.K_ESCAPE:
-                if self.state in (STATE_OVERWORLD, STATE_BATTLE):
-                    self.switch_to_menu()
-                return
-
-            if self.state == STATE_BATTLE:
-                # Если показывается сообщение, закрываем его по нажатию Z или X
-                if self.message and self.message_timer > 0:
-                    if event.key == pygame.K_z or event.key == pygame.K_x:
-                        self.message = None
-                        self.message_timer = 0
-                    return
-                
-                # Обычная обработка ввода в бою
-                result = self.battle.handle_input(event.key)
-                if result:
-                    self._process_battle_result(result)
+        # Если показывается сообщение, закрываем его по нажатию Z или X
+        if self.message and self.message_timer > 0:
+            if key == pygame.K_z or key == pygame.K_x:
+                self.message = None
+                self.message_timer = 0
+            return
+        
+        # Обычная обработка ввода в бою
+        result = self.battle.handle_input(key)
+        if result:
+            self._process_battle_result(result)
     
     def _process_main_menu_result(self, result: str) -> None:
         """Обработка результата выбора в главном меню."""
@@ -1310,6 +1599,7 @@ class GameManager:
         """
         self.message = text
         self.message_timer = duration
+        self._build_message_surface(text)
     
     def update(self, keys: pygame.key.ScancodeWrapper) -> None:
         """
@@ -1324,6 +1614,9 @@ class GameManager:
             if self.message_timer == 0:
                 self.message = None
         
+        # Плавное затухание музыки (во всех состояниях игры)
+        self.audio_manager.update()
+        
         if self.state == STATE_MAIN_MENU:
             self.main_menu.update()
         elif self.state == STATE_OVERWORLD:
@@ -1335,7 +1628,7 @@ class GameManager:
     def _update_overworld(self, keys: pygame.key.ScancodeWrapper) -> None:
         """Обновление в режиме мира."""
         # Перемещение игрока
-        self.player.handle_overworld_input(keys, self.map_manager.get_walls())
+        self.player.handle_overworld_input(keys, self.map_manager.wall_tiles)
         
         # Обновление предметов
         for item in self.pickup_items:
@@ -1344,16 +1637,18 @@ class GameManager:
         # Обновление точек сохранения (анимация)
         self.map_manager.update_save_points()
         
-        # Проверка столкновения с предметами (Z для подбора)
+        # Проверка столкновения с предметами (Z для подбора).
+        # Без нажатия Z подбирать нечего, поэтому проверка выполняется только с ним:
+        # все задетые предметы находятся одним вызовом collidelistall
         player_rect = self.player.get_overworld_rect()
-        for item in self.pickup_items:
-            if item.check_collision(player_rect):
-                # Проверяем нажатие Z
-                if keys[pygame.K_z]:
-                    item_data = item.collect()
-                    if item_data:
-                        self.player.add_item(item_data)
-                        self.show_message(f"Вы подобрали {item_data['name']}!")
+        if keys[pygame.K_z] and self.pickup_items:
+            item_rects = [item.rect for item in self.pickup_items]
+            for index in player_rect.collidelistall(item_rects):
+                # collect() возвращает None для уже собранного предмета
+                item_data = self.pickup_items[index].collect()
+                if item_data:
+                    self.player.add_item(item_data)
+                    self.show_message(f"Вы подобрали {item_data['name']}!")
         
         # Проверка столкновения с точкой сохранения
         save_point = self.map_manager.check_save_point_collision(player_rect)
@@ -1398,36 +1693,41 @@ class GameManager:
     
     def _update_battle(self, keys: pygame.key.ScancodeWrapper) -> None:
         """Обновление в режиме боя."""
+        player = self.player
+        
         # Обновление неуязвимости
-        self.player.update_invulnerability()
+        player.update_invulnerability()
         
         # Проверка таймера победы
-        if hasattr(self, '_victory_timer') and self._victory_timer > 0:
+        if self._victory_timer > 0:
             self._victory_timer -= 1
             if self._victory_timer <= 0:
                 self._handle_enemy_victory()
                 return
         
+        battle = self.battle
+        
         # Перемещение игрока в бою (в режиме уклонения или разминки)
-        if self.battle.can_player_move():
-            self.player.handle_battle_input(keys)
+        if battle.can_player_move():
+            player.handle_battle_input(keys)
         
             # Применение гравитационной силы от аномалий (только в dodge)
-            if self.battle.battle_mode == 'dodge' and self.battle.attack_manager.is_gravity_mode():
-                player_x, player_y = self.player.get_battle_position()
-                force_x, force_y = self.battle.attack_manager.get_gravity_force(player_x, player_y)
-                self.player.apply_gravity_force(force_x, force_y)
+            attack_manager = battle.attack_manager
+            if battle.battle_mode == BATTLE_MODE_DODGE and attack_manager.is_gravity_mode():
+                player_x, player_y = player.get_battle_position()
+                force_x, force_y = attack_manager.get_gravity_force(player_x, player_y)
+                player.apply_gravity_force(force_x, force_y)
         
-        # Обновление боя
-        player_x, player_y = self.player.get_battle_position()
-        self.battle.update(player_x, player_y)
+        # Обновление боя (позиция берётся после гравитации, поэтому запрашивается заново)
+        player_x, player_y = player.get_battle_position()
+        battle.update(player_x, player_y)
         
         # Проверка столкновений (только в режиме dodge)
-        if self.battle.battle_mode == 'dodge':
-            self.battle.check_collisions(self.player.get_battle_rect(), self.player)
+        if battle.battle_mode == BATTLE_MODE_DODGE:
+            battle.check_collisions(player.get_battle_rect(), player)
     
         # Проверка смерти игрока
-        if not self.player.is_alive():
+        if not player.is_alive():
             self.switch_to_game_over()
     
     def draw(self, surface: pygame.Surface) -> None:
@@ -1450,8 +1750,23 @@ class GameManager:
             self.pause_menu.draw(surface)
         
         # Отрисовка сообщения (не в game over, menu и main menu)
-        if self.message and self.state not in (STATE_GAME_OVER, STATE_MENU, STATE_MAIN_MENU):
+        if self.message and self.state not in _NO_MESSAGE_STATES:
             self._draw_message(surface)
+        
+        self.redraw_needed = False
+        self.drawn_state = self.state
+    
+    def needs_redraw(self) -> bool:
+        """
+        Проверка, нужно ли перерисовывать экран в этом кадре.
+        Экраны Game Over и паузы без событий не меняются.
+        
+        Возвращает:
+            bool: True если кадр нужно отрисовать
+        """
+        return (self.redraw_needed
+                or self.state not in _STATIC_STATES
+                or self.state != self.drawn_state)
     
     def _draw_overworld(self, surface: pygame.Surface) -> None:
         """Отрисовка в режиме мира."""
@@ -1467,8 +1782,7 @@ class GameManager:
         self.player.draw_overworld(surface)
         
         # Подсказка
-        font = pygame.font.Font(None, 24)
-        hint = font.render("Зелёные - переходы, синие - враги, золото - сохранение, Z - взаимодействовать, ESC - меню", True, (150, 150, 150))
+        hint = _render_text(self.font, "Зелёные - переходы, синие - враги, золото - сохранение, Z - взаимодействовать, ESC - меню", (150, 150, 150))
         surface.blit(hint, (10, self.screen_height - 30))
     
     def _draw_battle(self, surface: pygame.Surface) -> None:
@@ -1476,26 +1790,35 @@ class GameManager:
         self.battle.draw(surface, self.player)
     
     def _draw_message(self, surface: pygame.Surface) -> None:
-        """Отрисовка сообщения."""
-        font = pygame.font.Font(None, 24)
+        """Отрисовка сообщения (окно собрано заранее в show_message)."""
+        surface.blit(self.message_surface, self.message_pos)
+    
+    def _build_message_surface(self, text: str) -> None:
+        """
+        Отрисовка окна сообщения (фон, рамка, строки текста) на отдельную поверхность.
+        
+        Аргументы:
+            text: Текст сообщения (строки разделены '\n')
+        """
+        font = self.font
         
         # Фон для сообщения
-        lines = self.message.split('\n')
+        lines = text.split('\n')
         max_width = max(font.size(line)[0] for line in lines)
         height = len(lines) * 25 + 20
         
-        msg_x = (self.screen_width - max_width - 40) // 2
-        msg_y = self.screen_height - 160
+        message_surface = pygame.Surface((max_width + 40, height)).convert()
         
         # Рамка сообщения
-        msg_rect = pygame.Rect(msg_x, msg_y, max_width + 40, height)
-        pygame.draw.rect(surface, COLOR_BLACK, msg_rect)
-        pygame.draw.rect(surface, COLOR_WHITE, msg_rect, 2)
+        message_surface.fill(COLOR_BLACK)
+        pygame.draw.rect(message_surface, COLOR_WHITE, message_surface.get_rect(), 2)
         
         # Текст
         for i, line in enumerate(lines):
-            text = font.render(line, True, COLOR_WHITE)
-            surface.blit(text, (msg_x + 20, msg_y + 10 + i * 25))
+            message_surface.blit(_render_text(font, line, COLOR_WHITE), (20, 10 + i * 25))
+        
+        self.message_surface = message_surface
+        self.message_pos = ((self.screen_width - max_width - 40) // 2, self.screen_height - 160)
     
     def switch_to_battle(self, enemy: Enemy) -> None:
         """
@@ -1558,39 +1881,61 @@ class GameManager:
         else:
             self.state = STATE_OVERWORLD
         self.previous_state = None
+        
+        # Бой не обновлялся, пока было открыто меню
+        if self.state == STATE_BATTLE:
+            self.battle.reset_ticks()
     
     def _draw_game_over(self, surface: pygame.Surface) -> None:
-        """Отрисовка экрана Game Over."""
+        """Отрисовка экрана Game Over (перерисовывается только при смене наличия сохранения)."""
+        has_save = self.save_manager.has_saved_game()
+        if has_save != self.game_over_key:
+            self._build_game_over_surface(has_save)
+            self.game_over_key = has_save
+        surface.blit(self.game_over_surface, (0, 0))
+    
+    def _build_game_over_surface(self, has_save: bool) -> None:
+        """
+        Отрисовка экрана Game Over на отдельную поверхность.
+        
+        Аргументы:
+            has_save: Есть ли сохранение (определяет подсказки)
+        """
+        surface = pygame.Surface((self.screen_width, self.screen_height)).convert()
+        self.game_over_surface = surface
+        
         # Чёрный фон
         surface.fill(COLOR_BLACK)
         
         # Большой шрифт для заголовка
-        title_font = pygame.font.Font(None, 72)
-        small_font = pygame.font.Font(None, 32)
+        title_font = self.title_font
+        small_font = self.small_font
         
         # Заголовок GAME OVER
-        title = title_font.render("GAME OVER", True, COLOR_RED)
+        title = _render_text(title_font, "GAME OVER", COLOR_RED)
         title_x = (self.screen_width - title.get_width()) // 2
         title_y = self.screen_height // 2 - 80
-        surface.blit(title, (title_x, title_y))
         
         # Подсказки
-        if self.save_manager.has_saved_game():
-            hint1 = small_font.render("Нажмите R - загрузить последнее сохранение", True, COLOR_WHITE)
-            hint2 = small_font.render("Нажмите N - начать заново", True, (150, 150, 150))
+        if has_save:
+            hint1 = _render_text(small_font, "Нажмите R - загрузить последнее сохранение", COLOR_WHITE)
+            hint2 = _render_text(small_font, "Нажмите N - начать заново", (150, 150, 150))
         else:
-            hint1 = small_font.render("Нажмите R для перезапуска", True, COLOR_WHITE)
-            hint2 = small_font.render("Сохранение не найдено", True, (150, 150, 150))
+            hint1 = _render_text(small_font, "Нажмите R для перезапуска", COLOR_WHITE)
+            hint2 = _render_text(small_font, "Сохранение не найдено", (150, 150, 150))
         
-        hint3 = small_font.render("Нажмите ESC для выхода", True, (150, 150, 150))
+        hint3 = _render_text(small_font, "Нажмите ESC для выхода", (150, 150, 150))
         
         hint1_x = (self.screen_width - hint1.get_width()) // 2
         hint2_x = (self.screen_width - hint2.get_width()) // 2
         hint3_x = (self.screen_width - hint3.get_width()) // 2
         
-        surface.blit(hint1, (hint1_x, self.screen_height // 2 + 10))
-        surface.blit(hint2, (hint2_x, self.screen_height // 2 + 45))
-        surface.blit(hint3, (hint3_x, self.screen_height // 2 + 80))
+        surface.blits((
+            (title, (title_x, title_y)),
+            (hint1, (hint1_x, self.screen_height // 2 + 10)),
+            (hint2, (hint2_x, self.screen_height // 2 + 45)),
+            (hint3, (hint3_x, self.screen_height // 2 + 80))
+        ), doreturn=False)
     
     def restart_game(self) -> None:
         """Перезапуск игры после Game Over (загрузка последнего сохранения)."""
@@ -1686,10 +2031,8 @@ class GameManager:
         self.player.hp = save_data.player_hp
         self.player.max_hp = save_data.player_max_hp
         
-        # Восстанавливаем инвентарь
-        self.player.inventory = []
-        for item_data in save_data.inventory:
-            self.player.add_item(item_data)
+        # Восстанавливаем инвентарь (пустые записи отбрасываются, как в add_item)
+        self.player.inventory = [item_data for item_data in save_data.inventory if item_data]
         
         # Сбрасываем состояние боя
         self.battle.reset()
@@ -5,15 +5,27 @@
 
 import json
 import os
+import queue
+import threading
 from core.settings import SAVE_FILE_NAME, PLAYER_MAX_HP
 
 
+# Компактный JSON без отступов: меньше символов для записи и разбора
+_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'))
+_DECODER = json.JSONDecoder()
+
+
 class SaveData:
     """
     Класс данных сохранения.
     Содержит всю информацию о состоянии игры.
     """
     
+    __slots__ = (
+        'location_id', 'player_x', 'player_y', 'player_hp', 'player_max_hp',
+        'inventory', 'defeated_enemies', 'current_map'
+    )
+    
     def __init__(self):
         """Инициализация данных сохранения."""
         self.location_id = 1
@@ -60,13 +72,27 @@ class SaveManager:
         """Инициализация менеджера сохранений."""
         self.save_file = SAVE_FILE_NAME
         self.save_data = SaveData()
-        self.has_save = False
+        
+        # Наличие сохранения проверяется на диске один раз, дальше флаг
+        # поддерживают save_game/load_game/delete_save (см. refresh)
+        self.has_save = os.path.exists(self.save_file)
+        
+        # Краткая информация о сохранении (заполняется при сохранении/загрузке)
+        self.save_info = None
+        
+        # Запись файла (write/fsync/replace) выполняется в фоновом потоке,
+        # чтобы не задерживать игровой цикл; задачи - готовые байты сохранения
+        self.write_queue = queue.Queue()
+        # Результаты записей (True - записано), применяются в основном потоке
+        self.write_results = queue.Queue()
+        self.writer = threading.Thread(target=self._writer_loop, name='save-writer', daemon=True)
+        self.writer.start()
     
     def save_game(self, location_id: int, player_x: float, player_y: float,
                   player_hp: int, player_max_hp: int, inventory: list,
                   defeated_enemies: list = None, current_map: str = 'start') -> bool:
         """
-        Сохранение игры.
+        Сохранение игры (данные кодируются сразу, файл пишется в фоне).
         
         Аргументы:
             location_id: Номер локации
@@ -79,7 +105,7 @@ class SaveManager:
             current_map: Имя текущей карты
             
         Возвращает:
-            bool: True если сохранение успешно
+            bool: True если данные сохранения подготовлены к записи
         """
         try:
             self.save_data.location_id = location_id
@@ -87,19 +113,71 @@ class SaveManager:
             self.save_data.player_y = player_y
             self.save_data.player_hp = player_hp
             self.save_data.player_max_hp = player_max_hp
-            self.save_data.inventory = inventory.copy() if inventory else []
-            self.save_data.defeated_enemies = defeated_enemies.copy() if defeated_enemies else []
+            # Списки не копируются: ниже они сразу кодируются в байты,
+            # и дальнейшие изменения инвентаря на сохранение уже не влияют
+            self.save_data.inventory = inventory or []
+            self.save_data.defeated_enemies = defeated_enemies or []
             self.save_data.current_map = current_map
             
-            # Запись в файл
-            with open(self.save_file, 'w', encoding='utf-8') as f:
-                json.dump(self.save_data.to_dict(), f, indent=2, ensure_ascii=False)
+            # Строка кодируется целиком здесь (снимок текущих данных),
+            # а запись файла передаётся фоновому потоку
+            payload = _ENCODER.encode(self.save_data.to_dict()).encode('utf-8')
             
+            # Флаги выставляются сразу; результат записи применит _apply_write_results
             self.has_save = True
+            self.save_info = self._build_save_info(self.save_data)
+            self.write_queue.put(payload)
             return True
-        except (IOError, json.JSONEncodeError):
+        except (TypeError, ValueError):
             return False
     
+    def _writer_loop(self) -> None:
+        """Цикл фонового потока записи: сохранения пишутся по порядку."""
+        while True:
+            payload = self.write_queue.get()
+            try:
+                self._write_file(payload)
+                self.write_results.put(True)
+            except OSError:
+                self.write_results.put(False)
+            finally:
+                self.write_queue.task_done()
+    
+    def _write_file(self, payload: bytes) -> None:
+        """
+        Запись сохранения на диск.
+        Байты пишутся одним вызовом во временный файл, который затем атомарно
+        заменяет сохранение: при сбое во время записи прежнее сохранение остаётся целым.
+        
+        Аргументы:
+            payload: Закодированные данные сохранения
+        """
+        tmp_file = self.save_file + '.tmp'
+        with open(tmp_file, 'wb') as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, self.save_file)
+    
+    def flush(self) -> None:
+        """Ожидание завершения всех запланированных записей."""
+        self.write_queue.join()
+        self._apply_write_results()
+    
+    def _apply_write_results(self) -> None:
+        """Применение результатов завершённых записей к флагам сохранения."""
+        try:
+            while True:
+                if self.write_results.get_nowait():
+                    self.has_save = True
+                else:
+                    # Сохранение не записано: меню не должно предлагать загрузку
+                    # несуществующего файла, а информация читается с диска заново
+                    self.has_save = os.path.exists(self.save_file)
+                    self.save_info = None
+        except queue.Empty:
+            pass
+    
     def load_game(self) -> SaveData:
         """
         Загрузка игры.
@@ -107,30 +185,52 @@ class SaveManager:
         Возвращает:
             SaveData: Данные сохранения или None
         """
+        # Файл должен содержать последнее сохранение
+        self.flush()
+        
         try:
             if not os.path.exists(self.save_file):
+                self.has_save = False
                 return None
             
-            with open(self.save_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(self.save_file, 'rb') as f:
+                data = _DECODER.decode(f.read().decode('utf-8'))
             
             self.save_data.from_dict(data)
             self.has_save = True
+            self.save_info = self._build_save_info(self.save_data)
             return self.save_data
-        except (IOError, json.JSONDecodeError, KeyError):
+        except (OSError, UnicodeDecodeError, json.JSONDecodeError, KeyError):
             return None
     
     def has_saved_game(self) -> bool:
-        """Проверка наличия сохранения."""
-        return os.path.exists(self.save_file)
+        """Проверка наличия сохранения (без обращения к диску)."""
+        self._apply_write_results()
+        return self.has_save
+    
+    def refresh(self) -> bool:
+        """
+        Повторная проверка наличия файла сохранения на диске
+        (если файл мог измениться вне игры).
+        
+        Возвращает:
+            bool: True если сохранение есть
+        """
+        self.flush()
+        self.has_save = os.path.exists(self.save_file)
+        return self.has_save
     
     def delete_save(self) -> bool:
         """Удаление сохранения."""
+        # Иначе отложенная запись вернёт удалённый файл
+        self.flush()
+        
         try:
             if os.path.exists(self.save_file):
                 os.remove(self.save_file)
             self.has_save = False
             self.save_data = SaveData()
+            self.save_info = None
             return True
         except IOError:
             return False
@@ -145,10 +245,23 @@ class SaveManager:
         if not self.has_saved_game():
             return None
         
-        data = self.load_game()
-        if data is None:
-            return None
+        # Файл читается только если информация ещё не известна
+        if self.save_info is None:
+            self.load_game()
         
+        return self.save_info
+    
+    @staticmethod
+    def _build_save_info(data: SaveData) -> dict:
+        """
+        Сборка краткой информации о сохранении.
+        
+        Аргументы:
+            data: Данные сохранения
+            
+        Возвращает:
+            dict: Информация о сохранении
+        """
         return {
             'location': data.location_id,
             'map': data.current_map,
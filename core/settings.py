@@ -152,21 +152,26 @@ SPAWN_RATE_MULT = 1.2               # Множитель частоты спав
 # Время между сменой паттернов (в кадрах, 60 кадров = 1 секунда)
 PATTERN_SWITCH_TIME = 300           # 5 секунд
 
+# Фиксированный шаг логики атак (не зависит от частоты отрисовки FPS).
+# Все длительности и интервалы атак ниже заданы в шагах логики при этой частоте.
+BATTLE_TICK_RATE = 60               # Шагов логики атак в секунду
+BATTLE_MAX_TICKS_PER_FRAME = 3      # Максимум шагов за кадр (защита от "спирали смерти")
+
 # Настройки новой системы раундов
 PATTERNS_PER_ROUND = 3              # Количество паттернов в одном раунде
-ATTACK_DURATION = 420               # Длительность одной атаки в кадрах (10 секунды)
+ATTACK_DURATION = 420               # Длительность одной атаки в шагах логики (7 секунд)
 GAP_BETWEEN_ATTACKS = 30           # Пауза между паттернами в очереди (0.5 секунды)
 
 # Паттерн "Line Rain" - дождь из линий сверху
-LINE_RAIN_INTERVAL = 24             # Кадров между спавном линий
+LINE_RAIN_INTERVAL = 24             # Шагов логики между спавном линий
 LINE_RAIN_BULLET_COUNT = 5          # Количество линий за один спавн
 
 # Паттерн "Circle Burst" - круговой взрыв из центра
 CIRCLE_BURST_COUNT = 15             # Количество снарядов в круге
-CIRCLE_BURST_INTERVAL = 90          # Кадров между взрывами
+CIRCLE_BURST_INTERVAL = 90          # Шагов логики между взрывами
 
 # Паттерн "Targeting" - снаряды летят к игроку
-TARGETING_INTERVAL = 40             # Кадров между выстрелами
+TARGETING_INTERVAL = 40             # Шагов логики между выстрелами
 TARGETING_BULLETS_PER_SHOT = 3      # Снарядов за выстрел
 
 # ============================================================================
@@ -179,6 +184,17 @@ STATE_BATTLE = 'BATTLE'
 STATE_GAME_OVER = 'GAME_OVER'
 STATE_MENU = 'MENU'                 # Меню паузы
 
+# ============================================================================
+# РЕЖИМЫ БОЯ
+# ============================================================================
+
+# Целые числа: режим сравнивается в каждом кадре
+BATTLE_MODE_MENU = 0                # Меню кнопок (FIGHT/ACT/ITEM/MERCY)
+BATTLE_MODE_DODGE = 1               # Уклонение от атак врага
+BATTLE_MODE_FIGHT_ATTACK = 2        # Мини-игра атаки игрока
+BATTLE_MODE_SAFETY_PAUSE = 3        # Пауза перед атакой врага
+BATTLE_MODE_WARMUP = 4              # Разминка (можно двигаться)
+
 # ============================================================================
 # НАСТРОЙКИ МЕНЮ
 # ============================================================================
@@ -221,6 +237,10 @@ MUSIC_GAME_OVER = "assets/music/game_over.mp3"
 MUSIC_FADEOUT_TIME = 500    # Время затухания в миллисекундах
 MUSIC_VOLUME = 0.6          # Громкость музыки (0.0 - 1.0)
 
+# Параметры аудио миксера
+AUDIO_FREQUENCY = 44100     # Частота дискретизации
+AUDIO_BUFFER_SIZE = 4096    # Размер буфера (~93 мс при 44100 Гц; защищает от прерываний звука)
+
 # ============================================================================
 # СИСТЕМА СОХРАНЕНИЙ
 # ============================================================================
@@ -3,10 +3,48 @@
 Содержит класс PickupItem для подбираемых предметов в мире.
 """
 
+import functools
+import math
+
 import pygame
 from core.settings import COLOR_YELLOW, TILE_SIZE
 
 
+# Пульсация предмета: |sin(t * 0.1)| * 3, сразу в целых пикселях.
+# 63 кадра почти ровно равны двум периодам |sin| (20π ≈ 62.8), поэтому
+# таблица повторяется без заметного скачка
+_PULSE_PERIOD = 63
+_PULSE_LUT = tuple(int(abs(math.sin(i * 0.1)) * 3) for i in range(_PULSE_PERIOD))
+
+
+@functools.lru_cache(maxsize=32)
+def _item_sprite(color: tuple, size: int) -> pygame.Surface:
+    """
+    Получение готового изображения предмета (круг, обводка и блик).
+    Рисуется примитивами один раз для каждого цвета и размера пульсации.
+    
+    Аргументы:
+        color: Цвет предмета
+        size: Текущий размер предмета с учётом пульсации
+        
+    Возвращает:
+        pygame.Surface: Прозрачная поверхность со стороной 2 * (size // 2) + 1,
+        центр круга - в её центре
+    """
+    radius = size // 2
+    surface = pygame.Surface((radius * 2 + 1, radius * 2 + 1), pygame.SRCALPHA)
+    center = (radius, radius)
+    
+    # Круг и обводка
+    pygame.draw.circle(surface, color, center, radius)
+    pygame.draw.circle(surface, (255, 255, 255), center, radius, 1)
+    
+    # Блик
+    highlight_pos = (radius - size // 6, radius - size // 6)
+    pygame.draw.circle(surface, (255, 255, 255), highlight_pos, size // 6)
+    return surface.convert_alpha()
+
+
 class ItemData:
     """
     Данные о предмете (тип и свойства).
@@ -59,6 +97,8 @@ class PickupItem:
     При контакте с игроком и нажатии Z предмет попадает в инвентарь.
     """
     
+    __slots__ = ('x', 'y', 'item_type', 'data', 'size', 'rect', 'collected', 'animation_timer')
+    
     def __init__(self, x: float, y: float, item_type: str):
         """
         Инициализация предмета.
@@ -91,7 +131,9 @@ class PickupItem:
         self.animation_timer = 0
     
     def update(self) -> None:
-        """Обновление анимации предмета."""
+        """Обновление анимации предмета (собранный предмет не отрисовывается)."""
+        if self.collected:
+            return
         self.animation_timer += 1
     
     def check_collision(self, player_rect: pygame.Rect) -> bool:
@@ -129,25 +171,15 @@ class PickupItem:
         if self.collected:
             return
         
-        # Пульсация
-        pulse = abs(math.sin(self.animation_timer * 0.1)) * 3
-        size = self.size + int(pulse)
+        # Пульсация (значение из таблицы)
+        size = self.size + _PULSE_LUT[self.animation_timer % _PULSE_PERIOD]
         
         # Цвет предмета
         color = self.data['color'] if self.data else COLOR_YELLOW
         
-        # Рисуем предмет (круг)
-        center_x = self.rect.centerx
-        center_y = self.rect.centery
-        pygame.draw.circle(surface, color, (center_x, center_y), size // 2)
-        
-        # Обводка
-        pygame.draw.circle(surface, (255, 255, 255), (center_x, center_y), size // 2, 1)
-        
-        # Блик
-        highlight_pos = (center_x - size // 6, center_y - size // 6)
-        pygame.draw.circle(surface, (255, 255, 255), highlight_pos, size // 6)
-
-
-# Импорт math для анимации
-import math
+        # Рисуем предмет (круг с обводкой и бликом - готовое изображение)
+        radius = size // 2
+        surface.blit(
+            _item_sprite(color, size),
+            (self.rect.centerx - radius, self.rect.centery - radius)
+        )
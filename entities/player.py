@@ -11,10 +11,41 @@ import pygame
 from core.settings import (
     PLAYER_OVERWORLD_SIZE, PLAYER_OVERWORLD_SPEED, PLAYER_OVERWORLD_COLOR,
     PLAYER_BATTLE_SIZE, PLAYER_BATTLE_SPEED, PLAYER_BATTLE_COLOR,
-    PLAYER_MAX_HP, INVULNERABILITY_TIME
+    PLAYER_MAX_HP, INVULNERABILITY_TIME, TILE_SIZE
 )
 
 
+# Направление по оси по индексу (отрицательная | положительная << 1):
+# при нажатии обеих клавиш побеждает положительная (вниз/вправо)
+_AXIS_DIRECTION = (0, -1, 1, 1)
+
+# Клавиши движения (WASD и стрелки), прочитанные из модуля pygame один раз
+_K_W, _K_UP = pygame.K_w, pygame.K_UP
+_K_S, _K_DOWN = pygame.K_s, pygame.K_DOWN
+_K_A, _K_LEFT = pygame.K_a, pygame.K_LEFT
+_K_D, _K_RIGHT = pygame.K_d, pygame.K_RIGHT
+
+
+def _read_direction(keys: pygame.key.ScancodeWrapper) -> tuple:
+    """
+    Чтение направления движения с клавиатуры (WASD и стрелки).
+    
+    Аргументы:
+        keys: Состояние клавиш клавиатуры
+        
+    Возвращает:
+        tuple: (dx, dy) - направление по осям (-1, 0 или 1)
+    """
+    up = keys[_K_W] or keys[_K_UP]
+    down = keys[_K_S] or keys[_K_DOWN]
+    left = keys[_K_A] or keys[_K_LEFT]
+    right = keys[_K_D] or keys[_K_RIGHT]
+    return (
+        _AXIS_DIRECTION[bool(left) | (bool(right) << 1)],
+        _AXIS_DIRECTION[bool(up) | (bool(down) << 1)]
+    )
+
+
 class Player:
     """
     Класс игрока.
@@ -22,6 +53,12 @@ class Player:
     Управляет позицией, перемещением и отрисовкой персонажа.
     """
     
+    __slots__ = (
+        'overworld_x', 'overworld_y', 'overworld_size', 'overworld_speed', 'overworld_rect',
+        'battle_x', 'battle_y', 'battle_size', 'battle_speed', 'battle_rect', 'battle_box',
+        'hp', 'max_hp', 'invulnerability_timer', 'inventory'
+    )
+    
     def __init__(self, x: float, y: float):
         """
         Инициализация игрока.
@@ -68,48 +105,62 @@ class Player:
     # ========================================================================
     
     def handle_overworld_input(self, keys: pygame.key.ScancodeWrapper, 
-                                walls: list) -> None:
+                                wall_tiles: set) -> None:
         """
         Обработка ввода для режима мира.
         Проверяет коллизии со стенами перед перемещением.
         
         Аргументы:
             keys: Состояние клавиш клавиатуры
-            walls: Список прямоугольников стен
+            wall_tiles: Множество координат (x, y) тайлов стен
         """
-        dx, dy = 0, 0
-        
         # Проверка нажатых клавиш (WASD и стрелки)
-        if keys[pygame.K_w] or keys[pygame.K_UP]:
-            dy = -self.overworld_speed
-        if keys[pygame.K_s] or keys[pygame.K_DOWN]:
-            dy = self.overworld_speed
-        if keys[pygame.K_a] or keys[pygame.K_LEFT]:
-            dx = -self.overworld_speed
-        if keys[pygame.K_d] or keys[pygame.K_RIGHT]:
-            dx = self.overworld_speed
+        dx, dy = _read_direction(keys)
+        
+        # Без движения позиция и прямоугольник не меняются
+        if not dx and not dy:
+            return
+        
+        speed = self.overworld_speed
+        dx *= speed
+        dy *= speed
         
         # Проверка коллизии по оси X
-        new_rect = pygame.Rect(
-            self.overworld_x + dx, self.overworld_y,
-            self.overworld_size, self.overworld_size
-        )
-        if not any(new_rect.colliderect(wall) for wall in walls):
+        # (стены выровнены по тайлам: проверяются только тайлы под новой позицией)
+        if dx and not self._hits_wall(self.overworld_x + dx, self.overworld_y, wall_tiles):
             self.overworld_x += dx
         
         # Проверка коллизии по оси Y
-        new_rect = pygame.Rect(
-            self.overworld_x, self.overworld_y + dy,
-            self.overworld_size, self.overworld_size
-        )
-        if not any(new_rect.colliderect(wall) for wall in walls):
+        if dy and not self._hits_wall(self.overworld_x, self.overworld_y + dy, wall_tiles):
             self.overworld_y += dy
         
-        # Обновление прямоугольника коллизии
-        self.overworld_rect = pygame.Rect(
-            self.overworld_x, self.overworld_y,
-            self.overworld_size, self.overworld_size
-        )
+        # Обновление прямоугольника коллизии (на месте, без нового объекта Rect)
+        self.overworld_rect.topleft = (self.overworld_x, self.overworld_y)
+    
+    def _hits_wall(self, x: float, y: float, wall_tiles: set) -> bool:
+        """
+        Проверка, задевает ли квадрат игрока в позиции (x, y) тайл стены.
+        
+        Аргументы:
+            x: Позиция X в пикселях
+            y: Позиция Y в пикселях
+            wall_tiles: Множество координат (x, y) тайлов стен
+            
+        Возвращает:
+            bool: True если квадрат пересекает хотя бы один тайл стены
+        """
+        left = int(x)
+        top = int(y)
+        size = self.overworld_size
+        
+        # Квадрат размером с тайл пересекает не больше 4 тайлов
+        tile_left = left // TILE_SIZE
+        tile_right = (left + size - 1) // TILE_SIZE
+        for tile_y in range(top // TILE_SIZE, (top + size - 1) // TILE_SIZE + 1):
+            for tile_x in range(tile_left, tile_right + 1):
+                if (tile_x, tile_y) in wall_tiles:
+                    return True
+        return False
     
     def get_overworld_rect(self) -> pygame.Rect:
         """
@@ -157,21 +208,13 @@ class Player:
         if not self.battle_box:
             return
         
-        dx, dy = 0, 0
-        
         # Проверка нажатых клавиш (WASD и стрелки)
-        if keys[pygame.K_w] or keys[pygame.K_UP]:
-            dy = -self.battle_speed
-        if keys[pygame.K_s] or keys[pygame.K_DOWN]:
-            dy = self.battle_speed
-        if keys[pygame.K_a] or keys[pygame.K_LEFT]:
-            dx = -self.battle_speed
-        if keys[pygame.K_d] or keys[pygame.K_RIGHT]:
-            dx = self.battle_speed
+        dx, dy = _read_direction(keys)
+        speed = self.battle_speed
         
         # Применение движения с ограничением внутри рамки
-        new_x = self.battle_x + dx
-        new_y = self.battle_y + dy
+        new_x = self.battle_x + dx * speed
+        new_y = self.battle_y + dy * speed
         
         # Ограничение по горизонтали
         if new_x >= self.battle_box.left and new_x + self.battle_size <= self.battle_box.right:
@@ -222,10 +265,11 @@ class Player:
         Аргументы:
             surface: Поверхность для отрисовки
         """
-        # Эффект мигания при неуязвимости
-        if self.invulnerability_timer > 0:
-            if pygame.time.get_ticks() % 200 < 100:
-                return  # Пропускаем отрисовку для эффекта мигания
+        # Эффект мигания при неуязвимости: по таймеру неуязвимости,
+        # 6 кадров скрыто / 6 кадров видно (100 мс / 100 мс при 60 FPS)
+        timer = self.invulnerability_timer
+        if timer > 0 and timer % 12 < 6:
+            return  # Пропускаем отрисовку для эффекта мигания
         
         # Рисуем сердце (круг, упрощённо)
         center_x = int(self.battle_x + self.battle_size // 2)
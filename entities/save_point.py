@@ -3,14 +3,125 @@
 Реализует объект SavePoint (сверкающая звезда) для сохранения прогресса.
 """
 
+import functools
+
 import pygame
 import math
+from random import randint, uniform
 from core.settings import (
     TILE_SIZE, SAVEPOINT_COLOR, SAVEPOINT_GLOW_COLOR,
     PLAYER_MAX_HP
 )
 
 
+# Фаза свечения растёт на 0.1 рад за кадр; 63 шага почти ровно равны
+# одному периоду (6.3 ≈ 2π), поэтому фаза хранится номером шага по модулю 63
+_GLOW_STEPS = 63
+
+
+@functools.lru_cache(maxsize=_GLOW_STEPS)
+def _glow_layers(step: int) -> tuple:
+    """
+    Получение слоёв свечения для шага фазы пульсации.
+    Слои рисуются один раз для каждого шага.
+    
+    Аргументы:
+        step: Номер шага фазы (0.._GLOW_STEPS - 1), фаза = step * 0.1 рад
+        
+    Возвращает:
+        tuple: (glow_size, (слой_1, слой_2, слой_3)) - половина стороны
+        и прозрачные поверхности со стороной 2 * glow_size
+    """
+    glow_phase = step * 0.1
+    glow_intensity = 0.5 + 0.5 * math.sin(glow_phase)
+    glow_size = int(20 + 5 * math.sin(glow_phase))
+    
+    glow_color = (
+        int(SAVEPOINT_GLOW_COLOR[0] * glow_intensity),
+        int(SAVEPOINT_GLOW_COLOR[1] * glow_intensity),
+        int(SAVEPOINT_GLOW_COLOR[2] * glow_intensity)
+    )
+    
+    layers = []
+    for i in range(3):
+        alpha = int(100 * glow_intensity * (1 - i * 0.3))
+        glow_surf = pygame.Surface((glow_size * 2, glow_size * 2), pygame.SRCALPHA)
+        pygame.draw.circle(
+            glow_surf,
+            (*glow_color, alpha),
+            (glow_size, glow_size),
+            glow_size - i * 5
+        )
+        layers.append(glow_surf.convert_alpha())
+    return glow_size, tuple(layers)
+
+
+# Число шагов поворота звезды за полный оборот (шаг ~0.025 рад при повороте 0.02 рад за кадр)
+_STAR_ROTATION_STEPS = 256
+
+
+@functools.lru_cache(maxsize=_STAR_ROTATION_STEPS)
+def _star_offsets(step: int) -> tuple:
+    """
+    Получение смещений вершин звезды от её центра для шага поворота.
+    
+    Аргументы:
+        step: Номер шага поворота (0.._STAR_ROTATION_STEPS - 1)
+        
+    Возвращает:
+        tuple: 10 пар (dx, dy) - чередование внешних и внутренних вершин
+    """
+    # Размер звезды
+    outer_radius = 12
+    inner_radius = 5
+    num_points = 5
+    
+    rotation = step * (2 * math.pi / _STAR_ROTATION_STEPS)
+    offsets = []
+    for i in range(num_points * 2):
+        angle = (i * math.pi / num_points) - math.pi / 2 + rotation
+        radius = outer_radius if i % 2 == 0 else inner_radius
+        offsets.append((radius * math.cos(angle), radius * math.sin(angle)))
+    return tuple(offsets)
+
+
+@functools.lru_cache(maxsize=128)
+def _particle_surface(size: int, life: int) -> pygame.Surface:
+    """
+    Получение поверхности частицы искры.
+    
+    Аргументы:
+        size: Радиус частицы
+        life: Оставшаяся жизнь частицы в кадрах (0..30), задаёт прозрачность
+        
+    Возвращает:
+        pygame.Surface: Прозрачная поверхность со стороной 2 * size
+    """
+    alpha = int(255 * (life / 30))
+    particle_surf = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+    pygame.draw.circle(particle_surf, (*SAVEPOINT_GLOW_COLOR[:3], alpha), (size, size), size)
+    return particle_surf.convert_alpha()
+
+
+@functools.lru_cache(maxsize=1)
+def _save_message_surface() -> pygame.Surface:
+    """
+    Получение готовой плашки "Progress Saved" (фон, рамка и текст).
+    Шрифт создаётся и текст рендерится один раз.
+    
+    Возвращает:
+        pygame.Surface: Поверхность плашки; текст - с отступом (10, 5)
+    """
+    font = pygame.font.Font(None, 28)
+    text = font.render("Progress Saved", True, SAVEPOINT_COLOR)
+    
+    surface = pygame.Surface((text.get_width() + 20, text.get_height() + 10)).convert()
+    surface.fill((20, 20, 20))
+    pygame.draw.rect(surface, SAVEPOINT_COLOR, surface.get_rect(), 2)
+    surface.blit(text, (10, 5))
+    return surface
+
+
 class SavePoint:
     """
     Класс точки сохранения.
@@ -34,7 +145,7 @@ class SavePoint:
         
         # Анимация
         self.animation_timer = 0
-        self.glow_phase = 0
+        self.glow_step = 0
         self.sparkle_particles = []
         
         # Состояние
@@ -46,7 +157,7 @@ class SavePoint:
     def update(self) -> None:
         """Обновление анимации."""
         self.animation_timer += 1
-        self.glow_phase = (self.glow_phase + 0.1) % (2 * math.pi)
+        self.glow_step = (self.glow_step + 1) % _GLOW_STEPS
         
         # Обновление кулдауна взаимодействия
         if self.interaction_cooldown > 0:
@@ -67,26 +178,30 @@ class SavePoint:
     
     def _spawn_particle(self) -> None:
         """Создание новой частицы искры."""
-        import random
         particle = {
-            'x': self.x + self.size // 2 + random.randint(-10, 10),
-            'y': self.y + self.size // 2 + random.randint(-10, 10),
-            'vx': random.uniform(-0.5, 0.5),
-            'vy': random.uniform(-1, -0.3),
+            'x': self.x + self.size // 2 + randint(-10, 10),
+            'y': self.y + self.size // 2 + randint(-10, 10),
+            'vx': uniform(-0.5, 0.5),
+            'vy': uniform(-1, -0.3),
             'life': 30,
-            'size': random.randint(2, 4)
+            'size': randint(2, 4)
         }
         self.sparkle_particles.append(particle)
     
     def _update_particles(self) -> None:
         """Обновление частиц искр."""
-        for particle in self.sparkle_particles[:]:
+        particles = self.sparkle_particles
+        if not particles:
+            return
+        
+        for particle in particles:
             particle['x'] += particle['vx']
             particle['y'] += particle['vy']
             particle['life'] -= 1
-            
-            if particle['life'] <= 0:
-                self.sparkle_particles.remove(particle)
+        
+        # Погасшие частицы убираем одним проходом (без копии списка и remove)
+        if particles[0]['life'] <= 0:
+            self.sparkle_particles = [p for p in particles if p['life'] > 0]
     
     def check_collision(self, player_rect: pygame.Rect) -> bool:
         """
@@ -137,31 +252,12 @@ class SavePoint:
         center_x = self.x + self.size // 2
         center_y = self.y + self.size // 2
         
-        # Эффект свечения (пульсация)
-        glow_intensity = 0.5 + 0.5 * math.sin(self.glow_phase)
-        glow_size = int(20 + 5 * math.sin(self.glow_phase))
-        
-        # Внешнее свечение
-        glow_color = (
-            int(SAVEPOINT_GLOW_COLOR[0] * glow_intensity),
-            int(SAVEPOINT_GLOW_COLOR[1] * glow_intensity),
-            int(SAVEPOINT_GLOW_COLOR[2] * glow_intensity)
-        )
+        # Эффект свечения (пульсация): слои берутся из кэша по шагу фазы
+        glow_size, layers = _glow_layers(self.glow_step)
         
         # Рисуем несколько слоёв свечения
-        for i in range(3):
-            alpha = int(100 * glow_intensity * (1 - i * 0.3))
-            glow_surf = pygame.Surface((glow_size * 2, glow_size * 2), pygame.SRCALPHA)
-            pygame.draw.circle(
-                glow_surf, 
-                (*glow_color, alpha), 
-                (glow_size, glow_size), 
-                glow_size - i * 5
-            )
-            surface.blit(
-                glow_surf, 
-                (center_x - glow_size, center_y - glow_size)
-            )
+        glow_pos = (center_x - glow_size, center_y - glow_size)
+        surface.blits([(layer, glow_pos) for layer in layers], doreturn=False)
         
         # Рисуем звезду
         self._draw_star(surface, center_x, center_y)
@@ -182,76 +278,38 @@ class SavePoint:
             cx: Центр X
             cy: Центр Y
         """
-        # Размер звезды
-        outer_radius = 12
-        inner_radius = 5
-        num_points = 5
-        
-        # Вычисляем точки звезды
-        points = []
-        for i in range(num_points * 2):
-            angle = (i * math.pi / num_points) - math.pi / 2
-            if i % 2 == 0:
-                radius = outer_radius
-            else:
-                radius = inner_radius
-            
-            # Добавляем небольшое вращение
-            angle += self.animation_timer * 0.02
-            
-            x = cx + radius * math.cos(angle)
-            y = cy + radius * math.sin(angle)
-            points.append((x, y))
+        # Небольшое вращение (0.02 рад за кадр): вершины берутся из кэша по шагу поворота
+        step = int(self.animation_timer * 0.02 * (_STAR_ROTATION_STEPS / (2 * math.pi))) % _STAR_ROTATION_STEPS
+        points = [(cx + dx, cy + dy) for dx, dy in _star_offsets(step)]
         
         # Рисуем звезду
-        if len(points) >= 3:
-            pygame.draw.polygon(surface, SAVEPOINT_COLOR, points)
-            pygame.draw.polygon(surface, SAVEPOINT_GLOW_COLOR, points, 2)
+        pygame.draw.polygon(surface, SAVEPOINT_COLOR, points)
+        pygame.draw.polygon(surface, SAVEPOINT_GLOW_COLOR, points, 2)
     
     def _draw_particles(self, surface: pygame.Surface) -> None:
         """Отрисовка частиц искр."""
-        for particle in self.sparkle_particles:
-            alpha = int(255 * (particle['life'] / 30))
-            color = (*SAVEPOINT_GLOW_COLOR[:3], alpha)
-            
-            # Создаём поверхность с прозрачностью
-            particle_surf = pygame.Surface(
-                (particle['size'] * 2, particle['size'] * 2), 
-                pygame.SRCALPHA
-            )
-            pygame.draw.circle(
-                particle_surf, 
-                color, 
-                (particle['size'], particle['size']), 
-                particle['size']
-            )
-            surface.blit(
-                particle_surf, 
+        # Поверхности частиц кэшируются по размеру и оставшейся жизни
+        surface.blits([
+            (
+                _particle_surface(particle['size'], particle['life']),
                 (particle['x'] - particle['size'], particle['y'] - particle['size'])
             )
+            for particle in self.sparkle_particles
+        ], doreturn=False)
     
     def _draw_save_message(self, surface: pygame.Surface) -> None:
         """Отрисовка сообщения о сохранении."""
-        font = pygame.font.Font(None, 28)
-        
-        # Текст сообщения
-        text = font.render("Progress Saved", True, SAVEPOINT_COLOR)
-        
-        # Позиция над точкой сохранения
-        text_x = self.x + (self.size - text.get_width()) // 2
-        text_y = self.y - 30
+        # Мигание текста
+        if self.save_message_timer % 10 >= 7:
+            return
         
-        # Фон для текста
-        bg_rect = pygame.Rect(
-            text_x - 10, text_y - 5,
-            text.get_width() + 20, text.get_height() + 10
-        )
+        # Плашка с фоном, рамкой и текстом (готовая поверхность из кэша)
+        message = _save_message_surface()
         
-        # Мигание текста
-        if self.save_message_timer % 10 < 7:
-            pygame.draw.rect(surface, (20, 20, 20), bg_rect)
-            pygame.draw.rect(surface, SAVEPOINT_COLOR, bg_rect, 2)
-            surface.blit(text, (text_x, text_y))
+        # Позиция над точкой сохранения (текст внутри плашки смещён на (10, 5))
+        bg_x = self.x + (self.size - message.get_width()) // 2
+        bg_y = self.y - 35
+        surface.blit(message, (bg_x, bg_y))
     
     def get_rect(self) -> pygame.Rect:
         """Получение прямоугольника коллизии."""
@@ -19,6 +19,7 @@ from core.settings import (
     FULLSCREEN, FULLSCREEN_SCALE, WINDOW_WIDTH, WINDOW_HEIGHT
 )
 from core.engine import GameManager
+from core.audio import AudioManager
 
 
 class DisplayManager:
@@ -30,6 +31,14 @@ class DisplayManager:
         self.base_height = SCREEN_HEIGHT
         self.screen = None
         self.game_surface = None
+        
+        # Масштабирование в полноэкранном режиме (рассчитывается при создании окна):
+        # размер и позиция изображения, буфер для него и полосы по краям
+        self.scaled_size = None
+        self.scaled_offset = (0, 0)
+        self.scaled_surface = None
+        self.letterbox_rects = ()
+        
         self._create_display()
     
     def _create_display(self):
@@ -48,17 +57,53 @@ class DisplayManager:
             
             # Создаём поверхность для рендеринга игры
             if FULLSCREEN_SCALE:
-                self.game_surface = pygame.Surface((self.base_width, self.base_height))
+                self.game_surface = pygame.Surface((self.base_width, self.base_height)).convert()
+                self._prepare_scaling()
             else:
-                self.game_surface = pygame.Surface((self.display_width, self.display_height))
+                self.game_surface = pygame.Surface((self.display_width, self.display_height)).convert()
         else:
             self.display_width = WINDOW_WIDTH
             self.display_height = WINDOW_HEIGHT
             self.screen = pygame.display.set_mode((self.display_width, self.display_height))
-            self.game_surface = pygame.Surface((self.base_width, self.base_height))
+            self.game_surface = pygame.Surface((self.base_width, self.base_height)).convert()
         
         pygame.display.set_caption("Undertale-style Game - Modular Edition")
     
+    def _prepare_scaling(self):
+        """Расчёт масштабирования с сохранением пропорций (один раз на создание окна)."""
+        scale = min(
+            self.display_width / self.base_width,
+            self.display_height / self.base_height
+        )
+        scaled_width = int(self.base_width * scale)
+        scaled_height = int(self.base_height * scale)
+        
+        # Центрирование
+        offset_x = (self.display_width - scaled_width) // 2
+        offset_y = (self.display_height - scaled_height) // 2
+        
+        self.scaled_size = (scaled_width, scaled_height)
+        self.scaled_offset = (offset_x, offset_y)
+        
+        # Буфер, в который масштабируется каждый кадр (без новой поверхности)
+        self.scaled_surface = pygame.Surface(self.scaled_size).convert()
+        
+        # Чёрные полосы по краям: слева/справа или сверху/снизу
+        if offset_x:
+            self.letterbox_rects = (
+                pygame.Rect(0, 0, offset_x, self.display_height),
+                pygame.Rect(offset_x + scaled_width, 0,
+                            self.display_width - offset_x - scaled_width, self.display_height),
+            )
+        elif offset_y:
+            self.letterbox_rects = (
+                pygame.Rect(0, 0, self.display_width, offset_y),
+                pygame.Rect(0, offset_y + scaled_height,
+                            self.display_width, self.display_height - offset_y - scaled_height),
+            )
+        else:
+            self.letterbox_rects = ()
+    
     def toggle_fullscreen(self):
         """Переключение между полноэкранным и оконным режимом."""
         self.is_fullscreen = not self.is_fullscreen
@@ -71,27 +116,13 @@ class DisplayManager:
     def present(self):
         """Отображение игрового экрана на мониторе."""
         if self.is_fullscreen and FULLSCREEN_SCALE:
-            # Масштабирование с сохранением пропорций
-            scale = min(
-                self.display_width / self.base_width,
-                self.display_height / self.base_height
-            )
-            scaled_width = int(self.base_width * scale)
-            scaled_height = int(self.base_height * scale)
-            
-            # Центрирование
-            offset_x = (self.display_width - scaled_width) // 2
-            offset_y = (self.display_height - scaled_height) // 2
-            
-            # Масштабирование
-            scaled_surface = pygame.transform.scale(
-                self.game_surface,
-                (scaled_width, scaled_height)
-            )
+            # Масштабирование в готовый буфер (размеры рассчитаны в _prepare_scaling)
+            pygame.transform.scale(self.game_surface, self.scaled_size, self.scaled_surface)
             
-            # Заполнение фона
-            self.screen.fill((0, 0, 0))
-            self.screen.blit(scaled_surface, (offset_x, offset_y))
+            # Заполнение фона (только полосы по краям изображения)
+            for rect in self.letterbox_rects:
+                self.screen.fill((0, 0, 0), rect)
+            self.screen.blit(self.scaled_surface, self.scaled_offset)
         else:
             # Прямое копирование
             self.screen.blit(self.game_surface, (0, 0))
@@ -104,15 +135,19 @@ def main():
     Точка входа в игру.
     Инициализирует Pygame, создаёт окно и запускает игровой цикл.
     """
+    # Инициализация аудио миксера до pygame.init(): иначе pygame.init()
+    # запускает миксер с настройками по умолчанию и буфер не применяется.
+    # 44100 Гц, 16 бит, стерео, буфер AUDIO_BUFFER_SIZE сэмплов
+    AudioManager.init_mixer()
+    
     # Инициализация Pygame
     pygame.init()
     
-    # Инициализация аудио миксера (должна быть до создания AudioManager)
-    # frequency=44100 - частота дискретизации
-    # size=-16 - 16-битный звук (отрицательное значение = signed)
-    # channels=2 - стерео
-    # buffer=512 - размер буфера (меньше = меньше задержка)
-    pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=512)
+    # Мышь в игре не используется: её события отбрасываются ещё в SDL,
+    # не попадая в очередь (и не вызывая лишней перерисовки статичных экранов)
+    pygame.event.set_blocked([
+        pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEWHEEL
+    ])
     
     # Создание менеджера дисплея
     display = DisplayManager()
@@ -144,12 +179,12 @@ def main():
         # Обновление игры
         game_manager.update(keys)
         
-        # Отрисовка на игровой поверхности
-        game_surface = display.get_render_surface()
-        game_manager.draw(game_surface)
-        
-        # Отображение на экране
-        display.present()
+        # Отрисовка на игровой поверхности и отображение на экране
+        # (статичные экраны без событий не перерисовываются)
+        if game_manager.needs_redraw():
+            game_surface = display.get_render_surface()
+            game_manager.draw(game_surface)
+            display.present()
         
         # Контроль FPS
         clock.tick(FPS)
@@ -157,6 +192,9 @@ def main():
     # Остановка музыки перед выходом
     game_manager.audio_manager.stop_music(fadeout=False)
     
+    # Дожидаемся записи последнего сохранения (поток записи фоновый)
+    game_manager.save_manager.flush()
+    
     # Завершение работы Pygame
     pygame.quit()
     sys.exit()
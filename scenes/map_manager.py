@@ -10,6 +10,8 @@
 - 'S' — точка сохранения (SavePoint)
 """
 
+import functools
+
 import pygame
 from core.settings import (
     TILE_SIZE, SCREEN_WIDTH, SCREEN_HEIGHT,
@@ -175,6 +177,122 @@ MAP_TRANSITIONS = {
 }
 
 
+# Цвет тайла по символу карты (неизвестные символы - пол)
+_TILE_COLORS = {
+    TILE_EMPTY: TILE_EMPTY_COLOR,
+    TILE_WALL: TILE_WALL_COLOR,
+    TILE_TRANSITION: TILE_TRANSITION_COLOR,
+    TILE_ENEMY: TILE_ENEMY_COLOR,
+    TILE_SAVEPOINT: TILE_EMPTY_COLOR,  # Фон под точкой сохранения прозрачный
+}
+
+
+def _rect_tiles(rect: pygame.Rect) -> list:
+    """
+    Получение тайлов, которые пересекает прямоугольник.
+    
+    Аргументы:
+        rect: Прямоугольник в пикселях
+        
+    Возвращает:
+        list: Координаты (x, y) тайлов построчно, сверху вниз и слева направо
+    """
+    tile_left = rect.left // TILE_SIZE
+    tile_right = (rect.right - 1) // TILE_SIZE
+    return [
+        (tile_x, tile_y)
+        for tile_y in range(rect.top // TILE_SIZE, (rect.bottom - 1) // TILE_SIZE + 1)
+        for tile_x in range(tile_left, tile_right + 1)
+    ]
+
+
+def _transition_direction(x: int, y: int, map_width: int, map_height: int) -> str:
+    """
+    Определение направления перехода по позиции тайла.
+    
+    Аргументы:
+        x: Позиция X тайла перехода
+        y: Позиция Y тайла перехода
+        map_width: Ширина карты в тайлах
+        map_height: Высота карты в тайлах
+        
+    Возвращает:
+        str: Направление ('up', 'down', 'left', 'right')
+    """
+    # Переход в верхней части карты (y <= 1)
+    if y <= 1:
+        return 'up'
+    # Переход в нижней части карты
+    elif y >= map_height - 2:
+        return 'down'
+    # Переход в левой части карты
+    elif x <= 1:
+        return 'left'
+    # Переход в правой части карты
+    elif x >= map_width - 2:
+        return 'right'
+    return 'down'
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_map(map_name: str) -> dict:
+    """
+    Разбор неизменной части карты (один раз для каждой карты).
+    Стены и переходы только читаются, поэтому их списки общие для всех загрузок;
+    враги и точки сохранения имеют состояние и создаются заново по позициям.
+    
+    Аргументы:
+        map_name: Имя карты из MAPS
+        
+    Возвращает:
+        dict: walls, wall_tiles, transitions, transition_rects, transition_targets,
+        enemy_specs (x, y, is_boss) и save_point_positions (x, y) в тайлах
+    """
+    walls = []
+    wall_tiles = set()
+    transitions = []
+    transition_rects = []
+    transition_targets = []
+    
+    rows = MAPS[map_name]
+    map_width = len(rows[0])
+    map_height = len(rows)
+    enemy_specs = []
+    save_point_positions = []
+    
+    for y, row in enumerate(rows):
+        for x, tile in enumerate(row):
+            if tile == TILE_WALL:
+                walls.append(pygame.Rect(x * TILE_SIZE, y * TILE_SIZE, TILE_SIZE, TILE_SIZE))
+                # Сетка стен: проверка коллизии игрока - поиск в множестве
+                wall_tiles.add((x, y))
+            elif tile == TILE_TRANSITION:
+                rect = pygame.Rect(x * TILE_SIZE, y * TILE_SIZE, TILE_SIZE, TILE_SIZE)
+                transitions.append((rect, x, y))
+                # Отдельный список прямоугольников для collidelistall
+                transition_rects.append(rect)
+                # Куда ведёт переход (направление по краю карты); None - никуда
+                direction = _transition_direction(x, y, map_width, map_height)
+                transition_targets.append(MAP_TRANSITIONS.get((map_name, direction)))
+            elif tile == TILE_ENEMY:
+                # Определяем, является ли враг боссом
+                # Босс на карте forest (позиция 19, 7)
+                is_boss = (map_name == 'forest' and x == 19 and y == 7)
+                enemy_specs.append((x, y, is_boss))
+            elif tile == TILE_SAVEPOINT:
+                save_point_positions.append((x, y))
+    
+    return {
+        'walls': walls,
+        'wall_tiles': frozenset(wall_tiles),
+        'transitions': tuple(transitions),
+        'transition_rects': transition_rects,
+        'transition_targets': tuple(transition_targets),
+        'enemy_specs': tuple(enemy_specs),
+        'save_point_positions': tuple(save_point_positions),
+    }
+
+
 class MapManager:
     """
     Менеджер карт.
@@ -190,46 +308,57 @@ class MapManager:
         
         # Списки объектов карты
         self.walls = []
+        self.wall_tiles = set()
         self.transitions = []
+        self.transition_rects = []
+        self.transition_targets = ()
         self.enemies = []
         self.save_points = []
         
+        # Враги и точки сохранения по координатам тайла (x, y):
+        # проверка столкновения смотрит только тайлы под игроком
+        self.enemy_grid = {}
+        self.save_point_grid = {}
+        
+        # Готовое изображение тайлов текущей карты (создаётся при первой отрисовке)
+        # и изображения уже показанных карт по имени (тайлы карт не меняются)
+        self.background = None
+        self.backgrounds = {}
+        
         # Парсинг карты
         self._parse_map()
         
     def _parse_map(self) -> None:
         """Парсинг текущей карты и создание объектов."""
-        self.walls = []
-        self.transitions = []
-        self.enemies = []
-        self.save_points = []
+        # Неизменная часть карты разбирается один раз и берётся из кэша
+        compiled = _compile_map(self.current_map_name)
+        self.walls = compiled['walls']
+        self.wall_tiles = compiled['wall_tiles']
+        self.transitions = compiled['transitions']
+        self.transition_rects = compiled['transition_rects']
+        self.transition_targets = compiled['transition_targets']
         
-        for y, row in enumerate(self.current_map):
-            for x, tile in enumerate(row):
-                rect = pygame.Rect(
-                    x * TILE_SIZE, y * TILE_SIZE,
-                    TILE_SIZE, TILE_SIZE
-                )
-                
-                if tile == TILE_WALL:
-                    self.walls.append(rect)
-                elif tile == TILE_TRANSITION:
-                    self.transitions.append((rect, x, y))
-                elif tile == TILE_ENEMY:
-                    # Определяем, является ли враг боссом
-                    # Босс на карте forest (позиция 19, 7)
-                    is_boss = (self.current_map_name == 'forest' and x == 19 and y == 7)
-                    
-                    if is_boss:
-                        enemy = Enemy(x, y, name="БОСС", is_boss=True)
-                    else:
-                        enemy = Enemy(x, y)
-                    
-                    self.enemies.append(enemy)
-                elif tile == TILE_SAVEPOINT:
-                    # Создаём точку сохранения
-                    save_point = SavePoint(x * TILE_SIZE, y * TILE_SIZE)
-                    self.save_points.append(save_point)
+        # Изображение прежней карты больше не подходит; карта, которая уже
+        # отрисовывалась, берёт готовое изображение
+        self.background = self.backgrounds.get(self.current_map_name)
+        
+        # Враги (босс - с особым именем)
+        self.enemies = [
+            Enemy(x, y, name="БОСС", is_boss=True) if is_boss else Enemy(x, y)
+            for x, y, is_boss in compiled['enemy_specs']
+        ]
+        
+        # Точки сохранения
+        self.save_points = [
+            SavePoint(x * TILE_SIZE, y * TILE_SIZE)
+            for x, y in compiled['save_point_positions']
+        ]
+        
+        self.enemy_grid = {(enemy.x, enemy.y): enemy for enemy in self.enemies}
+        self.save_point_grid = {
+            (x, y): save_point
+            for (x, y), save_point in zip(compiled['save_point_positions'], self.save_points)
+        }
     
     def load_map(self, map_name: str, player_x: int = None, player_y: int = None) -> tuple:
         """
@@ -268,42 +397,16 @@ class MapManager:
         Возвращает:
             tuple: (новая_карта, новый_x, новый_y) или None
         """
-        for rect, x, y in self.transitions:
-            if player_rect.colliderect(rect):
-                # Определяем направление перехода
-                direction = self._get_transition_direction(x, y)
-                key = (self.current_map_name, direction)
-                
-                if key in MAP_TRANSITIONS:
-                    return MAP_TRANSITIONS[key]
+        # Задетые тайлы перехода находятся одним вызовом (в порядке списка);
+        # цель каждого тайла определена при разборе карты
+        transition_targets = self.transition_targets
+        for index in player_rect.collidelistall(self.transition_rects):
+            target = transition_targets[index]
+            if target is not None:
+                return target
         
         return None
     
-    def _get_transition_direction(self, x: int, y: int) -> str:
-        """
-        Определение направления перехода по позиции тайла.
-        
-        Аргументы:
-            x: Позиция X тайла перехода
-            y: Позиция Y тайла перехода
-            
-        Возвращает:
-            str: Направление ('up', 'down', 'left', 'right')
-        """
-        # Переход в верхней части карты (y <= 1)
-        if y <= 1:
-            return 'up'
-        # Переход в нижней части карты
-        elif y >= self.map_height - 2:
-            return 'down'
-        # Переход в левой части карты
-        elif x <= 1:
-            return 'left'
-        # Переход в правой части карты
-        elif x >= self.map_width - 2:
-            return 'right'
-        return 'down'
-    
     def check_enemy_collision(self, player_rect: pygame.Rect) -> Enemy:
         """
         Проверка столкновения с врагом.
@@ -314,8 +417,11 @@ class MapManager:
         Возвращает:
             Enemy: Объект врага при столкновении или None
         """
-        for enemy in self.enemies:
-            if player_rect.colliderect(enemy.get_rect()):
+        # Враг занимает ровно свой тайл: достаточно проверить тайлы под игроком
+        enemy_grid = self.enemy_grid
+        for tile in _rect_tiles(player_rect):
+            enemy = enemy_grid.get(tile)
+            if enemy is not None:
                 return enemy
         return None
     
@@ -328,6 +434,7 @@ class MapManager:
         """
         if enemy in self.enemies:
             self.enemies.remove(enemy)
+            self.enemy_grid.pop((enemy.x, enemy.y), None)
     
     def get_walls(self) -> list:
         """Получение списка стен."""
@@ -352,8 +459,11 @@ class MapManager:
         Возвращает:
             SavePoint: Объект точки сохранения при столкновении или None
         """
-        for save_point in self.save_points:
-            if save_point.check_collision(player_rect):
+        # Точка сохранения занимает ровно свой тайл
+        save_point_grid = self.save_point_grid
+        for tile in _rect_tiles(player_rect):
+            save_point = save_point_grid.get(tile)
+            if save_point is not None and save_point.is_active:
                 return save_point
         return None
     
@@ -370,41 +480,56 @@ class MapManager:
     def draw(self, surface: pygame.Surface) -> None:
         """
         Отрисовка карты.
+        Тайлы не меняются до загрузки другой карты, поэтому рисуются
+        один раз на отдельную поверхность, которая затем копируется целиком.
         
         Аргументы:
             surface: Поверхность для отрисовки
         """
+        if self.background is None:
+            self.background = self._render_background()
+            self.backgrounds[self.current_map_name] = self.background
+        surface.blit(self.background, (0, 0))
+    
+    def _render_background(self) -> pygame.Surface:
+        """
+        Отрисовка всех тайлов текущей карты на новую поверхность.
+        
+        Возвращает:
+            pygame.Surface: Изображение карты в формате экрана
+        """
+        surface = pygame.Surface(
+            (self.map_width * TILE_SIZE, self.map_height * TILE_SIZE)
+        ).convert()
+        
+        # Пол - общий фон, поэтому закрашиваются только остальные тайлы
+        surface.fill(TILE_EMPTY_COLOR)
+        
         for y, row in enumerate(self.current_map):
             for x, tile in enumerate(row):
+                # Выбор цвета в зависимости от типа тайла
+                color = _TILE_COLORS.get(tile, TILE_EMPTY_COLOR)
+                if color == TILE_EMPTY_COLOR:
+                    continue
+                
                 rect = pygame.Rect(
                     x * TILE_SIZE, y * TILE_SIZE,
                     TILE_SIZE, TILE_SIZE
                 )
-                
-                # Выбор цвета в зависимости от типа тайла
-                if tile == TILE_EMPTY:
-                    color = TILE_EMPTY_COLOR
-                elif tile == TILE_WALL:
-                    color = TILE_WALL_COLOR
-                elif tile == TILE_TRANSITION:
-                    color = TILE_TRANSITION_COLOR
-                elif tile == TILE_ENEMY:
-                    # Проверяем, является ли враг боссом
-                    is_boss = (self.current_map_name == 'forest' and x == 19 and y == 7)
-                    color = (255, 100, 0) if is_boss else TILE_ENEMY_COLOR  # Оранжевый для босса
-                elif tile == TILE_SAVEPOINT:
-                    color = TILE_EMPTY_COLOR  # Фон под точкой сохранения прозрачный
-                else:
-                    color = TILE_EMPTY_COLOR
-                
-                pygame.draw.rect(surface, color, rect)
+                surface.fill(color, rect)
                 
                 # Рисуем границу для стен
                 if tile == TILE_WALL:
                     pygame.draw.rect(surface, (150, 150, 150), rect, 1)
-
-                # Рисуем рамку для босса
-                if tile == TILE_ENEMY:
-                    is_boss = (self.current_map_name == 'forest' and x == 19 and y == 7)
-                    if is_boss:
-                        pygame.draw.rect(surface, (255, 255, 0), rect, 2)  # Жёлтая рамка для босса
+        
+        # Босс (оранжевый тайл с жёлтой рамкой)
+        for enemy_x, enemy_y, is_boss in _compile_map(self.current_map_name)['enemy_specs']:
+            if is_boss:
+                rect = pygame.Rect(
+                    enemy_x * TILE_SIZE, enemy_y * TILE_SIZE,
+                    TILE_SIZE, TILE_SIZE
+                )
+                surface.fill((255, 100, 0), rect)
+                pygame.draw.rect(surface, (255, 255, 0), rect, 2)  # Жёлтая рамка для босса
+        
+        return surface